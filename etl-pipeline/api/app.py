@@ -1,6 +1,6 @@
 from elasticsearch.exceptions import RequestError
 from flasgger import Swagger
-from flask import Flask
+from flask import Flask, g
 from flask_cors import CORS
 import json
 import os
@@ -24,6 +24,8 @@ from .blueprints import (
     citation,
     fulfill,
 )
+from .jsonProvider import createJSONProvider
+from .pools import getServerThreads, getServerWorkers
 from .utils import APIUtils
 
 logger = create_log(__name__)
@@ -32,6 +34,7 @@ logger = create_log(__name__)
 class FlaskAPI:
     def __init__(self, dbEngine, redisClient):
         self.app = Flask(__name__)
+        self.app.json = createJSONProvider(self.app)
         CORS(self.app)
         Swagger(self.app, template=json.load(open("swagger.v4.json", "r")))
 
@@ -55,13 +58,38 @@ class FlaskAPI:
         self.app.register_blueprint(citation)
         self.app.register_blueprint(fulfill)
 
+        self.app.teardown_appcontext(self.closeRequestSessions)
+
     def run(self):
         if os.environ.get("STAGE") == "development":
             self.app.config["ENV"] = "development"
             self.app.config["DEBUG"] = True
             self.app.run(host=os.environ.get("API_HOST"), port=5050)
+        elif os.environ.get("API_SERVER") == "gunicorn":
+            from .server import GunicornServer
+
+            GunicornServer(
+                self.app,
+                {
+                    "bind": "0.0.0.0:80",
+                    "worker_class": "gthread",
+                    "workers": getServerWorkers(),
+                    "threads": getServerThreads(),
+                    "post_fork": self.resetConnectionPools,
+                },
+            ).run()
         else:
-            serve(self.app, host="0.0.0.0", port=80)
+            serve(self.app, host="0.0.0.0", port=80, threads=getServerThreads())
+
+    def resetConnectionPools(self, server, worker):
+        # Connections opened before the fork belong to the arbiter, so each worker
+        # starts its own pool without closing the sockets the parent still holds
+        self.app.config["DB_CLIENT"].dispose(close=False)
+
+    @staticmethod
+    def closeRequestSessions(error=None):
+        for session in g.pop("dbSessions", []):
+            session.close()
 
     def createErrorResponses(self):
         @self.app.errorhandler(404)
@@ -1,13 +1,34 @@
+from datetime import datetime
+import os
+from uuid import UUID
+
 from logger import create_log
+from managers.redis import AUTOMATIC_COLLECTION_KEY
+from .pageCache import PageCache
 
 logger = create_log(__name__)
 
+# Types of the (sort value, work id) keys that preferred edition pages seek past
+PREFERRED_EDITION_KEY_TYPES = {
+    "title": (str, int),
+    "date": (datetime.fromisoformat, int),
+    "uuid": (UUID, int),
+}
+
 
 def fetchAutomaticCollectionEditions(
-    dbClient, esClient, collectionId, page: int, perPage: int
+    dbClient,
+    esClient,
+    collectionId,
+    page: int,
+    perPage: int,
+    pageCache=None,
+    redisClient=None,
 ):
     """Given a collection id for an automatic collection, perform the given
-    search and return a list of collection editions
+    search and return a list of collection editions. Pages are read from the
+    entries stored by AutomaticCollectionRefreshProcess while they are fresh,
+    and the search is only run when they are missing or too short.
     """
     automaticCollection = dbClient.fetchAutomaticCollection(collectionId)
     if not automaticCollection:
@@ -19,18 +40,28 @@ def fetchAutomaticCollectionEditions(
 
     nextPageSize = _nextPageSize(automaticCollection.limit, page, perPage)
 
+    storedPage = _fetchStoredWorks(
+        redisClient, collectionId, page, perPage, nextPageSize
+    )
+
+    if storedPage is not None:
+        (totalCount, editionIds) = storedPage
+        editions = dbClient.fetchEditions(editionIds) if editionIds else []
+
     # Skip ES and go straight to the DB if there's no actual search to be done
-    if not _requiresSearch(automaticCollection):
-        (totalCount, editions) = dbClient.fetchAllPreferredEditions(
-            sortField=automaticCollection.sort_field,
-            sortDirection=automaticCollection.sort_direction,
-            page=page,
-            perPage=nextPageSize,
+    elif not _requiresSearch(automaticCollection):
+        (totalCount, editions) = _fetchPreferredEditions(
+            dbClient,
+            pageCache or PageCache(None, "automaticCollections"),
+            automaticCollection,
+            page,
+            perPage,
+            nextPageSize,
         )
 
     else:
         (totalCount, editionIds) = _doAutoCollectionSearch(
-            esClient, automaticCollection, page, nextPageSize
+            esClient, automaticCollection, page - 1, nextPageSize
         )
         editions = dbClient.fetchEditions(editionIds)
 
@@ -42,14 +73,110 @@ def fetchAutomaticCollectionEditions(
     return (limit, editions)
 
 
+def _fetchPreferredEditions(
+    dbClient, pageCache, automaticCollection, page, perPage, nextPageSize
+):
+    queryKey = pageCache.generateKey(
+        automaticCollection.collection_id,
+        automaticCollection.sort_field,
+        automaticCollection.sort_direction,
+        perPage,
+    )
+    cachedCount = pageCache.getTotal(queryKey)
+
+    (totalCount, editions, lastSortKey) = dbClient.fetchAllPreferredEditions(
+        sortField=automaticCollection.sort_field,
+        sortDirection=automaticCollection.sort_direction,
+        page=page,
+        perPage=nextPageSize,
+        after=pageCache.getCursor(
+            queryKey,
+            page,
+            PREFERRED_EDITION_KEY_TYPES.get(automaticCollection.sort_field, ()),
+        ),
+        countTotal=cachedCount is None,
+    )
+
+    if cachedCount is None:
+        pageCache.setTotal(queryKey, totalCount)
+    else:
+        totalCount = cachedCount
+
+    pageCache.setCursor(queryKey, page + 1, lastSortKey)
+
+    return (totalCount, editions)
+
+
+def materializeAutomaticCollection(dbClient, esClient, automaticCollection, maxWorks):
+    """Compute the ordered works of an automatic collection, up to its limit or
+    `maxWorks`, for AutomaticCollectionRefreshProcess to store. Returns the total
+    and the edition ids of each work.
+    """
+    size = min(automaticCollection.limit or maxWorks, maxWorks)
+
+    if not _requiresSearch(automaticCollection):
+        (totalCount, editionIds) = dbClient.fetchPreferredEditionIDs(
+            automaticCollection.sort_field, automaticCollection.sort_direction, size
+        )
+        return (totalCount, [[editionId] for editionId in editionIds])
+
+    searchResult = esClient.searchQuery(
+        _buildSearchParams(automaticCollection), page=0, perPage=size
+    )
+    workEditions = [
+        [e.edition_id for e in res.meta.inner_hits.editions.hits]
+        for res in searchResult.hits
+    ]
+
+    return (searchResult.hits.total.value, workEditions)
+
+
+def _fetchStoredWorks(redisClient, collectionId, page, perPage, nextPageSize):
+    """Read a page of the works stored for an automatic collection. Returns None when
+    nothing was stored within the staleness bound, or the stored works stop short of
+    the page, so that the caller runs the live query instead.
+    """
+    if redisClient is None:
+        return None
+
+    key = AUTOMATIC_COLLECTION_KEY.format(
+        environment=os.environ.get("ENVIRONMENT", "test"), collection_id=collectionId
+    )
+    start = (page - 1) * perPage
+    stop = start + nextPageSize - 1
+
+    try:
+        pipe = redisClient.pipeline()
+        pipe.get(f"{key}/total")
+        pipe.llen(f"{key}/works")
+        pipe.lrange(f"{key}/works", start, stop)
+        (totalCount, storedCount, works) = pipe.execute()
+    except Exception:
+        logger.warning(f"Unable to load stored works for collection {collectionId}")
+        return None
+
+    if totalCount is None:
+        return None
+
+    totalCount = int(totalCount)
+
+    if nextPageSize > 0 and storedCount < totalCount and stop >= storedCount:
+        return None
+
+    editionIds = [
+        int(editionId)
+        for work in works
+        for editionId in work.decode("utf-8").split(",")
+        if editionId
+    ]
+
+    return (totalCount, editionIds)
+
+
 def _doAutoCollectionSearch(esClient, automaticCollection, page, perPage):
-    searchParams = {
-        "query": _buildQueryTerms(automaticCollection),
-        "sort": [(automaticCollection.sort_field, automaticCollection.sort_direction)],
-        "filter": [],
-        "show_all": True,
-    }
-    searchResult = esClient.searchQuery(searchParams, page=page, perPage=perPage)
+    searchResult = esClient.searchQuery(
+        _buildSearchParams(automaticCollection), page=page, perPage=perPage
+    )
     editionIds = []
     for res in searchResult.hits:
         editionIds.extend(e.edition_id for e in res.meta.inner_hits.editions.hits)
@@ -58,6 +185,15 @@ def _doAutoCollectionSearch(esClient, automaticCollection, page, perPage):
     return (totalCount, editionIds)
 
 
+def _buildSearchParams(automaticCollection):
+    return {
+        "query": _buildQueryTerms(automaticCollection),
+        "sort": [(automaticCollection.sort_field, automaticCollection.sort_direction)],
+        "filter": [],
+        "show_all": True,
+    }
+
+
 def _buildQueryTerms(automaticCollection) -> list[tuple[str, str]]:
     return [
         (field, query)
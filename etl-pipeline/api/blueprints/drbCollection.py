@@ -9,6 +9,8 @@ from ..automaticCollectionUtils import fetchAutomaticCollectionEditions
 from ..db import DBClient
 from ..elastic import ElasticClient
 from ..opdsUtils import OPDSUtils
+from ..pageCache import PageCache
+from ..responseCache import ResponseCache
 from ..utils import APIUtils
 from ..validation_utils import is_valid_uuid
 from ..opds2 import Feed, Publication
@@ -109,6 +111,7 @@ def collectionCreate(user=None):
         )
 
     dbClient.session.commit()
+    _invalidateCachedMemberships()
 
     logger.info("Created collection {}".format(newCollection))
 
@@ -117,6 +120,12 @@ def collectionCreate(user=None):
     return APIUtils.formatOPDS2Object(201, opdsFeed)
 
 
+def _invalidateCachedMemberships():
+    ResponseCache(
+        current_app.config.get("REDIS_CLIENT"), "collection"
+    ).invalidateCollections()
+
+
 def _validateCollectionCreate(data: dict) -> str:
     """Return an error message if the collection create data is invalid"""
 
@@ -198,6 +207,7 @@ def collectionReplace(uuid, user=None):
         addWorksToCollection(dbClient, collection, workUUIDs)
 
     dbClient.session.commit()
+    _invalidateCachedMemberships()
 
     logger.info("Replaced collection {}".format(collection.uuid))
 
@@ -281,6 +291,7 @@ def collectionUpdate(uuid, user=None):
         addWorksToCollection(dbClient, collection, workUUIDsList)
 
     dbClient.session.commit()
+    _invalidateCachedMemberships()
 
     opdsFeed = constructOPDSFeed(collection, dbClient)
 
@@ -350,6 +361,7 @@ def collectionDelete(uuid, user=None):
         return APIUtils.formatResponseObject(404, "deleteCollection", errMsg)
 
     dbClient.session.commit()
+    _invalidateCachedMemberships()
 
     logger.info("Successfully Deleted Collection")
 
@@ -398,6 +410,7 @@ def collectionDeleteWorkEdition(uuid, user=None):
     removeWorkEditionsFromCollection(dbClient, editionIDsList, workUUIDsList)
 
     dbClient.session.commit()
+    _invalidateCachedMemberships()
 
     opdsFeed = constructOPDSFeed(collection, dbClient)
 
@@ -424,7 +437,37 @@ def get_collections():
         db_client = DBClient(current_app.config["DB_CLIENT"])
         db_client.createSession()
 
-        collections = db_client.fetchCollections(sort=sort, page=page, perPage=per_page)
+        # Collection edits bump the collections version, which resets these cursors
+        # along with the cached collection responses
+        page_cache = PageCache(current_app.config.get("REDIS_CLIENT"), "collections")
+        query_key = page_cache.generateKey(
+            page_cache.fetchCollectionsVersion(), sort, per_page
+        )
+
+        collections = db_client.fetchCollections(
+            sort=sort,
+            page=page,
+            perPage=per_page,
+            after=page_cache.getCursor(query_key, page, (str, int)),
+        )
+
+        total_collections = page_cache.getTotal(query_key)
+
+        if total_collections is None:
+            total_collections = db_client.fetchCollectionCount()
+            page_cache.setTotal(query_key, total_collections)
+
+        if collections:
+            sort_field = sort.split(":")[0]
+            page_cache.setCursor(
+                query_key,
+                page + 1,
+                (getattr(collections[-1], sort_field) or "", collections[-1].id),
+            )
+
+        item_counts = _fetchItemCounts(
+            db_client, [collection.id for collection in collections]
+        )
 
         opds_feed = Feed()
 
@@ -434,7 +477,7 @@ def get_collections():
         )
 
         OPDSUtils.addPagingOptions(
-            opds_feed, request.full_path, len(collections), page=page, perPage=per_page
+            opds_feed, request.full_path, total_collections, page=page, perPage=per_page
         )
 
         for collection in collections:
@@ -442,7 +485,12 @@ def get_collections():
             path = "/collection/{}".format(uuid)
 
             group = constructOPDSFeed(
-                collection, db_client, perPage=5, path=path, build_publications=False
+                collection,
+                db_client,
+                perPage=5,
+                path=path,
+                build_publications=False,
+                number_of_items=item_counts.get(collection.id),
             )
 
             opds_feed.addGroup(group)
@@ -484,6 +532,7 @@ def constructOPDSFeed(
     perPage=10,
     path=None,
     build_publications: bool = True,
+    number_of_items=None,
 ):
     uuid = collection.uuid
 
@@ -507,7 +556,9 @@ def constructOPDSFeed(
 
     if build_publications:
         if collection.type == "static":
-            _addStaticPubsToFeed(opdsFeed, collection, path, page, perPage, sort)
+            _addStaticPubsToFeed(
+                opdsFeed, dbClient, collection, path, page, perPage, sort
+            )
         elif collection.type == "automatic":
             esClient = ElasticClient(current_app.config["REDIS_CLIENT"])
             _addAutomaticPubsToFeed(
@@ -518,16 +569,21 @@ def constructOPDSFeed(
                 f"Encountered collection with unhandleable type {collection.type}"
             )
     else:
-        opdsFeed.metadata.addField("numberOfItems", len(collection.editions))
+        if number_of_items is None:
+            number_of_items = _fetchItemCounts(dbClient, [collection.id])[collection.id]
+
+        opdsFeed.metadata.addField("numberOfItems", number_of_items)
 
     return opdsFeed
 
 
-def _addStaticPubsToFeed(opdsFeed, collection, path, page, perPage, sort):
-    start = (page - 1) * perPage
-    end = start + perPage
+def _addStaticPubsToFeed(opdsFeed, dbClient, collection, path, page, perPage, sort):
+    editions = dbClient.fetchCollectionEditions(
+        collection.id, page=page, perPage=perPage
+    )
+    totalCount = _fetchItemCounts(dbClient, [collection.id])[collection.id]
 
-    opdsPubs = _buildPublications(collection.editions[start:end])
+    opdsPubs = _buildPublications(editions)
 
     if sort:
         sorter, reversed_ = constructSortMethod(sort)
@@ -535,9 +591,28 @@ def _addStaticPubsToFeed(opdsFeed, collection, path, page, perPage, sort):
 
     opdsFeed.addPublications(opdsPubs)
 
-    OPDSUtils.addPagingOptions(
-        opdsFeed, path, len(collection.editions), page=page, perPage=perPage
-    )
+    OPDSUtils.addPagingOptions(opdsFeed, path, totalCount, page=page, perPage=perPage)
+
+
+def _fetchItemCounts(dbClient, collectionIDs):
+    """Return the number of editions in each static collection, reading from the
+    cached counts first. The counts are keyed by the collections version, so any
+    collection edit resets them.
+    """
+    pageCache = PageCache(current_app.config.get("REDIS_CLIENT"), "collections")
+    countsKey = pageCache.generateKey(pageCache.fetchCollectionsVersion())
+
+    itemCounts = pageCache.getCounts(countsKey, collectionIDs)
+    uncountedIDs = [
+        collectionID for collectionID in collectionIDs if collectionID not in itemCounts
+    ]
+
+    if uncountedIDs:
+        fetchedCounts = dbClient.fetchCollectionItemCounts(uncountedIDs)
+        pageCache.setCounts(countsKey, fetchedCounts)
+        itemCounts.update(fetchedCounts)
+
+    return itemCounts
 
 
 def _addAutomaticPubsToFeed(
@@ -549,6 +624,10 @@ def _addAutomaticPubsToFeed(
         collectionId,
         page=page,
         perPage=perPage,
+        pageCache=PageCache(
+            current_app.config.get("REDIS_CLIENT"), "automaticCollections"
+        ),
+        redisClient=current_app.config.get("REDIS_CLIENT"),
     )
     opdsPubs = _buildPublications(editions)
     opdsFeed.addPublications(opdsPubs)
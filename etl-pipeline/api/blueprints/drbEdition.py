@@ -1,5 +1,6 @@
 from flask import Blueprint, request, current_app
 from ..db import DBClient
+from ..responseCache import ResponseCache
 from ..utils import APIUtils
 from ..validation_utils import is_valid_numeric_id
 from logger import create_log
@@ -37,6 +38,15 @@ def get_edition(edition_id):
             )
             filtered_formats = APIUtils.formatFilters(terms)
 
+            response_cache = ResponseCache(
+                current_app.config.get("REDIS_CLIENT"), "edition"
+            )
+            cache_key = response_cache.generateKey(edition_id, request, reader_version)
+            cached_edition = response_cache.get(cache_key)
+
+            if cached_edition is not None:
+                return APIUtils.formatResponseObject(200, response_type, cached_edition)
+
             edition = db_client.fetchSingleEdition(edition_id)
 
             if not edition:
@@ -46,21 +56,25 @@ def get_edition(edition_id):
                     {"message": f"No edition found with id {edition_id}"},
                 )
 
+            work_version = response_cache.fetchVersion(edition.work.uuid)
+
             records = db_client.fetchRecordsByUUID(edition.dcdw_uuids)
 
-            return APIUtils.formatResponseObject(
-                200,
-                response_type,
-                APIUtils.formatEditionOutput(
-                    edition,
-                    request=request,
-                    records=records,
-                    dbClient=db_client,
-                    showAll=show_all,
-                    formats=filtered_formats,
-                    reader=reader_version,
-                ),
+            formatted_edition = APIUtils.formatEditionOutput(
+                edition,
+                request=request,
+                records=records,
+                dbClient=db_client,
+                showAll=show_all,
+                formats=filtered_formats,
+                reader=reader_version,
             )
+
+            response_cache.set(
+                cache_key, edition.work.uuid, work_version, formatted_edition
+            )
+
+            return APIUtils.formatResponseObject(200, response_type, formatted_edition)
     except Exception:
         logger.exception(f"Unable to get edition with id {edition_id}")
         return APIUtils.formatResponseObject(
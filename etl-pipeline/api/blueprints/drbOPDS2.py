@@ -1,8 +1,11 @@
+from datetime import datetime
 from flask import Blueprint, current_app, request
 from ..db import DBClient
 from ..elastic import ElasticClient
 
 from ..opdsUtils import OPDSUtils
+from ..pageCache import PageCache
+from ..responseCache import ResponseCache
 from ..utils import APIUtils
 from ..opds2 import Feed, Link, Metadata, Navigation, Publication, Facet, Group
 from logger import create_log
@@ -37,7 +40,26 @@ def newPublications():
         request.full_path, "New Publications: Digital Research Books", grouped=True
     )
 
-    pubCount, newPubs = dbClient.fetchNewWorks(page=page, size=pageSize)
+    pageCache = PageCache(current_app.config.get("REDIS_CLIENT"), "newWorks")
+    queryKey = pageCache.generateKey(pageSize)
+    cachedCount = pageCache.getTotal(queryKey)
+
+    pubCount, newPubs = dbClient.fetchNewWorks(
+        page=page,
+        size=pageSize,
+        after=pageCache.getCursor(queryKey, page + 1, (datetime.fromisoformat, int)),
+        countTotal=cachedCount is None,
+    )
+
+    if cachedCount is None:
+        pageCache.setTotal(queryKey, pubCount)
+    else:
+        pubCount = cachedCount
+
+    if newPubs:
+        pageCache.setCursor(
+            queryKey, page + 2, (newPubs[-1].date_created, newPubs[-1].id)
+        )
 
     OPDSUtils.addPagingOptions(
         baseFeed, request.full_path, pubCount, page=page + 1, perPage=pageSize
@@ -113,12 +135,23 @@ def opdsSearch():
 def fetchPublication(uuid):
     logger.info("Returning OPDS2 publication for {}".format(uuid))
 
+    responseCache = ResponseCache(current_app.config.get("REDIS_CLIENT"), "opds")
+    cacheKey = responseCache.generateKey(uuid, request, None)
+    cachedPublication = responseCache.get(cacheKey)
+
+    if cachedPublication is not None:
+        return APIUtils.formatOPDS2Object(200, cachedPublication)
+
+    workVersion = responseCache.fetchVersion(uuid)
+
     dbClient = DBClient(current_app.config["DB_CLIENT"])
     dbClient.createSession()
 
     workRecord = dbClient.fetchSingleWork(uuid)
 
     if workRecord is None:
+        dbClient.closeSession()
+
         return APIUtils.formatResponseObject(
             404,
             "opdsPublication",
@@ -138,6 +171,8 @@ def fetchPublication(uuid):
 
     dbClient.closeSession()
 
+    responseCache.set(cacheKey, uuid, workVersion, dict(publication))
+
     return APIUtils.formatOPDS2Object(200, publication)
 
 
@@ -190,7 +225,6 @@ def constructBaseFeed(path, title, grouped=False):
 
 
 def addPublications(feed, publications, grouped=False, highlights={}):
-    print(publications)
     opdsPubs = [
         createPublicationObject(
             pub, _meta={"highlights": highlights.get(str(pub.uuid), {})}
@@ -78,12 +78,19 @@ def query():
             if isinstance(search_result.hits.total, int)
             else search_result.hits.total.value
         )
+        # Totals are a lower bound when hit tracking is capped by SEARCH_TOTAL_HITS_LIMIT
+        total_hits_bounded = (
+            getattr(search_result.hits.total, "relation", "eq") == "gte"
+        )
 
         facets = APIUtils.formatAggregationResult(search_result.aggregations.to_dict())
         paging = APIUtils.formatPagingOptions(search_page + 1, search_size, total_hits)
 
         data_block = {
             "totalWorks": total_hits,
+            "totalWorksLabel": f"{total_hits:,}+"
+            if total_hits_bounded
+            else str(total_hits),
             "works": APIUtils.formatWorkOutput(
                 works,
                 results,
@@ -1,5 +1,6 @@
 from flask import Blueprint, request, current_app
 from ..db import DBClient
+from ..responseCache import ResponseCache
 from ..utils import APIUtils
 from ..validation_utils import is_valid_uuid
 from logger import create_log
@@ -37,6 +38,18 @@ def get_work(uuid):
             )
             filtered_formats = APIUtils.formatFilters(terms)
 
+            response_cache = ResponseCache(
+                current_app.config.get("REDIS_CLIENT"), "work"
+            )
+            cache_key = response_cache.generateKey(uuid, request, reader_version)
+            cached_work = response_cache.get(cache_key)
+
+            if cached_work is not None:
+                return APIUtils.formatResponseObject(200, response_type, cached_work)
+
+            # Read the version before the work so a concurrent rewrite invalidates it
+            work_version = response_cache.fetchVersion(uuid)
+
             work = db_client.fetchSingleWork(uuid)
 
             if not work:
@@ -44,19 +57,19 @@ def get_work(uuid):
                     404, response_type, {"message": f"No work found with id {uuid}"}
                 )
 
-            return APIUtils.formatResponseObject(
-                200,
-                response_type,
-                APIUtils.formatWorkOutput(
-                    work,
-                    None,
-                    showAll=show_all,
-                    request=request,
-                    dbClient=db_client,
-                    formats=filtered_formats,
-                    reader=reader_version,
-                ),
+            formatted_work = APIUtils.formatWorkOutput(
+                work,
+                None,
+                showAll=show_all,
+                request=request,
+                dbClient=db_client,
+                formats=filtered_formats,
+                reader=reader_version,
             )
+
+            response_cache.set(cache_key, uuid, work_version, formatted_work)
+
+            return APIUtils.formatResponseObject(200, response_type, formatted_work)
     except Exception:
         logger.exception(f"Unable to get work with id {uuid}")
         return APIUtils.formatResponseObject(
@@ -1,7 +1,8 @@
 from datetime import datetime, timedelta, date, timezone
+from flask import g, has_app_context
 from sqlalchemy import Integer
-from sqlalchemy.orm import joinedload, sessionmaker
-from sqlalchemy.sql import column, func, select, text, values
+from sqlalchemy.orm import joinedload, selectinload, sessionmaker
+from sqlalchemy.sql import column, func, or_, select, text, tuple_, values
 from uuid import uuid4
 
 from model import (
@@ -13,7 +14,9 @@ from model import (
     Collection,
     User,
     AutomaticCollection,
+    PREFERRED_EDITIONS,
 )
+from model.postgres.collection import COLLECTION_EDITIONS
 from .utils import APIUtils
 
 
@@ -24,6 +27,11 @@ class DBClient:
     def createSession(self):
         self.session = sessionmaker(bind=self.engine)()
 
+        # Sessions opened while handling a request are closed on app context
+        # teardown, even when the view returns early or raises
+        if has_app_context():
+            g.setdefault("dbSessions", []).append(self.session)
+
     def closeSession(self):
         self.session.close()
 
@@ -38,16 +46,24 @@ class DBClient:
         uuids = [i[0] for i in ids]
         editionIds = list(set(APIUtils.flatten([i[1] for i in ids])))
 
+        # Each relationship is loaded with one IN query per level rather than
+        # joining the full edition/item/link graph into a single result set
+        searchedEditions = selectinload(Work.editions)
+        linkedItems = searchedEditions.selectinload(
+            Edition.items.and_(Item.links.any())
+        )
+
         return (
             self.session.query(Work)
-            .join(Edition)
             .options(
-                joinedload(Work.editions, Edition.links),
-                joinedload(Work.editions, Edition.items),
-                joinedload(Work.editions, Edition.items, Item.links, innerjoin=True),
-                joinedload(Work.editions, Edition.items, Item.rights),
+                searchedEditions.selectinload(Edition.links),
+                linkedItems.selectinload(Item.links),
+                linkedItems.selectinload(Item.rights),
+            )
+            .filter(
+                Work.uuid.in_(uuids),
+                Work.id.in_(select(Edition.work_id).where(Edition.id.in_(editionIds))),
             )
-            .filter(Work.uuid.in_(uuids), Edition.id.in_(editionIds))
             .all()
         )
 
@@ -83,62 +99,60 @@ class DBClient:
         sortDirection: str,
         page: int,
         perPage: int,
+        after=None,
+        countTotal=True,
     ):
-        """Fetch up to `limit` editions, sorting by the given sort fields and
-        respecting the given page fields (using basic limit / offset paging
+        """Fetch up to `perPage` preferred editions (the oldest edition of each work
+        created in the last 100 days) from the preferred_editions view, sorted by the given work field with the
+        work id as a tie breaker. When `after` holds the sort key of the last row on
+        the previous page the query seeks past it, otherwise it falls back to
+        limit / offset paging. Returns the total (None when `countTotal` is False),
+        the editions and the sort key of the last edition returned.
 
         Note, we only accept sorting by title, date or uuid for now. We may want
         to consider opening that up.
         """
 
-        # For perf reasons, filter to the last 100 days.  We might be able to tune the
-        # query to improve this...
-        startDate = datetime.now(timezone.utc).replace(tzinfo=None).date() - timedelta(
-            days=100
-        )
-        # Sort all the `Work`s and rank their editions by oldest
-        workQuery = (
-            self.session.query(
-                Work,
-                Edition.id.label("edition_id"),
-                func.rank()
-                .over(
-                    order_by=(Edition.date_created.asc(), Edition.id.asc()),
-                    partition_by=Work.id,
-                )
-                .label("rnk"),
-            )
-            .join(Edition)
-            .where((Edition.date_created > startDate) & (Work.date_created > startDate))
-        ).subquery()
+        sortColumn, recentFilter = self._preferredEditionsSort(sortField)
 
-        offset = (page - 1) * perPage
+        sortKey = tuple_(sortColumn, PREFERRED_EDITIONS.c.work_id)
+        editionsQuery = (
+            self.session.query(Edition, sortColumn, PREFERRED_EDITIONS.c.work_id)
+            .join(PREFERRED_EDITIONS, Edition.id == PREFERRED_EDITIONS.c.edition_id)
+            .filter(recentFilter)
+        )
 
-        sortClause = {
-            "title": workQuery.c.title,
-            "date": workQuery.c.date_created,
-            "uuid": workQuery.c.uuid,
-        }.get(sortField)
+        if sortDirection == "DESC":
+            editionsQuery = editionsQuery.order_by(
+                sortColumn.desc(), PREFERRED_EDITIONS.c.work_id.desc()
+            )
+            seekFilter = sortKey < tuple_(*after) if after else None
+        else:
+            editionsQuery = editionsQuery.order_by(
+                sortColumn, PREFERRED_EDITIONS.c.work_id
+            )
+            seekFilter = sortKey > tuple_(*after) if after else None
 
-        if sortClause is None:
-            raise ValueError(f"Invalid sort param {sortField}")
+        if seekFilter is not None:
+            editionsQuery = editionsQuery.filter(seekFilter)
+        else:
+            editionsQuery = editionsQuery.offset((page - 1) * perPage)
 
-        if sortDirection == "DESC":
-            sortClause = sortClause.desc()
+        rows = editionsQuery.limit(perPage).all()
 
-        editionsQuery = (
-            self.session.query(Edition)
-            # Get the editions from the sorted works
-            .join(workQuery, Edition.id == workQuery.c.edition_id)
-            # And filter to only the oldest edition per work to get
-            # the 'preferred' edition
-            .where(workQuery.c.rnk == 1)
-            .order_by(sortClause)
+        totalCount = (
+            self.session.query(func.count())
+            .select_from(PREFERRED_EDITIONS)
+            .filter(recentFilter)
+            .scalar()
+            if countTotal
+            else None
         )
 
         return (
-            editionsQuery.count(),
-            editionsQuery.offset(offset).limit(perPage).all(),
+            totalCount,
+            [row[0] for row in rows],
+            tuple(rows[-1][1:]) if rows else None,
         )
 
     def fetchEditions(self, editionIDs):
@@ -172,6 +186,58 @@ class DBClient:
             .all()
         )
 
+    def fetchEditionCollections(self, editionIDs):
+        """Fetch the collections containing each of the given editions in a single
+        grouped query, returning collection metadata with precomputed item counts
+        keyed by edition id
+        """
+        editionCollections = {}
+
+        if not editionIDs:
+            return editionCollections
+
+        memberCollectionIDs = select(COLLECTION_EDITIONS.c.collection_id).where(
+            COLLECTION_EDITIONS.c.edition_id.in_(editionIDs)
+        )
+
+        itemCounts = (
+            select(
+                COLLECTION_EDITIONS.c.collection_id,
+                func.count().label("number_of_items"),
+            )
+            .where(COLLECTION_EDITIONS.c.collection_id.in_(memberCollectionIDs))
+            .group_by(COLLECTION_EDITIONS.c.collection_id)
+            .subquery()
+        )
+
+        memberships = (
+            self.session.query(
+                COLLECTION_EDITIONS.c.edition_id,
+                Collection.uuid,
+                Collection.title,
+                Collection.creator,
+                Collection.description,
+                itemCounts.c.number_of_items,
+            )
+            .join(Collection, Collection.id == COLLECTION_EDITIONS.c.collection_id)
+            .join(itemCounts, itemCounts.c.collection_id == Collection.id)
+            .filter(COLLECTION_EDITIONS.c.edition_id.in_(editionIDs))
+            .order_by(COLLECTION_EDITIONS.c.edition_id, Collection.id)
+        )
+
+        for editionID, uuid, title, creator, description, numberOfItems in memberships:
+            editionCollections.setdefault(editionID, []).append(
+                {
+                    "uuid": uuid,
+                    "title": title,
+                    "creator": creator,
+                    "description": description,
+                    "numberOfItems": numberOfItems,
+                }
+            )
+
+        return editionCollections
+
     def fetchSingleLink(self, linkID):
         return self.session.query(Link).filter(Link.id == linkID).first()
 
@@ -188,54 +254,177 @@ class DBClient:
 
         return self.session.execute(countQuery)
 
-    def fetchNewWorks(self, page=0, size=50):
-        offset = page * size
+    def fetchPreferredEditionIDs(self, sortField: str, sortDirection: str, limit: int):
+        """Fetch the ids of the first `limit` preferred editions in the same order
+        that fetchAllPreferredEditions pages through them, along with the total.
+        """
+        sortColumn, recentFilter = self._preferredEditionsSort(sortField)
+
+        if sortDirection == "DESC":
+            ordering = (sortColumn.desc(), PREFERRED_EDITIONS.c.work_id.desc())
+        else:
+            ordering = (sortColumn, PREFERRED_EDITIONS.c.work_id)
+
+        editionIDs = (
+            self.session.query(PREFERRED_EDITIONS.c.edition_id)
+            .filter(recentFilter)
+            .order_by(*ordering)
+            .limit(limit)
+            .all()
+        )
 
+        totalCount = (
+            self.session.query(func.count())
+            .select_from(PREFERRED_EDITIONS)
+            .filter(recentFilter)
+            .scalar()
+        )
+
+        return (totalCount, [row[0] for row in editionIDs])
+
+    @staticmethod
+    def _preferredEditionsSort(sortField):
+        # For perf reasons, filter to the last 100 days.  We might be able to tune the
+        # query to improve this...
+        startDate = datetime.now(timezone.utc).replace(tzinfo=None).date() - timedelta(
+            days=100
+        )
+
+        sortColumn = {
+            "title": PREFERRED_EDITIONS.c.work_title,
+            "date": PREFERRED_EDITIONS.c.work_date_created,
+            "uuid": PREFERRED_EDITIONS.c.work_uuid,
+        }.get(sortField)
+
+        if sortColumn is None:
+            raise ValueError(f"Invalid sort param {sortField}")
+
+        # Editions are ranked inside the window: a work's preferred edition is its
+        # oldest edition created after startDate
+        recentFilter = (
+            (PREFERRED_EDITIONS.c.edition_date_created > startDate)
+            & (PREFERRED_EDITIONS.c.work_date_created > startDate)
+            & or_(
+                PREFERRED_EDITIONS.c.previous_edition_date_created.is_(None),
+                PREFERRED_EDITIONS.c.previous_edition_date_created <= startDate,
+            )
+        )
+
+        return (sortColumn, recentFilter)
+
+    def fetchNewWorks(self, page=0, size=50, after=None, countTotal=True):
+        """Fetch works created in the last day ordered by creation date and id. When
+        `after` holds the (date_created, id) of the last work on the previous page
+        the query seeks past it rather than using an offset.
+        """
         createdSince = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
             days=1
         )
 
         baseQuery = self.session.query(Work).filter(Work.date_created >= createdSince)
 
-        return (baseQuery.count(), baseQuery.offset(offset).limit(size).all())
+        pageQuery = baseQuery.order_by(Work.date_created, Work.id)
+
+        if after:
+            pageQuery = pageQuery.filter(
+                tuple_(Work.date_created, Work.id) > tuple_(*after)
+            )
+        else:
+            pageQuery = pageQuery.offset(page * size)
+
+        return (
+            baseQuery.count() if countTotal else None,
+            pageQuery.limit(size).all(),
+        )
 
     def fetchSingleCollection(self, uuid):
+        return self.session.query(Collection).filter(Collection.uuid == uuid).one()
+
+    def fetchCollectionEditions(self, collectionID, page=1, perPage=10):
+        """Fetch one page of a static collection's editions, ordered by edition id.
+        Only the editions on the requested page and their links, items and rights are
+        loaded, so the cost of a page does not grow with the size of the collection.
+        """
+        offset = (page - 1) * perPage
+
         return (
-            self.session.query(Collection)
+            self.session.query(Edition)
+            .join(
+                COLLECTION_EDITIONS,
+                COLLECTION_EDITIONS.c.edition_id == Edition.id,
+            )
             .options(
-                joinedload(Collection.editions),
-                joinedload(Collection.editions, Edition.links),
-                joinedload(Collection.editions, Edition.items),
-                joinedload(Collection.editions, Edition.items, Item.links),
-                joinedload(Collection.editions, Edition.items, Item.rights),
+                joinedload(Edition.links),
+                joinedload(Edition.items),
+                joinedload(Edition.items, Item.links),
+                joinedload(Edition.items, Item.rights),
             )
-            .filter(Collection.uuid == uuid)
-            .one()
+            .filter(COLLECTION_EDITIONS.c.collection_id == collectionID)
+            .order_by(Edition.id)
+            .offset(offset)
+            .limit(perPage)
+            .all()
         )
 
-    def fetchCollections(self, sort=None, page=1, perPage=10):
-        offset = (page - 1) * perPage
-
+    def fetchCollections(self, sort=None, page=1, perPage=10, after=None):
+        """Fetch a page of collections sorted by title or creator with the collection
+        id as a tie breaker. When `after` holds the (sort value, id) of the last
+        collection on the previous page the query seeks past it rather than using an
+        offset.
+        """
         if sort:
             # The `sort` param is either `title` or `creator`, optionally with a sort direction
             # of `asc` or `desc` appended with a colon.  However, we can't just pass a plain
             # string to sqlalchemy, as the `title` field is ambiguous across different entities.
             # So instead, turn the sort field into a proper sort-clause on the Collection table.
             sort_field, *suffix = sort.split(":")
-            sort_clause = getattr(Collection, sort_field)
-            if suffix and suffix[0] == "desc":
-                sort_clause = sort_clause.desc()
+            sort_column = func.coalesce(getattr(Collection, sort_field), "")
+            descending = bool(suffix) and suffix[0] == "desc"
         else:
-            sort_clause = Collection.title
+            sort_column = func.coalesce(Collection.title, "")
+            descending = False
 
-        return (
-            self.session.query(Collection)
-            .order_by(text(sort))
-            .offset(offset)
-            .limit(perPage)
-            .all()
+        sort_key = tuple_(sort_column, Collection.id)
+        collections_query = self.session.query(Collection)
+
+        if descending:
+            collections_query = collections_query.order_by(
+                sort_column.desc(), Collection.id.desc()
+            )
+        else:
+            collections_query = collections_query.order_by(sort_column, Collection.id)
+
+        if after:
+            collections_query = collections_query.filter(
+                sort_key < tuple_(*after) if descending else sort_key > tuple_(*after)
+            )
+        else:
+            collections_query = collections_query.offset((page - 1) * perPage)
+
+        return collections_query.limit(perPage).all()
+
+    def fetchCollectionCount(self):
+        return self.session.query(func.count(Collection.id)).scalar()
+
+    def fetchCollectionItemCounts(self, collectionIDs):
+        """Count the static members of each given collection in one grouped query"""
+        if not collectionIDs:
+            return {}
+
+        itemCounts = (
+            self.session.query(
+                COLLECTION_EDITIONS.c.collection_id,
+                func.count(COLLECTION_EDITIONS.c.edition_id),
+            )
+            .filter(COLLECTION_EDITIONS.c.collection_id.in_(collectionIDs))
+            .group_by(COLLECTION_EDITIONS.c.collection_id)
         )
 
+        counts = {collectionID: 0 for collectionID in collectionIDs}
+        counts.update(dict(itemCounts))
+
+        return counts
+
     def fetchAutomaticCollection(self, collection_id: int):
         return (
             self.session.query(AutomaticCollection)
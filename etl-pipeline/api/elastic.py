@@ -1,6 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from elasticsearch.exceptions import NotFoundError
 from elasticsearch_dsl import Search, Q, A
+from elasticsearch_dsl.connections import connections
+from elasticsearch_dsl.response import Response
 from hashlib import sha1
+import json
 import os
 import re
 
@@ -36,12 +41,24 @@ class ElasticClient:
         "writer of supplementary textual content",
     ]
 
+    SEARCH_CACHE_TIME = 60 * 5
+    PIT_KEEP_ALIVE = "5m"
+
+    facetExecutor = ThreadPoolExecutor(max_workers=8)
+
     def __init__(self, redisClient):
         self.environment = os.environ["ENVIRONMENT"]
         self.esIndex = os.environ["ELASTICSEARCH_INDEX"]
 
         self.redis = redisClient
 
+        # Caps exact hit counting, totals above the limit are reported as a lower bound
+        self.totalHitsLimit = int(os.environ.get("SEARCH_TOTAL_HITS_LIMIT", 0)) or None
+        # Fetches facets in a concurrent aggregation-only request instead of the hits request
+        self.separateFacets = (
+            os.environ.get("SEARCH_SEPARATE_FACETS", "false").lower() == "true"
+        )
+
         self.dateSort = None
         self.sortReversed = False
 
@@ -53,12 +70,16 @@ class ElasticClient:
         self.appliedAggregations = []
         self.searchedFields = []
 
+        self.cachedFacets = None
+
     def createSearch(self):
         s = Search(index=os.environ["ELASTICSEARCH_INDEX"])
-        searchES = s.params(track_total_hits=True)
+        searchES = s.params(track_total_hits=self.totalHitsLimit or True)
         return searchES
 
     def searchQuery(self, params, page=0, perPage=10):
+        self.cachedFacets = self.getFacetCache(params)
+
         self.generateSearchQuery(params)
 
         return self.executeSearchQuery(params, page, perPage)
@@ -120,18 +141,37 @@ class ElasticClient:
     def executeSearchQuery(self, params, page, perPage):
         startPos, endPos = ElasticClient.getFromSize(page, perPage)
 
-        queryHash = self.generateQueryHash(params, startPos)
+        # Cached pages and cursors are only valid for the page size they were made with
+        pageParams = {**params, "size": perPage}
+        queryHash = self.generateQueryHash(pageParams, startPos)
+
+        cachedResultStr = (
+            self.getSearchResultCache(queryHash) if startPos == 0 else None
+        )
+
+        if cachedResultStr:
+            logger.info("Found cached search results: {}".format(queryHash))
 
-        searchFromStr = self.getPageResultCache(queryHash) if startPos > 0 else None
+            return Response(self.query, json.loads(cachedResultStr))
+
+        facetFuture = (
+            self.facetExecutor.submit(self.executeFacetQuery, self.query)
+            if self.separateFacets and self.cachedFacets is None
+            else None
+        )
 
-        if searchFromStr:
-            logger.info("Found cached search page: {}".format(searchFromStr))
+        pageCursorStr = self.getPageResultCache(queryHash) if startPos > 0 else None
 
-            searchFrom = list(searchFromStr.decode().split("|"))
+        if pageCursorStr:
+            logger.info("Found cached search cursor: {}".format(pageCursorStr))
 
-            res = self.query.extra(search_after=searchFrom)[0:perPage].execute()
+            res = self.executeCursorQuery(json.loads(pageCursorStr), perPage)
         elif startPos > 5000:
-            totalCount = self.query.count()
+            totalCount = (
+                self.cachedFacets["total"]
+                if self.cachedFacets and self.cachedFacets.get("relation", "eq") == "eq"
+                else self.query.count()
+            )
             if totalCount - startPos < 10000:
                 logger.debug("Executing Reversed Search")
 
@@ -139,18 +179,125 @@ class ElasticClient:
             else:
                 logger.debug("Executing Deep Pagination Search")
                 res = self.executeDeepQuery(startPos, perPage)
+        elif startPos == 0:
+            res = self.executePointInTimeQuery(perPage)
         else:
             res = self.query[startPos:endPos].execute()
 
-        if not searchFromStr:
+        res = self.applyFacetCache(params, res, facetFuture=facetFuture)
+
+        # Reversed pages are sorted backwards so their last hit cannot seed a cursor
+        if not self.sortReversed:
             try:
                 lastSort = list(res.hits[-1].meta.sort)
-                self.setPageResultCache(queryHash, lastSort)
+                self.setPageResultCache(
+                    self.generateQueryHash(pageParams, endPos),
+                    {"pit": getattr(res, "pit_id", None), "searchAfter": lastSort},
+                )
             except IndexError:
                 logger.debug("Empty result set, skipping paging cache")
 
+        if startPos == 0:
+            self.setSearchResultCache(queryHash, res.to_dict())
+
         return res
 
+    def executePointInTimeQuery(self, perPage):
+        # The first page opens the point in time that its cursor carries to later
+        # pages. A page that is not full has no next page, so its point in time is
+        # closed instead of holding search contexts open until it expires
+        pitID = self.openPointInTime()
+
+        try:
+            res = (
+                self.query.index()
+                .extra(pit={"id": pitID, "keep_alive": self.PIT_KEEP_ALIVE})[0:perPage]
+                .execute()
+            )
+        except Exception:
+            self.closePointInTime(pitID)
+            raise
+
+        if len(res.hits) < perPage:
+            self.closePointInTime(getattr(res, "pit_id", None) or pitID)
+
+        return res
+
+    def executeCursorQuery(self, pageCursor, perPage):
+        searchAfter = pageCursor["searchAfter"]
+
+        # Point in time searches sort on an extra _shard_doc tiebreaker, so a cursor
+        # from a page searched without one cannot be used with one
+        if not pageCursor["pit"]:
+            return self.query.extra(search_after=searchAfter)[0:perPage].execute()
+
+        try:
+            return (
+                self.query.index()
+                .extra(
+                    pit={"id": pageCursor["pit"], "keep_alive": self.PIT_KEEP_ALIVE},
+                    search_after=searchAfter,
+                )[0:perPage]
+                .execute()
+            )
+        except NotFoundError:
+            logger.info("Search point in time expired, paging without it")
+
+            return self.query.extra(search_after=searchAfter[:-1])[0:perPage].execute()
+
+    def openPointInTime(self):
+        pointInTime = connections.get_connection().open_point_in_time(
+            index=self.esIndex, keep_alive=self.PIT_KEEP_ALIVE
+        )
+
+        return pointInTime["id"]
+
+    def closePointInTime(self, pitID):
+        try:
+            connections.get_connection().close_point_in_time(body={"id": pitID})
+        except NotFoundError:
+            logger.debug("Search point in time already closed")
+
+    def executeFacetQuery(self, query):
+        # The query is passed in rather than read from self.query, which the
+        # request thread may replace while this runs on the facet executor
+        facetQuery = query.extra(size=0)
+        self.applyAggregations(facetQuery)
+
+        return facetQuery.execute()
+
+    def applyFacetCache(self, params, res, facetFuture=None):
+        resDict = res.to_dict()
+
+        if self.cachedFacets is not None:
+            aggregations = self.cachedFacets["aggregations"]
+        elif facetFuture is not None:
+            aggregations = facetFuture.result().to_dict().get("aggregations", {})
+        else:
+            aggregations = resDict.get("aggregations")
+
+        if self.cachedFacets is None and aggregations:
+            totalHits = resDict["hits"]["total"]
+
+            if isinstance(totalHits, int):
+                totalHits = {"value": totalHits, "relation": "eq"}
+
+            self.setFacetCache(
+                params,
+                {
+                    "aggregations": aggregations,
+                    "total": totalHits["value"],
+                    "relation": totalHits.get("relation", "eq"),
+                },
+            )
+
+        if aggregations is resDict.get("aggregations"):
+            return res
+
+        resDict["aggregations"] = aggregations
+
+        return Response(self.query, resDict)
+
     def executeReversedQuery(self, params, totalCount, startPos, perPage):
         self.sortReversed = True
         self.query = self.query.sort()  # Clear existing sort
@@ -180,15 +327,48 @@ class ElasticClient:
 
             iteration += 1
 
-    def setPageResultCache(self, cacheKey, sort):
+    def setPageResultCache(self, cacheKey, pageCursor):
         self.redis.set(
-            "{}/queryPaging/{}".format(self.environment, cacheKey),
-            "|".join([str(s) for s in sort]),
+            "{}/queryCursor/{}".format(self.environment, cacheKey),
+            json.dumps(pageCursor),
             ex=60 * 60 * 24,
         )
 
     def getPageResultCache(self, cacheKey):
-        return self.redis.get("{}/queryPaging/{}".format(self.environment, cacheKey))
+        return self.redis.get("{}/queryCursor/{}".format(self.environment, cacheKey))
+
+    def setSearchResultCache(self, cacheKey, result):
+        self.redis.set(
+            "{}/queryResults/{}".format(self.environment, cacheKey),
+            json.dumps(result),
+            ex=self.SEARCH_CACHE_TIME,
+        )
+
+    def getSearchResultCache(self, cacheKey):
+        return self.redis.get("{}/queryResults/{}".format(self.environment, cacheKey))
+
+    def setFacetCache(self, params, facets):
+        self.redis.set(
+            "{}/queryFacets/{}".format(
+                self.environment, self.generateFacetHash(params)
+            ),
+            json.dumps(facets),
+            ex=self.SEARCH_CACHE_TIME,
+        )
+
+    def getFacetCache(self, params):
+        cachedFacets = self.redis.get(
+            "{}/queryFacets/{}".format(self.environment, self.generateFacetHash(params))
+        )
+
+        return json.loads(cachedFacets) if cachedFacets else None
+
+    @classmethod
+    def generateFacetHash(cls, params):
+        # Facets depend on the query and filters but not on sort order or position
+        return cls.generateQueryHash(
+            {key: value for key, value in params.items() if key != "sort"}, "facets"
+        )
 
     @classmethod
     def generateQueryHash(cls, params, startPos):
@@ -524,7 +704,9 @@ class ElasticClient:
 
     def addFiltersAndAggregations(self, innerHits):
         self.applyFilters(size=innerHits)
-        self.applyAggregations()
+
+        if self.cachedFacets is None and not self.separateFacets:
+            self.applyAggregations()
 
     @staticmethod
     def generateDateRange(dateFilters):
@@ -584,8 +766,10 @@ class ElasticClient:
         if self.govDocFilter != None:
             self.query = self.query.query(self.govDocFilter)
 
-    def applyAggregations(self):
-        rootAgg = self.query.aggs.bucket("editions", A("nested", path="editions"))
+    def applyAggregations(self, query=None):
+        query = self.query if query is None else query
+
+        rootAgg = query.aggs.bucket("editions", A("nested", path="editions"))
 
         lastAgg = rootAgg
         for i, agg in enumerate(self.appliedAggregations):
@@ -603,8 +787,8 @@ class ElasticClient:
         ).bucket("editions_per", "reverse_nested")
 
         if self.govDocAgg != None:
-            self.query.aggs.bucket("govDoc_filter", self.govDocAgg)
-        self.query.aggs.bucket(
+            query.aggs.bucket("govDoc_filter", self.govDocAgg)
+        query.aggs.bucket(
             "govDoc", "terms", **{"field": "is_government_document", "size": 2}
         )
 
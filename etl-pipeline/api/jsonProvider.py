@@ -0,0 +1,58 @@
+from flask.json.provider import DefaultJSONProvider
+
+from logger import create_log
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = create_log(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serializes API responses with orjson. Keys are sorted and dates are passed
+    through to Flask's default handler, so the output matches DefaultJSONProvider
+    apart from non-ASCII characters being written as UTF-8 rather than escaped.
+    Calls that pass json.dumps arguments, and pretty printed debug responses, use
+    the standard library encoder."""
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+
+        return self._encode(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+
+        return self._app.response_class(
+            self._encode(obj, orjson.OPT_APPEND_NEWLINE), mimetype=self.mimetype
+        )
+
+    def _encode(self, obj, option=0):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=option
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+def createJSONProvider(app):
+    if orjson is None:
+        logger.info("orjson is not installed, using the default JSON provider")
+        return DefaultJSONProvider(app)
+
+    return OrjsonProvider(app)
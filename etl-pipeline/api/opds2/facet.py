@@ -1,5 +1,6 @@
 from .metadata import Metadata
 from .link import Link
+from .serialization import serializeComponent
 
 
 class Facet:
@@ -24,18 +25,25 @@ class Facet:
     def __dir__(self):
         return ["metadata", "links"]
 
-    def __iter__(self):
-        for attr in dir(self):
+    def toDict(self):
+        facetDict = {}
+
+        for attr in ["metadata", "links"]:
             component = getattr(self, attr)
 
             if component is None:
                 continue
             if isinstance(component, list):
-                yield attr, [dict(c) for c in component]
+                facetDict[attr] = [serializeComponent(c) for c in component]
             elif isinstance(component, Metadata):
-                yield attr, dict(component)
+                facetDict[attr] = component.toDict()
             else:
-                yield attr, component
+                facetDict[attr] = component
+
+        return facetDict
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
     def __repr__(self):
         return "<Facet(title={}, links={})>".format(
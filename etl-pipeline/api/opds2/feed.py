@@ -3,9 +3,20 @@ from .metadata import Metadata
 from .navigation import Navigation
 from .publication import Publication
 from .link import Link
+from .serialization import serializeComponent
 
 
 class Feed:
+    COMPONENTS = [
+        "metadata",
+        "navigation",
+        "links",
+        "publications",
+        "groups",
+        "images",
+        "facets",
+    ]
+
     COMPONENT_MAPPING = {
         "metadata": Metadata,
         "navigation": Navigation,
@@ -87,32 +98,28 @@ class Feed:
         return component
 
     def __dir__(self):
-        return [
-            "metadata",
-            "navigation",
-            "links",
-            "publications",
-            "groups",
-            "images",
-            "facets",
-        ]
+        return self.COMPONENTS
 
-    def __iter__(self):
-        if (
-            len(list(filter(lambda x: x.rel == "self" or "self" in x.rel, self.links)))
-            == 0
-        ):
+    def toDict(self):
+        if not any(link.rel == "self" or "self" in link.rel for link in self.links):
             raise OPDS2FeedException('Link with rel of "self" must be present')
 
-        for componentName in dir(self):
+        feedDict = {}
+
+        for componentName in self.COMPONENTS:
             component = getattr(self, componentName)
 
             if component is None or component == []:
                 continue
             if isinstance(component, list):
-                yield componentName, [dict(c) for c in component]
+                feedDict[componentName] = [serializeComponent(c) for c in component]
             else:
-                yield componentName, dict(component)
+                feedDict[componentName] = serializeComponent(component)
+
+        return feedDict
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
 
 class OPDS2FeedException(Exception):
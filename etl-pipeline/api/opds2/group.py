@@ -1,6 +1,7 @@
 from .metadata import Metadata
 from .navigation import Navigation
 from .publication import Publication
+from .serialization import serializeComponent
 
 
 class Group:
@@ -38,20 +39,27 @@ class Group:
             self.metadata.title, len(self.publications), len(self.navigation)
         )
 
-    def __iter__(self):
+    def toDict(self):
         if len(self.publications) > 0 and len(self.navigation) > 0:
             raise OPDS2GroupException(
                 "Group cannot contain publication and navigation arrays"
             )
 
+        groupDict = {}
+
         for attr in ["metadata", "publications", "navigation"]:
             value = getattr(self, attr)
 
             if isinstance(value, list):
                 if len(value) > 0:
-                    yield attr, [dict(item) for item in value]
+                    groupDict[attr] = [serializeComponent(item) for item in value]
             else:
-                yield attr, dict(value)
+                groupDict[attr] = serializeComponent(value)
+
+        return groupDict
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
 
 class OPDS2GroupException(Exception):
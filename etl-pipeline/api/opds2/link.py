@@ -16,6 +16,8 @@ class Link:
         "bitrate",
     ]
 
+    ALLOWED_FIELD_SET = frozenset(ALLOWED_FIELDS)
+
     REQUIRED_FIELDS = ["href"]
 
     def __init__(self, **kwargs):
@@ -36,24 +38,27 @@ class Link:
             for field, value in fields:
                 self.addField(field, value)
 
-    def __iter__(self):
+    def toDict(self):
         for reqField in self.REQUIRED_FIELDS:
             if getattr(self, reqField, None) is None:
                 raise OPDS2LinkException("{} must be present in Link".format(reqField))
 
-        if len(self.attrs - set(self.ALLOWED_FIELDS)) > 1:
-            unpermittedAttrs = self.attrs - set(self.ALLOWED_FIELDS)
+        unpermittedAttrs = self.attrs - self.ALLOWED_FIELD_SET
+        if len(unpermittedAttrs) > 1:
             raise OPDS2LinkException(
                 "{} fields are not permitted in Links".format(
                     ",".join(list(unpermittedAttrs))
                 )
             )
 
-        for field in self.ALLOWED_FIELDS:
-            try:
-                yield field, getattr(self, field)
-            except AttributeError:
-                pass
+        fields = vars(self)
+
+        return {
+            field: fields[field] for field in self.ALLOWED_FIELDS if field in fields
+        }
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
     def __repr__(self):
         return "<Link(href={}, rel={})>".format(self.href, self.rel)
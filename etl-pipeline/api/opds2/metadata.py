@@ -17,12 +17,14 @@ class Metadata:
             for field, value in fields:
                 self.addField(field, value)
 
-    def __iter__(self):
+    def toDict(self):
         if "title" not in self.attrs:
             raise OPDS2MetadataException("title field must be present in metadata")
 
-        for attr in self.attrs:
-            yield attr, getattr(self, attr)
+        return {attr: getattr(self, attr) for attr in self.attrs}
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
     def __repr__(self):
         return "<Metadata(title={})>".format(getattr(self, "title", "NOT SET"))
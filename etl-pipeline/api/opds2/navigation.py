@@ -1,4 +1,6 @@
 class Navigation:
+    FIELDS = ["href", "title", "rel", "type"]
+
     def __init__(self, **kwargs):
         self.href = kwargs.get("href", None)
         self.title = kwargs.get("title", None)
@@ -17,14 +19,16 @@ class Navigation:
                 self.addField(field, value)
 
     def __dir__(self):
-        return ["href", "title", "rel", "type"]
+        return self.FIELDS
 
-    def __iter__(self):
+    def toDict(self):
         if self.title is None:
             raise OPDS2NavigationException("title field must be present in metadata")
 
-        for attr in dir(self):
-            yield attr, getattr(self, attr)
+        return {attr: getattr(self, attr) for attr in self.FIELDS}
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
     def __repr__(self):
         return "<Navigation(title={}, type={}, href={})>".format(
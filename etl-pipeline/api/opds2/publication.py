@@ -5,6 +5,7 @@ from model import Edition
 from .metadata import Metadata
 from .link import Link
 from .image import Image
+from .serialization import serializeComponent
 from ..utils import APIUtils
 
 
@@ -324,23 +325,30 @@ class Publication:
     def __dir__(self):
         return ["type", "metadata", "links", "editions", "images"]
 
-    def __iter__(self):
+    def toDict(self):
         if len(self.images) == 0:
             raise OPDS2PublicationException(
                 "At least one image must be present in an OPDS2 publication"
             )
 
-        for attr in dir(self):
+        publicationDict = {}
+
+        for attr in ["type", "metadata", "links", "editions", "images"]:
             component = getattr(self, attr)
 
             if component is None:
                 continue
             if isinstance(component, list):
-                yield attr, [dict(c) for c in component]
+                publicationDict[attr] = [serializeComponent(c) for c in component]
             elif isinstance(component, Metadata):
-                yield attr, dict(component)
+                publicationDict[attr] = component.toDict()
             else:
-                yield attr, component
+                publicationDict[attr] = component
+
+        return publicationDict
+
+    def __iter__(self):
+        yield from self.toDict().items()
 
     def __repr__(self):
         return "<Publication(title={}, author={})>".format(
@@ -0,0 +1,6 @@
+def serializeComponent(component):
+    """Returns the dict form of an OPDS2 component. Classes in this package build it
+    directly in toDict, anything else is passed through dict()."""
+    toDict = getattr(component, "toDict", None)
+
+    return toDict() if toDict is not None else dict(component)
@@ -0,0 +1,138 @@
+from datetime import date, datetime
+from hashlib import sha1
+import json
+import os
+from uuid import UUID
+
+from logger import create_log
+from managers.redis import COLLECTIONS_VERSION_KEY
+
+logger = create_log(__name__)
+
+
+class PageCache:
+    """Caches paging state for database listings in Redis. For each page served it
+    keeps the sort key of the page's last row, so the following page can seek past
+    that key instead of scanning an OFFSET. It also keeps the listing's total row
+    count, so the count query does not run on every request. Anything that changes
+    the listing, such as the sort, the page size or the collections version, belongs
+    in the query key.
+    """
+
+    CACHE_TIME = 60 * 5
+
+    def __init__(self, redisClient, listing, cacheTime=CACHE_TIME):
+        self.redis = redisClient
+        self.listing = listing
+        self.cacheTime = cacheTime
+        self.environment = os.environ.get("ENVIRONMENT", "test")
+
+    def generateKey(self, *queryParts):
+        queryHash = sha1(
+            "|".join(str(part) for part in queryParts).encode("utf-8")
+        ).hexdigest()
+
+        return f"{self.environment}/api/pages/{self.listing}/{queryHash}"
+
+    def fetchCollectionsVersion(self):
+        if self.redis is None:
+            return None
+
+        try:
+            version = self.redis.get(
+                COLLECTIONS_VERSION_KEY.format(environment=self.environment)
+            )
+        except Exception:
+            logger.warning("Unable to fetch collections version")
+            return None
+
+        return int(version or 0)
+
+    def getCursor(self, queryKey, page, keyTypes):
+        if self.redis is None or page <= 1:
+            return None
+
+        try:
+            cursor = self.redis.hget(f"{queryKey}/cursors", page)
+        except Exception:
+            logger.warning(f"Unable to load page cursor {queryKey}")
+            return None
+
+        if cursor is None:
+            return None
+
+        return tuple(
+            keyType(value) for keyType, value in zip(keyTypes, json.loads(cursor))
+        )
+
+    def setCursor(self, queryKey, page, sortKey):
+        if self.redis is None or sortKey is None:
+            return
+
+        cursor = json.dumps([self._encodeKeyValue(value) for value in sortKey])
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hset(f"{queryKey}/cursors", page, cursor)
+            pipe.expire(f"{queryKey}/cursors", self.cacheTime)
+            pipe.execute()
+        except Exception:
+            logger.warning(f"Unable to save page cursor {queryKey}")
+
+    def getTotal(self, queryKey):
+        if self.redis is None:
+            return None
+
+        try:
+            total = self.redis.get(f"{queryKey}/total")
+        except Exception:
+            logger.warning(f"Unable to load page total {queryKey}")
+            return None
+
+        return int(total) if total is not None else None
+
+    def setTotal(self, queryKey, total):
+        if self.redis is None or total is None:
+            return
+
+        try:
+            self.redis.set(f"{queryKey}/total", total, ex=self.cacheTime)
+        except Exception:
+            logger.warning(f"Unable to save page total {queryKey}")
+
+    def getCounts(self, queryKey, identifiers):
+        if self.redis is None or not identifiers:
+            return {}
+
+        try:
+            counts = self.redis.hmget(f"{queryKey}/counts", identifiers)
+        except Exception:
+            logger.warning(f"Unable to load cached counts {queryKey}")
+            return {}
+
+        return {
+            identifier: int(count)
+            for identifier, count in zip(identifiers, counts)
+            if count is not None
+        }
+
+    def setCounts(self, queryKey, counts):
+        if self.redis is None or not counts:
+            return
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hset(f"{queryKey}/counts", mapping=counts)
+            pipe.expire(f"{queryKey}/counts", self.cacheTime)
+            pipe.execute()
+        except Exception:
+            logger.warning(f"Unable to save cached counts {queryKey}")
+
+    @staticmethod
+    def _encodeKeyValue(value):
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        elif isinstance(value, UUID):
+            return str(value)
+
+        return value
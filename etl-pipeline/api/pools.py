@@ -0,0 +1,43 @@
+import os
+import time
+
+from redis import BlockingConnectionPool
+from sqlalchemy.pool import QueuePool
+
+from services import monitor
+
+DEFAULT_SERVER_THREADS = 8
+
+
+def getServerThreads():
+    return int(os.environ.get("API_THREADS", DEFAULT_SERVER_THREADS))
+
+
+def getServerWorkers():
+    return int(os.environ.get("API_WORKERS", 2))
+
+
+class TimedQueuePool(QueuePool):
+    """SQLAlchemy QueuePool that reports how long each checkout waited for a free
+    connection, so pool exhaustion under load shows up as a metric rather than as
+    slow requests."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        finally:
+            monitor.track_pool_checkout_wait("Postgres", time.perf_counter() - start)
+
+
+class TimedBlockingConnectionPool(BlockingConnectionPool):
+    """Redis pool that blocks when all connections are in use and reports the wait."""
+
+    def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return super().get_connection(*args, **kwargs)
+        finally:
+            monitor.track_pool_checkout_wait("Redis", time.perf_counter() - start)
@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from flask import current_app
+from hashlib import sha1
+import json
+import os
+from threading import Lock
+from urllib.parse import urlencode
+
+from logger import create_log
+from managers.redis import COLLECTIONS_VERSION_KEY, ONE_WEEK, WORK_VERSION_KEY
+
+logger = create_log(__name__)
+
+
+class ResponseCache:
+    """Caches formatted work, edition and OPDS publication responses in Redis with a
+    small in-process LRU in front of it. Each entry records the version stamp of the
+    work it was built from, and is only served while that stamp and the collections
+    stamp are unchanged. RecordClusterer and RecordDeleter bump the work stamps when
+    they rewrite a work, and collection edits bump the collections stamp.
+    """
+
+    EXPIRATION_TIME = 60 * 60 * 24
+    LOCAL_CACHE_SIZE = 512
+
+    localCache = OrderedDict()
+    localCacheLock = Lock()
+
+    def __init__(self, redisClient, view):
+        self.redis = redisClient
+        self.view = view
+        self.environment = os.environ.get("ENVIRONMENT", "test")
+
+    def generateKey(self, identifier, request, readerVersion):
+        params = urlencode(sorted(request.args.items(multi=True)))
+        paramHash = sha1(
+            "|".join([request.host, str(readerVersion), params]).encode("utf-8")
+        ).hexdigest()
+
+        return f"{self.environment}/api/responses/{self.view}/{identifier}/{paramHash}"
+
+    def fetchVersion(self, workUUID):
+        if self.redis is None:
+            return None
+
+        try:
+            workVersion, collectionsVersion = self.redis.mget(
+                [
+                    WORK_VERSION_KEY.format(
+                        environment=self.environment, work_uuid=workUUID
+                    ),
+                    COLLECTIONS_VERSION_KEY.format(environment=self.environment),
+                ]
+            )
+        except Exception:
+            logger.warning(f"Unable to fetch response version for work {workUUID}")
+            return None
+
+        return f"{int(workVersion or 0)}:{int(collectionsVersion or 0)}"
+
+    def get(self, key):
+        if self.redis is None:
+            return None
+
+        with self.localCacheLock:
+            entry = self.localCache.get(key)
+
+        if entry is None:
+            try:
+                cachedEntry = self.redis.hgetall(key)
+            except Exception:
+                logger.warning(f"Unable to load cached response {key}")
+                return None
+
+            if not cachedEntry:
+                return None
+
+            entry = {
+                field.decode("utf-8"): value.decode("utf-8")
+                for field, value in cachedEntry.items()
+            }
+
+        if entry["version"] != self.fetchVersion(entry["workUUID"]):
+            return None
+
+        self._storeLocal(key, entry)
+
+        return json.loads(entry["body"])
+
+    def set(self, key, workUUID, version, body):
+        if version is None:
+            return
+
+        entry = {
+            "workUUID": str(workUUID),
+            "version": version,
+            "body": current_app.json.dumps(body),
+        }
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hset(key, mapping=entry)
+            pipe.expire(key, self.EXPIRATION_TIME)
+            pipe.execute()
+        except Exception:
+            logger.warning(f"Unable to cache response {key}")
+            return
+
+        self._storeLocal(key, entry)
+
+    def invalidateCollections(self):
+        if self.redis is None:
+            return
+
+        versionKey = COLLECTIONS_VERSION_KEY.format(environment=self.environment)
+
+        try:
+            pipe = self.redis.pipeline()
+            pipe.incr(versionKey)
+            pipe.expire(versionKey, ONE_WEEK)
+            pipe.execute()
+        except Exception:
+            logger.warning("Unable to invalidate cached collection memberships")
+
+    def _storeLocal(self, key, entry):
+        with self.localCacheLock:
+            self.localCache[key] = entry
+            self.localCache.move_to_end(key)
+
+            while len(self.localCache) > self.LOCAL_CACHE_SIZE:
+                self.localCache.popitem(last=False)
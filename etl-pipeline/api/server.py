@@ -0,0 +1,19 @@
+from gunicorn.app.base import BaseApplication
+
+
+class GunicornServer(BaseApplication):
+    """Runs the Flask app under gunicorn with the options passed in rather than
+    reading them from a config file or the command line."""
+
+    def __init__(self, app, options):
+        self.application = app
+        self.options = options
+
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
@@ -4,9 +4,7 @@ from hashlib import scrypt
 from flask import jsonify
 from itertools import repeat
 from math import ceil
-from model import Collection, Edition
 import re
-from model.postgres.collection import COLLECTION_EDITIONS
 from logger import create_log
 from botocore.exceptions import ClientError
 from urllib.parse import urlparse
@@ -161,7 +159,17 @@ class APIUtils:
         showAll=True,
         formats=None,
         reader=None,
+        editionCollections=None,
     ):
+        if editionCollections is None:
+            editionCollections = dbClient.fetchEditionCollections(
+                [
+                    edition.id
+                    for work in (works if isinstance(works, list) else [works])
+                    for edition in work.editions
+                ]
+            )
+
         # Multiple formatted works with formats specified
         if isinstance(works, list):
             outWorks = []
@@ -181,6 +189,7 @@ class APIUtils:
                     formats=formats,
                     reader=reader,
                     request=request,
+                    editionCollections=editionCollections,
                 )
 
                 cls.addWorkMeta(outWork, highlights=highlights)
@@ -198,6 +207,7 @@ class APIUtils:
                 formats=formats,
                 reader=reader,
                 request=request,
+                editionCollections=editionCollections,
             )
 
             formattedWork["editions"].sort(
@@ -207,7 +217,13 @@ class APIUtils:
         # Formatted work with no format specified
         else:
             formattedWork = cls.formatWork(
-                works, None, showAll, dbClient, reader=reader, request=request
+                works,
+                None,
+                showAll,
+                dbClient,
+                reader=reader,
+                request=request,
+                editionCollections=editionCollections,
             )
 
             formattedWork["editions"].sort(
@@ -225,12 +241,20 @@ class APIUtils:
         formats=None,
         reader=None,
         request=None,
+        editionCollections=None,
     ):
+        if editionCollections is None:
+            editionCollections = dbClient.fetchEditionCollections(
+                [edition.id for edition in work.editions]
+            )
+
         workDict = dict(work)
         workDict["edition_count"] = len(work.editions)
-        workDict["inCollections"] = cls.checkEditionInCollection(
-            work, None, dbClient=dbClient
-        )
+        workDict["inCollections"] = [
+            collection
+            for edition in work.editions
+            for collection in editionCollections.get(edition.id, [])
+        ]
         workDict["date_created"] = work.date_created.strftime("%Y-%m-%dT%H:%M:%S")
         workDict["date_modified"] = work.date_modified.strftime("%Y-%m-%dT%H:%M:%S")
 
@@ -240,11 +264,9 @@ class APIUtils:
             if editionIds and edition.id not in editionIds:
                 continue
 
-            editInCollection = cls.checkEditionInCollection(None, edition, dbClient)
-
             editionDict = cls.formatEdition(
                 edition,
-                editionInCollection=editInCollection,
+                editionInCollection=editionCollections.get(edition.id, []),
                 formats=formats,
                 reader=reader,
             )
@@ -286,7 +308,9 @@ class APIUtils:
     ):
         editionWorkTitle = edition.work.title
         editionWorkAuthors = edition.work.authors
-        editionInCollection = cls.checkEditionInCollection(None, edition, dbClient)
+        editionInCollection = dbClient.fetchEditionCollections([edition.id]).get(
+            edition.id, []
+        )
 
         formattedEdition = cls.formatEdition(
             edition,
@@ -314,45 +338,6 @@ class APIUtils:
 
         return formattedEdition
 
-    @classmethod
-    def checkEditionInCollection(cls, work, edition, dbClient):
-        collectionMetadata = []
-
-        if work != None:
-            for edit in dbClient.session.query(Edition).filter(
-                Edition.work_id == work.id
-            ):
-                for collection in (
-                    dbClient.session.query(Collection)
-                    .join(COLLECTION_EDITIONS)
-                    .filter(COLLECTION_EDITIONS.c.edition_id == edit.id)
-                ):
-                    metadataOBJ = {
-                        "uuid": collection.uuid,
-                        "title": collection.title,
-                        "creator": collection.creator,
-                        "description": collection.description,
-                        "numberOfItems": len(collection.editions),
-                    }
-                    collectionMetadata.append(metadataOBJ)
-
-        else:
-            for collection in (
-                dbClient.session.query(Collection)
-                .join(COLLECTION_EDITIONS)
-                .filter(COLLECTION_EDITIONS.c.edition_id == edition.id)
-            ):
-                metadataOBJ = {
-                    "uuid": collection.uuid,
-                    "title": collection.title,
-                    "creator": collection.creator,
-                    "description": collection.description,
-                    "numberOfItems": len(collection.editions),
-                }
-                collectionMetadata.append(metadataOBJ)
-
-        return collectionMetadata
-
     @classmethod
     def formatEdition(
         cls,
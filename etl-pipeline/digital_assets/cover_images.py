@@ -1,4 +1,7 @@
+import io
+
 import PIL
+import PIL.Image
 
 
 def resize_image_for_cover(image: PIL.Image) -> PIL.Image:
@@ -17,3 +20,18 @@ def resize_image_for_cover(image: PIL.Image) -> PIL.Image:
         resize_width = int(round(400 * original_ratio))
 
     return image.resize((resize_width, resize_height))
+
+
+def resize_cover_bytes(image_bytes: bytes) -> bytes:
+    """Resizes an encoded image for a cover and encodes it in its original format.
+    JPEGs are decoded at a reduced scale, which is much cheaper than decoding them
+    at full size and then shrinking them."""
+    image = PIL.Image.open(io.BytesIO(image_bytes))
+    image_format = image.format
+    image.draft(image.mode, (300, 400))
+
+    cover = resize_image_for_cover(image)
+    cover_stream = io.BytesIO()
+    cover.save(cover_stream, format=image_format)
+
+    return cover_stream.getvalue()
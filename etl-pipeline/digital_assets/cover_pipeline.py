@@ -0,0 +1,191 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+import hashlib
+import io
+import mimetypes
+from typing import Callable, Iterable, Optional
+
+from botocore.exceptions import ClientError
+import requests
+
+from digital_assets import cover_images
+from logger import create_log
+
+logger = create_log(__name__)
+
+SOURCE_HASH_KEY = "source-hash"
+COVER_HASH_KEY = "cover-hash"
+
+
+@dataclass
+class CoverResizeResult:
+    resized: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _CoverSource:
+    source: str
+    destination_key: str
+    content: bytes
+    source_hash: str
+
+
+class CoverResizePipeline:
+    """Resizes cover images in bulk. Sources, either S3 keys in the bucket or
+    URLs, are downloaded on a thread pool, resized on a process pool and uploaded
+    on a thread pool. Each cover is stored with the hash of the source it was made
+    from, so sources that have not changed since they were last resized are
+    skipped, which also makes resizing a cover in place safe to repeat.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        download_workers: int = 16,
+        resize_workers: Optional[int] = None,
+        upload_workers: int = 16,
+        acl: str = "public-read",
+    ):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.download_workers = download_workers
+        self.resize_workers = resize_workers
+        self.upload_workers = upload_workers
+        self.acl = acl
+
+    def run(
+        self,
+        sources: Iterable[str],
+        destination_key: Callable[[str], str] = lambda source: source,
+    ) -> CoverResizeResult:
+        """Resizes each source into the bucket at destination_key(source), which
+        defaults to resizing S3 keys in place."""
+        result = CoverResizeResult()
+        sources = iter(sources)
+        # Bounds how many covers are held in memory between stages
+        max_in_flight = self.download_workers + self.upload_workers * 2
+
+        with (
+            ThreadPoolExecutor(max_workers=self.download_workers) as download_pool,
+            ProcessPoolExecutor(max_workers=self.resize_workers) as resize_pool,
+            ThreadPoolExecutor(max_workers=self.upload_workers) as upload_pool,
+        ):
+            pending = {}
+
+            def submit_downloads():
+                while len(pending) < max_in_flight:
+                    source = next(sources, None)
+                    if source is None:
+                        return
+
+                    download = download_pool.submit(
+                        self._download, source, destination_key(source)
+                    )
+                    pending[download] = ("download", source, None)
+
+            submit_downloads()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, source, cover_source = pending.pop(future)
+
+                    try:
+                        stage_result = future.result()
+                    except Exception:
+                        logger.exception(f"Unable to {stage} cover {source}")
+                        result.failed.append(source)
+                        continue
+
+                    if stage == "download" and stage_result is None:
+                        result.skipped.append(source)
+                    elif stage == "download":
+                        resize = resize_pool.submit(
+                            cover_images.resize_cover_bytes, stage_result.content
+                        )
+                        pending[resize] = ("resize", source, stage_result)
+                    elif stage == "resize":
+                        upload = upload_pool.submit(
+                            self._upload, cover_source, stage_result
+                        )
+                        pending[upload] = ("upload", source, cover_source)
+                    else:
+                        result.resized.append(cover_source.destination_key)
+
+                submit_downloads()
+
+        logger.info(
+            f"Resized {len(result.resized)} covers, skipped {len(result.skipped)} "
+            f"unchanged and failed on {len(result.failed)}"
+        )
+
+        return result
+
+    def _download(self, source: str, destination_key: str) -> Optional[_CoverSource]:
+        stored_hashes = self._get_stored_hashes(destination_key)
+
+        if source.startswith(("http://", "https://")):
+            response = requests.get(source, timeout=30)
+            response.raise_for_status()
+
+            content = response.content
+            source_hash = hashlib.md5(content).hexdigest()
+
+            if source_hash in stored_hashes:
+                return None
+        else:
+            source_object = self.s3_client.head_object(Bucket=self.bucket, Key=source)
+            source_hash = source_object["ETag"].strip('"')
+
+            # Check before downloading, using the ETag as the source's hash
+            if source_hash in stored_hashes:
+                return None
+
+            content = self.s3_client.get_object(Bucket=self.bucket, Key=source)[
+                "Body"
+            ].read()
+
+        return _CoverSource(source, destination_key, content, source_hash)
+
+    def _get_stored_hashes(self, destination_key: str) -> set[str]:
+        try:
+            cover_object = self.s3_client.head_object(
+                Bucket=self.bucket, Key=destination_key
+            )
+        except ClientError:
+            return set()
+
+        metadata = cover_object.get("Metadata", {})
+
+        # A cover resized in place is its own source, so its own hash counts too
+        return {
+            metadata[key]
+            for key in (SOURCE_HASH_KEY, COVER_HASH_KEY)
+            if key in metadata
+        }
+
+    def _upload(self, cover_source: _CoverSource, cover: bytes):
+        content_type, _ = mimetypes.guess_type(cover_source.destination_key)
+
+        self.s3_client.upload_fileobj(
+            Fileobj=io.BytesIO(cover),
+            Bucket=self.bucket,
+            Key=cover_source.destination_key,
+            ExtraArgs={
+                "ACL": self.acl,
+                "ContentType": content_type or "application/octet-stream",
+                "Metadata": {
+                    SOURCE_HASH_KEY: cover_source.source_hash,
+                    COVER_HASH_KEY: hashlib.md5(cover).hexdigest(),
+                },
+            },
+        )
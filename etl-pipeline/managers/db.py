@@ -3,7 +3,7 @@ from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import OperationalError
 
-from model import Base
+from model import Base, CREATE_PREFERRED_EDITIONS
 from logger import create_log
 
 logger = create_log(__name__)
@@ -28,12 +28,13 @@ class DBManager:
     def __exit__(self, exc_type, exc_value, exc_tb):
         self.close_connection()
 
-    def generate_engine(self):
+    def generate_engine(self, **engine_options):
         try:
             self.engine = create_engine(
                 "postgresql://{}:{}@{}:{}/{}".format(
                     self.user, self.pswd, self.host, self.port, self.db
-                )
+                ),
+                **engine_options,
             )
 
             return self.engine
@@ -44,6 +45,10 @@ class DBManager:
         if not inspect(self.engine).has_table("works"):
             Base.metadata.create_all(self.engine)
 
+            with self.engine.begin() as db_connection:
+                for statement in CREATE_PREFERRED_EDITIONS:
+                    db_connection.execute(statement)
+
     def create_session(self, autoflush=False):
         if not self.engine:
             self.generate_engine()
@@ -20,7 +20,7 @@ class ElasticsearchManager:
         self.client = None
 
     def create_elastic_connection(
-        self, scheme=None, host=None, port=None, user=None, pswd=None
+        self, scheme=None, host=None, port=None, user=None, pswd=None, maxsize=None
     ):
         scheme = scheme or os.environ.get("ELASTICSEARCH_SCHEME", None)
         host = host or os.environ.get("ELASTICSEARCH_HOST", None)
@@ -52,6 +52,9 @@ class ElasticsearchManager:
             "max_retries": 3,
         }
 
+        if maxsize:
+            connection_config["maxsize"] = maxsize
+
         self.client = connections.create_connection(**connection_config)
         self.es = Elasticsearch(**connection_config)
 
@@ -1,5 +1,6 @@
 from oauthlib.oauth2 import BackendApplicationClient, TokenExpiredError
 import os
+import threading
 from requests_oauthlib import OAuth2Session
 
 
@@ -14,6 +15,7 @@ class NYPLAPIManager:
         self.token_url = os.environ.get("NYPL_API_CLIENT_TOKEN_URL", None)
         self.api_root = "https://platform.nypl.org/api/v0.1"
         self.token = None
+        self.token_lock = threading.Lock()
 
     def generate_access_token(self):
         client = BackendApplicationClient(self.client_id)
@@ -28,16 +30,25 @@ class NYPLAPIManager:
         self.client = OAuth2Session(self.client_id, token=self.token)
 
     def query_api(self, request_path):
-        if not self.client:
-            self.create_client()
+        client = self.client
+
+        if not client:
+            with self.token_lock:
+                if not self.client:
+                    self.create_client()
+
+                client = self.client
 
         try:
-            return self.client.get(
+            return client.get(
                 "{}/{}".format(self.api_root, request_path), timeout=15
             ).json()
         except TokenExpiredError:
-            self.generate_access_token()
-            self.client = None
+            with self.token_lock:
+                # Another thread may have already refreshed the expired token
+                if self.client is client:
+                    self.generate_access_token()
+                    self.client = None
 
             return self.query_api(request_path)
         except TimeoutError:
@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 import io
 import os
+import tempfile
+from typing import Iterable, Iterator, Optional
 
 import PIL
 import pypdf
+from pypdf.generic import IndirectObject, NameObject
 import requests
 import requests.exceptions
 
@@ -11,21 +15,89 @@ from logger import create_log
 
 logger = create_log(__name__)
 
+INHERITED_PAGE_KEYS = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
 
 class PDFCoverGenerator:
-    def __init__(self, pdf_content: io.BytesIO):
-        self.pdf = pypdf.PdfReader(pdf_content)
+    # Pages past these are unlikely to hold a cover
+    MAX_COVER_PAGES = 5
+    # Images are decoded at about twice the cover size, which is enough to resize from
+    THUMBNAIL_SIZE = (600, 800)
+    SPOOL_SIZE = 32 * 1024 * 1024
+
+    def __init__(self, pdf_content: io.IOBase, lazy: bool = False):
+        if lazy:
+            self.pdf = self._open_lazily(pdf_content)
+        else:
+            self.pdf = pypdf.PdfReader(pdf_content)
 
     @staticmethod
-    def from_url(pdf_url: str) -> "PDFCoverGenerator":
-        stream = io.BytesIO()
+    def from_url(pdf_url: str, stream: bool = False) -> "PDFCoverGenerator":
+        """Opens the PDF at pdf_url. With stream, the PDF is read with HTTP range
+        requests so only the cross-reference table and the pages searched for a
+        cover are fetched. If the server does not support range requests, the PDF
+        is downloaded into a temporary file that spills to disk when it is large.
+        """
         logger.info("Fetching PDF from url %s", pdf_url)
+
+        if stream:
+            range_file = RangeRequestFile.open(pdf_url)
+
+            if range_file is not None:
+                return PDFCoverGenerator(range_file, lazy=True)
+
+            pdf_file = tempfile.SpooledTemporaryFile(
+                max_size=PDFCoverGenerator.SPOOL_SIZE
+            )
+        else:
+            pdf_file = io.BytesIO()
+
         response = requests.get(pdf_url, stream=True)
         response.raise_for_status()
         for chunk in response.iter_content(chunk_size=8192):
-            stream.write(chunk)
+            pdf_file.write(chunk)
+
+        pdf_file.seek(0)
 
-        return PDFCoverGenerator(stream)
+        return PDFCoverGenerator(pdf_file)
+
+    @staticmethod
+    def extract_covers(
+        pdf_urls: Iterable[str], max_workers: int = 8
+    ) -> Iterator[tuple[str, Optional[io.BytesIO]]]:
+        """Extracts the covers of many PDFs concurrently, streaming each PDF. Yields
+        each URL with its PNG cover, or with None if no cover could be extracted.
+        """
+
+        def extract_cover(pdf_url: str) -> tuple[str, Optional[io.BytesIO]]:
+            try:
+                cover = io.BytesIO()
+                PDFCoverGenerator.from_url(pdf_url, stream=True).extract_cover_content(
+                    cover
+                )
+
+                return pdf_url, cover
+            except Exception:
+                logger.exception(f"Unable to extract cover from {pdf_url}")
+                return pdf_url, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(extract_cover, pdf_urls)
+
+    @staticmethod
+    def _open_lazily(pdf_content: io.IOBase) -> pypdf.PdfReader:
+        # A lenient reader checks every object the cross-reference table points to
+        # when it opens, which would read nearly all of a PDF. A strict reader only
+        # reads the table, so it is tried first and made lenient once open.
+        try:
+            pdf = pypdf.PdfReader(pdf_content, strict=True)
+        except pypdf.errors.PdfReadError:
+            logger.info("PDF has a malformed cross-reference table, reading in full")
+            return pypdf.PdfReader(pdf_content)
+
+        pdf.strict = False
+
+        return pdf
 
     def extract_cover_content(self, outstream: io.BytesIO) -> None:
         image = self._extract_cover_image()
@@ -35,17 +107,194 @@ class PDFCoverGenerator:
         outstream.seek(0)
 
     def _extract_cover_image(self) -> PIL.Image:
-        for page in self.pdf.pages:
-            image = page.images[0].image
+        first_image = None
+
+        for page in self._first_pages(self.MAX_COVER_PAGES):
+            image = self._decode_page_image(page)
+            if image is None:
+                continue
+
+            if first_image is None:
+                first_image = image
+
+            if image.entropy() >= 0.001:
+                return image
+
             if page.extract_text():
                 logger.info("Found first page with text, returning as cover")
                 return image
 
-            if image.entropy() < 0.001:
-                logger.info("Likely blank image detected, skipping")
+            logger.info("Likely blank image detected, skipping")
+
+        if first_image is None:
+            raise PDFCoverError(
+                f"No images found in the first {self.MAX_COVER_PAGES} pages"
+            )
+
+        # Default to the first page's image
+        return first_image
+
+    def _first_pages(self, limit: int) -> Iterator[pypdf.PageObject]:
+        """Yields the first pages in order, walking the page tree only as far as
+        needed. Listing pdf.pages reads every page object up front, which for a
+        streamed PDF means fetching most of the file."""
+        stack = [(self.pdf.trailer["/Root"].raw_get("/Pages"), {})]
+        page_count = 0
+
+        while stack and page_count < limit:
+            reference, inherited = stack.pop()
+            node = reference.get_object()
+
+            attributes = {
+                **inherited,
+                **{
+                    key: node.raw_get(key) for key in INHERITED_PAGE_KEYS if key in node
+                },
+            }
+
+            if "/Kids" in node:
+                stack.extend((kid, attributes) for kid in reversed(node["/Kids"]))
                 continue
 
-            return image
+            page = pypdf.PageObject(
+                self.pdf,
+                reference if isinstance(reference, IndirectObject) else None,
+            )
+            page.update(node)
+
+            for key, value in attributes.items():
+                page.setdefault(NameObject(key), value)
+
+            page_count += 1
+
+            yield page
+
+    def _decode_page_image(self, page: pypdf.PageObject) -> Optional[PIL.Image.Image]:
+        if not page.images:
+            return None
+
+        image = page.images[0].image
+
+        # JPEG images have not been decoded yet, so they can be decoded at a reduced
+        # scale rather than decoded in full and then shrunk
+        image.draft("RGB", self.THUMBNAIL_SIZE)
+        image.thumbnail(self.THUMBNAIL_SIZE)
+
+        return image
+
+
+class RangeRequestFile(io.RawIOBase):
+    """A read-only, seekable view of a remote file. Reads are served from blocks
+    fetched with HTTP range requests, and each block is fetched once."""
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        session: Optional[requests.Session] = None,
+        block_size: int = BLOCK_SIZE,
+    ):
+        self.url = url
+        self.size = size
+        self.session = session or requests.Session()
+        self.block_size = block_size
+        self.position = 0
+        self.blocks = {}
+
+    @staticmethod
+    def open(
+        url: str, session: Optional[requests.Session] = None
+    ) -> Optional["RangeRequestFile"]:
+        session = session or requests.Session()
+
+        try:
+            response = session.head(url, allow_redirects=True, timeout=30)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            logger.warning(f"Unable to check range request support for {url}")
+            return None
+
+        content_length = response.headers.get("Content-Length")
+
+        if response.headers.get("Accept-Ranges") != "bytes" or not content_length:
+            return None
+
+        return RangeRequestFile(response.url, int(content_length), session=session)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+
+        self.position = max(offset, 0)
+
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        if self.position >= self.size:
+            return 0
+
+        end = min(self.position + len(buffer), self.size)
+        data = self._read_range(self.position, end)
+
+        buffer[: len(data)] = data
+        self.position += len(data)
+
+        return len(data)
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        first_block = start // self.block_size
+        last_block = (end - 1) // self.block_size
+
+        missing_blocks = [
+            block
+            for block in range(first_block, last_block + 1)
+            if block not in self.blocks
+        ]
+
+        if missing_blocks:
+            # A read that spans cached blocks refetches them rather than making
+            # a request per gap
+            self._fetch_blocks(missing_blocks[0], missing_blocks[-1])
+
+        data = b"".join(
+            self.blocks[block] for block in range(first_block, last_block + 1)
+        )
+        offset = start - first_block * self.block_size
+
+        return data[offset : offset + end - start]
+
+    def _fetch_blocks(self, first_block: int, last_block: int):
+        range_start = first_block * self.block_size
+        range_end = min((last_block + 1) * self.block_size, self.size) - 1
+
+        response = self.session.get(
+            self.url, headers={"Range": f"bytes={range_start}-{range_end}"}, timeout=30
+        )
+        response.raise_for_status()
+
+        if response.status_code != 206:
+            raise PDFCoverError(f"Range request for {self.url} was not honored")
+
+        for block in range(first_block, last_block + 1):
+            block_offset = (block - first_block) * self.block_size
+            self.blocks[block] = response.content[
+                block_offset : block_offset + self.block_size
+            ]
+
 
-        # Default to the first page
-        return self.pdf.pages[0]
+class PDFCoverError(Exception):
+    def __init__(self, message=None):
+        self.message = message
@@ -9,6 +9,12 @@ logger = create_log(__name__)
 
 ONE_WEEK = 60 * 60 * 24 * 7
 
+# Version stamps checked by the API response cache, which must outlive cached responses
+WORK_VERSION_KEY = "{environment}/api/versions/work/{work_uuid}"
+COLLECTIONS_VERSION_KEY = "{environment}/api/versions/collections"
+# Ordered work entries of an automatic collection, written by AutomaticCollectionRefreshProcess
+AUTOMATIC_COLLECTION_KEY = "{environment}/api/automatic-collections/{collection_id}"
+
 
 class RedisManager:
     def __init__(self, host=None, port=None):
@@ -22,8 +28,12 @@ class RedisManager:
 
         self.oclc_limit = int(os.environ.get("OCLC_QUERY_LIMIT", 400000))
 
-    def create_client(self) -> Redis:
-        self.client = Redis(host=self.host, port=self.port, socket_timeout=5)
+    def create_client(self, connection_pool=None) -> Redis:
+        if connection_pool is not None:
+            self.client = Redis(connection_pool=connection_pool)
+        else:
+            self.client = Redis(host=self.host, port=self.port, socket_timeout=5)
+
         return self.client
 
     def clear_cache(self):
@@ -134,3 +144,52 @@ class RedisManager:
         key = f"{service}/{self.present_time.strftime('%Y-%m-%d')}/{identifier}"
 
         self.client.incr(key, amount=amount)
+
+    def invalidate_work_responses(
+        self, work_uuids: list[str], expiration_time: int = ONE_WEEK
+    ):
+        pipe = self.client.pipeline()
+
+        for work_uuid in work_uuids:
+            version_key = WORK_VERSION_KEY.format(
+                environment=self.environment, work_uuid=work_uuid
+            )
+
+            pipe.incr(version_key)
+            pipe.expire(version_key, expiration_time)
+
+        pipe.execute()
+
+    def set_automatic_collection_works(
+        self,
+        collection_id: int,
+        work_editions: list[list[int]],
+        total_count: int,
+        expiration_time: int,
+    ):
+        """Replace the stored entries of an automatic collection in one transaction.
+        Each entry holds the comma separated edition ids of one work in the collection.
+        """
+        key = AUTOMATIC_COLLECTION_KEY.format(
+            environment=self.environment, collection_id=collection_id
+        )
+        staging_key = f"{key}/staging"
+
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(staging_key)
+
+        if work_editions:
+            pipe.rpush(
+                staging_key,
+                *(
+                    ",".join(str(edition_id) for edition_id in editions)
+                    for editions in work_editions
+                ),
+            )
+            pipe.rename(staging_key, f"{key}/works")
+            pipe.expire(f"{key}/works", expiration_time)
+        else:
+            pipe.delete(f"{key}/works")
+
+        pipe.set(f"{key}/total", total_count, ex=expiration_time)
+        pipe.execute()
@@ -1,5 +1,6 @@
 import base64
 import boto3
+from boto3.exceptions import S3UploadFailedError
 from botocore.exceptions import ClientError
 import hashlib
 from io import BytesIO
@@ -145,6 +146,38 @@ class S3Manager:
         except ClientError as e:
             raise S3Error(f"Unable to store file {key} in s3: {e}")
 
+    def upload_fileobj(
+        self,
+        fileobj,
+        key: str,
+        bucket: str,
+        bucket_permissions: str = "public-read",
+        storage_class: str = "STANDARD",
+        transfer_config=None,
+    ):
+        """Upload a readable stream without loading it into memory. Streams larger
+        than the transfer config's multipart threshold are sent as concurrent
+        multipart uploads of `multipart_chunksize` parts.
+        """
+        extra_args = {
+            "ContentType": mimetypes.guess_type(key)[0] or "binary/octet-stream",
+            "StorageClass": storage_class,
+        }
+
+        if bucket_permissions is not None:
+            extra_args["ACL"] = bucket_permissions
+
+        try:
+            self.client.upload_fileobj(
+                fileobj,
+                bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=transfer_config,
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            raise S3Error(f"Unable to stream file {key} to s3: {e}")
+
     def store_epub(self, object, key: str, bucket: str):
         key_prefix = ".".join(key.split(".")[:-1])
 
@@ -0,0 +1,54 @@
+"""Add preferred_editions materialized view
+
+Revision ID: 3b8d5e1f0a27
+Revises: e96fd76130c3
+Create Date: 2026-10-19 10:12:44.208317
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3b8d5e1f0a27"
+down_revision = "e96fd76130c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""CREATE MATERIALIZED VIEW IF NOT EXISTS preferred_editions AS
+        SELECT
+            editions.id AS edition_id,
+            works.id AS work_id,
+            works.uuid AS work_uuid,
+            COALESCE(works.title, '') AS work_title,
+            works.date_created AS work_date_created,
+            editions.date_created AS edition_date_created,
+            LAG(editions.date_created) OVER (
+                PARTITION BY works.id
+                ORDER BY editions.date_created ASC, editions.id ASC
+            ) AS previous_edition_date_created
+        FROM works
+        JOIN editions ON editions.work_id = works.id
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_preferred_editions_edition_id "
+        "ON preferred_editions (edition_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_preferred_editions_title "
+        "ON preferred_editions (work_title, work_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_preferred_editions_date_created "
+        "ON preferred_editions (work_date_created, work_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_preferred_editions_uuid "
+        "ON preferred_editions (work_uuid, work_id)"
+    )
+
+
+def downgrade():
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS preferred_editions")
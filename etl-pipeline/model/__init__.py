@@ -8,6 +8,11 @@ from .postgres.link import Link
 from .postgres.olCover import OpenLibraryCover
 from .postgres.rights import Rights
 from .postgres.collection import Collection, AutomaticCollection
+from .postgres.preferred_edition import (
+    PREFERRED_EDITIONS,
+    CREATE_PREFERRED_EDITIONS,
+    REFRESH_PREFERRED_EDITIONS,
+)
 from .postgres.user import User
 from .postgres.grin_status import GRINStatus, GRINState
 
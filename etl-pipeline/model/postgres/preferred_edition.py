@@ -0,0 +1,61 @@
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, Unicode, text
+from sqlalchemy.dialects.postgresql import UUID
+
+# Materialized view holding every edition of each work, with the work fields
+# automatic collections sort on and the creation date of the edition before it in
+# the work. The preferred edition within a date window is a work's oldest edition
+# created inside it, which is the one whose previous edition is missing or predates
+# the window, so it is picked with a filter at query time. The view is kept out of
+# Base.metadata so create_all does not build it as a plain table, and is refreshed
+# by DatabaseMaintenanceProcess.
+PREFERRED_EDITIONS = Table(
+    "preferred_editions",
+    MetaData(),
+    Column("edition_id", Integer, primary_key=True),
+    Column("work_id", Integer),
+    Column("work_uuid", UUID(as_uuid=True)),
+    Column("work_title", Unicode),
+    Column("work_date_created", DateTime),
+    Column("edition_date_created", DateTime),
+    Column("previous_edition_date_created", DateTime),
+)
+
+# Builds the view for new databases. The migration that adds it keeps its own copy
+# of this SQL, so a change here also needs a new migration for existing databases
+CREATE_PREFERRED_EDITIONS = [
+    text("""CREATE MATERIALIZED VIEW IF NOT EXISTS preferred_editions AS
+        SELECT
+            editions.id AS edition_id,
+            works.id AS work_id,
+            works.uuid AS work_uuid,
+            COALESCE(works.title, '') AS work_title,
+            works.date_created AS work_date_created,
+            editions.date_created AS edition_date_created,
+            LAG(editions.date_created) OVER (
+                PARTITION BY works.id
+                ORDER BY editions.date_created ASC, editions.id ASC
+            ) AS previous_edition_date_created
+        FROM works
+        JOIN editions ON editions.work_id = works.id
+    """),
+    text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_preferred_editions_edition_id "
+        "ON preferred_editions (edition_id)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_preferred_editions_title "
+        "ON preferred_editions (work_title, work_id)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_preferred_editions_date_created "
+        "ON preferred_editions (work_date_created, work_id)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_preferred_editions_uuid "
+        "ON preferred_editions (work_uuid, work_id)"
+    ),
+]
+
+REFRESH_PREFERRED_EDITIONS = text(
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY preferred_editions"
+)
@@ -1,6 +1,7 @@
 from .local_development.local_development_setup import LocalDevelopmentSetupProcess
 from .api import APIProcess
 from .ingest_process import IngestProcess
+from .util.automatic_collection_refresh import AutomaticCollectionRefreshProcess
 from .util.db_maintenance import DatabaseMaintenanceProcess
 from .util.db_migration import MigrationProcess
 from .util.redrive_records import RedriveRecordsProcess
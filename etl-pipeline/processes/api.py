@@ -1,6 +1,11 @@
 import os
 
 from api.app import FlaskAPI
+from api.pools import (
+    getServerThreads,
+    TimedBlockingConnectionPool,
+    TimedQueuePool,
+)
 from logger import create_log
 from managers import DBManager, ElasticsearchManager, RedisManager
 
@@ -18,9 +23,27 @@ class APIProcess:
         try:
             logger.info("Starting API...")
 
-            db_engine = self.db_manager.generate_engine()
-            redis_client = self.redis_manager.create_client()
-            self.elastic_search_manager.create_elastic_connection()
+            # Pools are per worker process, so one connection per request thread
+            # plus headroom for the concurrent facet queries made by searches
+            server_threads = getServerThreads()
+
+            db_engine = self.db_manager.generate_engine(
+                poolclass=TimedQueuePool,
+                pool_size=server_threads,
+                max_overflow=server_threads // 2,
+                pool_pre_ping=True,
+            )
+            redis_client = self.redis_manager.create_client(
+                connection_pool=TimedBlockingConnectionPool(
+                    host=self.redis_manager.host,
+                    port=self.redis_manager.port,
+                    socket_timeout=5,
+                    max_connections=server_threads * 2,
+                )
+            )
+            self.elastic_search_manager.create_elastic_connection(
+                maxsize=server_threads * 2
+            )
 
             api = FlaskAPI(db_engine, redis_client)
 
@@ -60,9 +60,14 @@ class CandidateRecordFinder:
         checked_ids = set()
 
         for match_distance in range(0, self.MAX_MATCH_DISTANCE):
-            matched_records = self._get_records_matching_identifiers(
-                list(ids_to_check), candidate_record_ids.copy()
-            )
+            with monitor.span(
+                "Cluster:CandidateHop",
+                hop=match_distance,
+                num_identifiers=len(ids_to_check),
+            ):
+                matched_records = self._get_records_matching_identifiers(
+                    list(ids_to_check), candidate_record_ids.copy()
+                )
 
             if not matched_records:
                 break
@@ -147,6 +152,7 @@ class CandidateRecordFinder:
 
         return matched_records
 
+    @monitor.span("Cluster:LoadCandidates")
     def _get_records_by_ids(self, record_ids: List[str]) -> List[Record]:
         return (
             self.db_manager.session.query(Record)
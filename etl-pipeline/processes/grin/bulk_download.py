@@ -1,19 +1,25 @@
 # Script run daily to download all GRIN books that were converted in the past day
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import List
 from model import GRINState, GRINStatus, Record
 from managers import DBManager, S3Manager
 from logger import create_log
 from sqlalchemy import select, desc
-from .util import chunk
+from .util import AdaptiveConcurrency, chunk
 from .grin_client import GRINClient
 import os
 import argparse
+import time
+
+
+class GRINDownloadError(Exception):
+    pass
 
 
 class GRINBulkDownload:
-    def __init__(self, *args, batch_limit=1000):
+    def __init__(self, *args, batch_limit=1000, max_workers=1):
         self.s3_manager = S3Manager()
         self.client = GRINClient()
         self.logger = create_log(__name__)
@@ -23,6 +29,7 @@ class GRINBulkDownload:
             else "drb-files-limited-qa"
         )
         self.batch_limit = batch_limit
+        self.max_workers = max_workers
 
     def runProcess(self, backfill=True):
         with DBManager() as self.db_manager:
@@ -34,6 +41,10 @@ class GRINBulkDownload:
             self.download_and_upload_books(daily_converted_books)
 
     def download_and_upload_books(self, books):
+        if self.max_workers > 1:
+            self.transfer_books_concurrently(books)
+            return
+
         for chunked_books in chunk(iter(books), self.batch_limit):
             successfully_processed_books: List[str] = []
             for book in chunked_books:
@@ -70,6 +81,93 @@ class GRINBulkDownload:
                     f"Successfully downloaded and uploaded {len(successfully_processed_books)} books"
                 )
 
+    def transfer_books_concurrently(self, books):
+        """Stream books from GRIN to S3 on a pool of up to `max_workers` threads. The
+        number of books in flight adapts to GRIN's response times, and each book's
+        state is committed as soon as its transfer finishes, so an interrupted run only
+        repeats the books that were in flight.
+        """
+        concurrency = AdaptiveConcurrency(self.max_workers)
+        remaining_books = iter(books)
+        pending_transfers = {}
+        transferred_count = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                while len(pending_transfers) < concurrency.limit:
+                    book = next(remaining_books, None)
+
+                    if book is None:
+                        break
+
+                    barcode = book.source_id.split("|")[0]
+                    pending_transfers[executor.submit(self._transfer_book, barcode)] = (
+                        book
+                    )
+
+                if not pending_transfers:
+                    break
+
+                completed_transfers, _ = wait(
+                    pending_transfers, return_when=FIRST_COMPLETED
+                )
+
+                for transfer in completed_transfers:
+                    book = pending_transfers.pop(transfer)
+
+                    if self._record_transfer(book, transfer, concurrency):
+                        transferred_count += 1
+
+        if transferred_count > 0:
+            self.logger.info(
+                f"Successfully downloaded and uploaded {transferred_count} books"
+            )
+
+    def _transfer_book(self, barcode: str) -> float:
+        """Stream one archive from GRIN to S3, returning GRIN's response time"""
+        file_name = f"{barcode}.tar.gz.gpg"
+        start_time = time.monotonic()
+
+        try:
+            response = self.client.download_stream(file_name)
+        except Exception as e:
+            raise GRINDownloadError(f"Error downloading content for {barcode}") from e
+
+        response_seconds = time.monotonic() - start_time
+
+        try:
+            response.raw.decode_content = True
+            self.s3_manager.upload_fileobj(
+                response.raw,
+                f"grin/{file_name}",
+                self.bucket,
+                storage_class="GLACIER_IR",
+            )
+        finally:
+            response.close()
+
+        return response_seconds
+
+    def _record_transfer(self, book: Record, transfer, concurrency) -> bool:
+        barcode = book.source_id.split("|")[0]
+
+        try:
+            concurrency.record_success(transfer.result())
+        except GRINDownloadError:
+            self.logger.exception(f"Error downloading content for {barcode}")
+            concurrency.record_failure()
+            book.grin_status.failed_download += 1
+            self.db_manager.commit_changes()
+            return False
+        except Exception:
+            self.logger.exception(f"Error uploading to s3 for {barcode}")
+            return False
+
+        # Only update the `state` when download and upload_to_S3 operations succeeded
+        book.grin_status.state = GRINState.DOWNLOADED.value
+        self.db_manager.commit_changes()
+        return True
+
     def _update_states(self, books: List[Record]):
         try:
             self.db_manager.bulk_save_objects(books)
@@ -106,8 +204,15 @@ class GRINBulkDownload:
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--batch_limit")
+    parser.add_argument(
+        "--max_workers",
+        default=1,
+        help="Upper bound on concurrent book transfers, 1 downloads books serially",
+    )
     args = parser.parse_args()
     batch_limit = int(args.batch_limit)
 
-    grin_download = GRINBulkDownload(batch_limit=batch_limit)
+    grin_download = GRINBulkDownload(
+        batch_limit=batch_limit, max_workers=int(args.max_workers)
+    )
     grin_download.runProcess()
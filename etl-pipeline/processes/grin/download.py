@@ -1,7 +1,10 @@
 from .grin_client import GRINClient
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
 from managers import DBManager, S3Manager
 from model import GRINStatus, GRINState
 from services.ssm_service import SSMService
+from threading import BoundedSemaphore, Event
 import gnupg
 import logging
 import os
@@ -11,7 +14,12 @@ import tarfile
 
 
 class GRINDownload:
-    def __init__(self, barcode):
+    # Size of the HTTP chunks read from GRIN and of each multipart upload part
+    CHUNK_SIZE = 8 * 1024 * 1024
+    UPLOAD_WORKERS = 8
+
+    def __init__(self, barcode, stream=False):
+        self.stream = stream
         self.grin_client = GRINClient()
         self.logger = logging.getLogger()
         self.s3_manager = S3Manager()
@@ -25,10 +33,215 @@ class GRINDownload:
 
     def run_process(self):
         with DBManager() as self.db_manager:
+            if self.stream:
+                self.stream_book()
+                return
+
             file_content = self.download_and_upload_book()
 
             self.unpack_and_upload_ocr_files(file_content)
 
+    def stream_book(self):
+        """Download, archive and unpack a book without holding it in memory. The GRIN
+        response is read in chunks that are copied both to a Glacier IR upload of the
+        encrypted archive and into GPG, and the decrypted tar stream is unpacked
+        straight into concurrent S3 uploads of its OCR files. Peak memory is bounded
+        by the chunk size and the number of upload workers rather than the book size.
+        """
+        grin_status = self.db_manager.session.get(GRINStatus, self.barcode)
+        file_name = f"{self.barcode}.tar.gz.gpg"
+
+        try:
+            response = self.grin_client.download_stream(file_name)
+            self.logger.info(f"Streaming {self.barcode} from GRIN")
+        except:
+            self.logger.exception(f"Error downloading content for {self.barcode}")
+            grin_status.failed_download += 1
+            self.db_manager.commit_changes()
+            return
+
+        archive_reader, archive_writer = self._open_pipe()
+        encrypted_reader, encrypted_writer = self._open_pipe()
+        decrypted_reader, decrypted_writer = self._open_pipe()
+        abort = Event()
+
+        with ThreadPoolExecutor(max_workers=3) as pipeline:
+            pump = pipeline.submit(
+                self._pump_response, response, archive_writer, encrypted_writer, abort
+            )
+            archive_upload = pipeline.submit(
+                self._upload_stream,
+                _AbortableReader(archive_reader, abort),
+                f"grin/{self.barcode}/{file_name}",
+                "GLACIER_IR",
+            )
+            decryption = pipeline.submit(
+                self._decrypt_stream, encrypted_reader, decrypted_writer, abort
+            )
+
+            try:
+                unpacked = self._unpack_stream(decrypted_reader)
+            except Exception:
+                self.logger.exception(f"Error unpacking OCR files for {self.barcode}")
+                unpacked = False
+            finally:
+                decrypted_reader.close()
+
+            try:
+                decrypted = decryption.result()
+            except Exception:
+                self.logger.exception(f"Error decrypting {self.barcode}")
+                return
+
+            try:
+                pump.result()
+                archive_upload.result()
+            except Exception:
+                self.logger.exception(f"Error uploading to s3 for {self.barcode}")
+                return
+
+        if not (decrypted and unpacked):
+            self.logger.error(f"Unable to decrypt and unpack {self.barcode}")
+            return
+
+        grin_status.state = GRINState.DOWNLOADED.value
+        self.db_manager.commit_changes()
+
+    @staticmethod
+    def _open_pipe():
+        read_fd, write_fd = os.pipe()
+        return os.fdopen(read_fd, "rb"), os.fdopen(write_fd, "wb")
+
+    def _pump_response(self, response, archive_writer, encrypted_writer, abort):
+        """Copy the response body to both pipes. A pipe whose reader stopped early
+        is dropped so that the other one still receives the whole archive, and the
+        copy stops once `abort` is set.
+        """
+        writers = [archive_writer, encrypted_writer]
+
+        try:
+            for data in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                for writer in list(writers):
+                    try:
+                        writer.write(data)
+                    except (BrokenPipeError, ValueError):
+                        writers.remove(writer)
+
+                if archive_writer not in writers:
+                    raise IOError(f"Archive upload for {self.barcode} stopped early")
+
+                if abort.is_set():
+                    raise IOError(f"Streaming {self.barcode} was aborted")
+        except BaseException:
+            # Abort before the writers close so the upload fails instead of reading a
+            # clean end of a truncated archive
+            abort.set()
+            raise
+        finally:
+            response.close()
+
+            for writer in (archive_writer, encrypted_writer):
+                try:
+                    writer.close()
+                except BrokenPipeError:
+                    pass
+
+    def _upload_stream(self, reader, key, storage_class="STANDARD"):
+        try:
+            self.s3_manager.upload_fileobj(
+                reader,
+                key,
+                self.bucket,
+                bucket_permissions=None,
+                storage_class=storage_class,
+                transfer_config=TransferConfig(
+                    multipart_threshold=self.CHUNK_SIZE,
+                    multipart_chunksize=self.CHUNK_SIZE,
+                ),
+            )
+        finally:
+            reader.close()
+
+    def _decrypt_stream(self, encrypted_reader, decrypted_writer, abort):
+        gpg = gnupg.GPG()
+        gpg.on_data = self._stream_writer(decrypted_writer)
+
+        try:
+            decrypted_content = gpg.decrypt_file(
+                encrypted_reader,
+                always_trust=True,
+                passphrase=self.ssm_service.get_parameter("grin-access-key"),
+            )
+        except Exception:
+            abort.set()
+            raise
+        finally:
+            encrypted_reader.close()
+
+            try:
+                decrypted_writer.close()
+            except BrokenPipeError:
+                pass
+
+        return decrypted_content.ok
+
+    @staticmethod
+    def _stream_writer(writer):
+        """Build a GPG output callback that writes each chunk to `writer` instead of
+        buffering it, and discards the rest once the reader has gone away.
+        """
+
+        def write_chunk(data):
+            if data and not writer.closed:
+                try:
+                    writer.write(data)
+                except (BrokenPipeError, ValueError):
+                    writer.close()
+
+            return False
+
+        return write_chunk
+
+    def _unpack_stream(self, decrypted_reader):
+        self.logger.info(f"Unpacking and uploading {self.barcode} OCR files to s3")
+
+        # Caps how many buffered OCR files can wait on an upload worker
+        pending_uploads = BoundedSemaphore(self.UPLOAD_WORKERS * 2)
+
+        def upload_buffered(content, key):
+            try:
+                self._upload_stream(io.BytesIO(content), key)
+            finally:
+                pending_uploads.release()
+
+        with (
+            ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS) as uploads,
+            tarfile.open(fileobj=decrypted_reader, mode="r|*") as tar_file,
+        ):
+            upload_futures = []
+
+            for file in tar_file:
+                if not file.isfile():
+                    continue
+
+                key = f"grin/{self.barcode}/{file.name}"
+
+                if file.size > self.CHUNK_SIZE:
+                    # Members of a tar stream must be read in order, so large files are
+                    # streamed here and rely on the multipart upload for concurrency
+                    self._upload_stream(tar_file.extractfile(file), key)
+                    continue
+
+                content = tar_file.extractfile(file).read()
+
+                pending_uploads.acquire()
+                upload_futures.append(uploads.submit(upload_buffered, content, key))
+
+            for future in upload_futures:
+                future.result()
+
+        return True
+
     def download_and_upload_book(self):
         grin_status = self.db_manager.session.get(GRINStatus, self.barcode)
         file_name = f"{self.barcode}.tar.gz.gpg"
@@ -36,7 +249,7 @@ class GRINDownload:
 
         try:
             content = self.grin_client.download(file_name)
-            self.logger.info(f"Downloading {barcode} from GRIN")
+            self.logger.info(f"Downloading {self.barcode} from GRIN")
         except:
             self.logger.exception(f"Error downloading content for {self.barcode}")
             grin_status.failed_download += 1
@@ -51,7 +264,7 @@ class GRINDownload:
                 bucket_permissions=None,
                 storage_class="GLACIER_IR",
             )
-            self.logger.info(f"Uploading {barcode} TAR to s3")
+            self.logger.info(f"Uploading {self.barcode} TAR to s3")
         except Exception as e:
             self.logger.exception(f"Error uploading to s3 for {self.barcode}")
             return
@@ -70,7 +283,7 @@ class GRINDownload:
 
         tar_stream_data = io.BytesIO(decrypted_content.data)
 
-        self.logger.info(f"Unpacking and uploading {barcode} OCR files to s3")
+        self.logger.info(f"Unpacking and uploading {self.barcode} OCR files to s3")
         try:
             with tarfile.open(fileobj=tar_stream_data, mode="r|*") as tar_file:
                 for file in tar_file:
@@ -84,11 +297,40 @@ class GRINDownload:
             print(f"Error reading stream: {e}")
 
 
+class _AbortableReader:
+    """Wraps a pipe reader so that reads fail once `abort` is set. The S3 transfer
+    then aborts its multipart upload instead of completing it with a truncated body.
+    """
+
+    def __init__(self, reader, abort):
+        self.reader = reader
+        self.abort = abort
+
+    def read(self, size=-1):
+        data = self.reader.read(size)
+
+        if self.abort.is_set():
+            raise IOError("Upload stream was aborted")
+
+        return data
+
+    def seekable(self):
+        return False
+
+    def close(self):
+        self.reader.close()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--barcode")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the book through decryption and unpacking instead of buffering it",
+    )
     args = parser.parse_args()
     barcode = int(args.barcode)
 
-    grin_download = GRINDownload(barcode)
+    grin_download = GRINDownload(barcode, stream=args.stream)
     grin_download.run_process()
@@ -43,6 +43,17 @@ class GRINClient(object):
             raise IOError("%s got %s unexpectedly" % (url, response.status_code))
         return response.content
 
+    def stream(self, fragment):
+        """Open a GET request without reading the body, so that large files can be
+        consumed in chunks through `iter_content`. The caller closes the response.
+        """
+        url = self._url(fragment)
+        response = self.session.request("GET", url, stream=True)
+        if response.status_code != 200:
+            response.close()
+            raise IOError("%s got %s unexpectedly" % (url, response.status_code))
+        return response
+
     def convert(self, barcodes):
         # Ask Google to move some barcodes from the "Available" state to "In-Process"
         # Response to process will always be a 200 and the content will a table of Barcodes and corresponding Statuses.
@@ -75,6 +86,9 @@ class GRINClient(object):
     def download(self, filename, *args, **kwargs):
         return self.get(filename, *args, **kwargs)
 
+    def download_stream(self, filename):
+        return self.stream(filename)
+
     def acquired_today(self, *args, **kwargs):
         # For GRIN queries, range start is inclusive but the range end is exclusive.
         # This means you must set the upper range to one day after the desired date
@@ -0,0 +1,144 @@
+# Set-based reconciliation of GRIN's book listings against the grin_statuses table
+
+import csv
+from datetime import datetime
+import io
+from typing import Iterable, Optional
+from uuid import uuid4
+
+from logger import create_log
+from managers import DBManager
+from model import FRBRStatus, GRINState
+
+logger = create_log(__name__)
+
+CREATE_LISTING_TABLE = """
+    CREATE TEMPORARY TABLE grin_listing (
+        barcode text PRIMARY KEY,
+        listed boolean NOT NULL,
+        converted boolean NOT NULL,
+        uuid uuid NOT NULL
+    ) ON COMMIT DROP
+"""
+
+COPY_LISTING = (
+    "COPY grin_listing (barcode, listed, converted, uuid) FROM STDIN WITH (FORMAT csv)"
+)
+
+INSERT_NEW_BOOKS = """
+    WITH new_records AS (
+        INSERT INTO records (
+            uuid, frbr_status, cluster_status, source_id, source, date_created, date_modified
+        )
+        SELECT listing.uuid, %(frbr_status)s::status_enum, false, listing.barcode || '|grin', 'grin', now(), now()
+        FROM grin_listing listing
+        WHERE listing.listed
+        AND NOT EXISTS (
+            SELECT 1 FROM records WHERE records.source_id = listing.barcode || '|grin'
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM grin_statuses WHERE grin_statuses.barcode = listing.barcode
+        )
+        RETURNING id, uuid
+    )
+    INSERT INTO grin_statuses (
+        barcode, record_id, failed_download, state, date_created, date_modified
+    )
+    SELECT
+        listing.barcode,
+        new_records.id,
+        0,
+        CASE WHEN listing.converted THEN %(converted_state)s ELSE %(new_state)s END::state,
+        %(date_created)s,
+        now()
+    FROM new_records
+    JOIN grin_listing listing ON listing.uuid = new_records.uuid
+"""
+
+UPDATE_CONVERTED_BOOKS = """
+    UPDATE grin_statuses
+    SET state = %(converted_state)s::state, date_modified = now()
+    FROM grin_listing listing
+    WHERE grin_statuses.barcode = listing.barcode
+    AND listing.converted
+    AND grin_statuses.state::text IN %(convertible_states)s
+"""
+
+
+def reconcile_listings(
+    db_manager: DBManager,
+    all_barcodes: Iterable[str],
+    converted_barcodes: Iterable[str],
+    new_state: GRINState = GRINState.PENDING_CONVERSION,
+    date_created: Optional[datetime] = None,
+) -> tuple[int, int]:
+    """Reconcile GRIN's listings with the database in a single transaction. The
+    barcodes are loaded into a temporary table with COPY, a record and status are
+    inserted for every barcode not yet tracked, and tracked books that GRIN has
+    since converted are moved to the converted state. Returns the number of books
+    added and the number of states changed. Only barcodes in `all_barcodes` are
+    added, converted barcodes outside of it only update books already tracked.
+    """
+    listed_barcodes = set(all_barcodes)
+    converted_barcodes = set(converted_barcodes)
+    listing = listed_barcodes | converted_barcodes
+
+    listing_csv = io.StringIO()
+    csv_writer = csv.writer(listing_csv)
+
+    for barcode in listing:
+        csv_writer.writerow(
+            [
+                barcode,
+                "t" if barcode in listed_barcodes else "f",
+                "t" if barcode in converted_barcodes else "f",
+                uuid4(),
+            ]
+        )
+
+    listing_csv.seek(0)
+
+    connection = db_manager.engine.raw_connection()
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(CREATE_LISTING_TABLE)
+            cursor.copy_expert(COPY_LISTING, listing_csv)
+
+            cursor.execute(
+                INSERT_NEW_BOOKS,
+                {
+                    "frbr_status": FRBRStatus.TODO.value,
+                    "converted_state": GRINState.CONVERTED.value,
+                    "new_state": new_state.value,
+                    "date_created": date_created or datetime.now(),
+                },
+            )
+            added_count = cursor.rowcount
+
+            cursor.execute(
+                UPDATE_CONVERTED_BOOKS,
+                {
+                    "converted_state": GRINState.CONVERTED.value,
+                    "convertible_states": (
+                        GRINState.PENDING_CONVERSION.value,
+                        GRINState.CONVERTING.value,
+                    ),
+                },
+            )
+            converted_count = cursor.rowcount
+
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        logger.exception(f"Failed to reconcile {len(listing)} GRIN barcodes")
+        raise
+    finally:
+        connection.close()
+
+    logger.info(
+        f"Reconciled {len(listing)} GRIN barcodes: added {added_count} books "
+        f"and marked {converted_count} as converted"
+    )
+
+    return added_count, converted_count
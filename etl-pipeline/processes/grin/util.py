@@ -13,3 +13,44 @@ def chunk(xs: Iterator, size: int) -> Iterator[list]:
                 yield chunk
 
             break
+
+
+class AdaptiveConcurrency:
+    """Additive increase, multiplicative decrease limit on concurrent GRIN requests.
+
+    The limit grows by one after each request that responds within
+    `slowdown_factor` times the smoothed response time, and halves after a failed
+    or slow request, so that the pool backs off as soon as GRIN starts to struggle.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        slowdown_factor: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.slowdown_factor = slowdown_factor
+        self.smoothing = smoothing
+
+        self.limit = min_limit
+        self.baseline = None
+
+    def record_success(self, response_seconds: float):
+        if self.baseline is None:
+            self.baseline = response_seconds
+
+        if response_seconds > self.baseline * self.slowdown_factor:
+            self._decrease()
+        else:
+            self.limit = min(self.limit + 1, self.max_limit)
+
+        self.baseline += self.smoothing * (response_seconds - self.baseline)
+
+    def record_failure(self):
+        self._decrease()
+
+    def _decrease(self):
+        self.limit = max(self.limit // 2, self.min_limit)
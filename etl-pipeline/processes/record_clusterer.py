@@ -63,16 +63,23 @@ class RecordClusterer:
                 work, stale_work_ids, records = self._get_clustered_work_and_records(
                     record
                 )
-                self._commit_changes()
+                with monitor.span("Cluster:Commit"):
+                    self._commit_changes()
 
-                self._delete_stale_works(stale_work_ids)
-                self._commit_changes()
+                with monitor.span("Cluster:DeleteStaleWorks"):
+                    stale_work_uuids = self._delete_stale_works(stale_work_ids)
+                    self._commit_changes()
+
+                self.redis_manager.invalidate_work_responses(
+                    [work.uuid, *stale_work_uuids]
+                )
 
                 logger.info(f"Clustered record: {record}")
 
-            self._update_elastic_search(
-                work_to_index=work, works_to_delete=stale_work_ids
-            )
+            with monitor.span("Cluster:IndexWork"):
+                self._update_elastic_search(
+                    work_to_index=work, works_to_delete=stale_work_ids
+                )
             logger.info(f"Indexed {work} in ElasticSearch")
 
             return records
@@ -85,7 +92,8 @@ class RecordClusterer:
 
     def _get_clustered_work_and_records(self, record: Record):
         # Identify a candidate pool of related records
-        records = self.candidate_finder.find_candidate_records(record)
+        with monitor.span("Cluster:FindCandidates"):
+            records = self.candidate_finder.find_candidate_records(record)
         record_ids = [r.id for r in records]
 
         # Group records into edition clusters
@@ -112,10 +120,15 @@ class RecordClusterer:
         self.elastic_search_manager.delete_work_records(works_to_delete)
         self._index_work_in_elastic_search(work_to_index)
 
-    def _delete_stale_works(self, work_ids: set[str]):
-        self.db_manager.delete_records_by_query(
-            self.db_manager.session.query(Work).filter(Work.id.in_(list(work_ids)))
+    def _delete_stale_works(self, work_ids: set[str]) -> list[str]:
+        stale_works = self.db_manager.session.query(Work).filter(
+            Work.id.in_(list(work_ids))
         )
+        stale_work_uuids = [uuid for (uuid,) in stale_works.with_entities(Work.uuid)]
+
+        self.db_manager.delete_records_by_query(stale_works)
+
+        return stale_work_uuids
 
     def _cluster_records(self, record: Record, records: list[Record]):
         """Groups records into clusters using KMeans clustering.
@@ -129,10 +142,20 @@ class RecordClusterer:
         in that cluster is assumed to be an edition of that work.
         """
         kmean_manager = KMeansManager(records)
+        # Managers can't import services, so each KMeans fit made while searching
+        # for the number of clusters is timed by wrapping the instance's method
+        kmean_manager.cluster = monitor.span(
+            "Cluster:KMeansFit", num_records=len(records)
+        )(kmean_manager.cluster)
+
+        with monitor.span("Cluster:KMeansCreateDF"):
+            kmean_manager.createDF()
+
+        with monitor.span("Cluster:KMeansGenerateClusters", num_records=len(records)):
+            kmean_manager.generateClusters()
 
-        kmean_manager.createDF()
-        kmean_manager.generateClusters()
-        editions = kmean_manager.parseEditions()
+        with monitor.span("Cluster:KMeansParseEditions"):
+            editions = kmean_manager.parseEditions()
 
         monitor.track_editions_identified(
             record=record,
@@ -172,11 +195,14 @@ class RecordClusterer:
             self.db_manager.session, self.constants["iso639"]
         )
 
-        work_data = record_manager.buildWork(records, editions)
+        with monitor.span("Cluster:BuildWork"):
+            work_data = record_manager.buildWork(records, editions)
 
-        record_manager.saveWork(work_data)
+        with monitor.span("Cluster:SaveWork"):
+            record_manager.saveWork(work_data)
 
-        stale_work_ids = record_manager.mergeRecords()
+        with monitor.span("Cluster:MergeWorks"):
+            stale_work_ids = record_manager.mergeRecords()
 
         return record_manager.work, stale_work_ids
 
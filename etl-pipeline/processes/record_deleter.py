@@ -3,7 +3,7 @@ from sqlalchemy.orm import joinedload
 
 from logger import create_log
 from model import Edition, Item, Record, Work
-from managers import DBManager, ElasticsearchManager, S3Manager
+from managers import DBManager, ElasticsearchManager, RedisManager, S3Manager
 
 logger = create_log(__name__)
 
@@ -14,21 +14,25 @@ class RecordDeleter:
         db_manager: DBManager,
         store_manager: S3Manager,
         es_manager: ElasticsearchManager,
+        redis_manager: RedisManager,
     ):
         self.db_manager = db_manager
         self.store_manager = store_manager
         self.es_manager = es_manager
+        self.redis_manager = redis_manager
 
     def delete_record(self, record: Record):
         self._delete_record_digital_assets(record)
-        self._update_frbr_model(record)
+        updated_work_uuids = self._update_frbr_model(record)
 
         self.db_manager.session.delete(record)
         self.db_manager.session.commit()
 
+        self.redis_manager.invalidate_work_responses(updated_work_uuids)
+
         logger.info(f"Deleted {record}")
 
-    def _update_frbr_model(self, record: Record):
+    def _update_frbr_model(self, record: Record) -> list[str]:
         items = (
             self.db_manager.session.query(Item)
             .filter(Item.record_id == record.id)
@@ -45,6 +49,7 @@ class RecordDeleter:
         deleted_work_ids = set()
         work_ids = set()
         work_ids_to_uuids = {}
+        updated_work_ids = set()
 
         for edition_id in edition_ids:
             edition = (
@@ -54,6 +59,9 @@ class RecordDeleter:
                 .first()
             )
 
+            if edition:
+                updated_work_ids.add(edition.work_id)
+
             if edition and not edition.items:
                 self.db_manager.session.delete(edition)
 
@@ -62,6 +70,13 @@ class RecordDeleter:
 
         self.db_manager.session.commit()
 
+        updated_work_uuids = [
+            uuid
+            for (uuid,) in self.db_manager.session.query(Work.uuid).filter(
+                Work.id.in_(list(updated_work_ids))
+            )
+        ]
+
         for work_id in work_ids:
             work = (
                 self.db_manager.session.query(Work)
@@ -100,6 +115,8 @@ class RecordDeleter:
                     body=work_document["_source"],
                 )
 
+        return updated_work_uuids
+
     def _delete_record_digital_assets(self, record: Record):
         for part in record.parts:
             if part.file_bucket and part.file_key:
@@ -24,15 +24,17 @@ class RecordEmbellisher:
     def embellish_record(self, record: Record) -> Record:
         work_identifiers = self._add_related_bibs(record=record)
 
-        self.record_buffer.flush()
+        with monitor.span("Embellish:FlushRecords"):
+            self.record_buffer.flush()
 
         # TODO: deprecate frbr_status
         record.frbr_status = "complete"
         record.state = RecordState.EMBELLISHED.value
         record.identifiers = record.identifiers + list(work_identifiers)
 
-        self.db_manager.session.commit()
-        self.db_manager.session.refresh(record)
+        with monitor.span("Embellish:Commit"):
+            self.db_manager.session.commit()
+            self.db_manager.session.refresh(record)
 
         logger.info(f"Embellished record: {record}")
 
@@ -67,7 +69,11 @@ class RecordEmbellisher:
                 else:
                     break
 
-            matched_bibs = self.oclc_catalog_manager.query_bibs(query=query)
+            with monitor.span(
+                "Embellish:OCLCQueryBibs",
+                title_author=self._is_title_author_query(query),
+            ):
+                matched_bibs = self.oclc_catalog_manager.query_bibs(query=query)
             bib_work_identifiers = self._add_bibs(matched_bibs)
 
             number_of_matched_bibs += len(matched_bibs)
@@ -6,6 +6,7 @@ from digital_assets import get_stored_file_url
 from logger import create_log
 from managers import DBManager, S3Manager
 from model import Record, RecordState, Part
+from services import monitor
 from services.google_drive_service import GoogleDriveService
 
 logger = create_log(__name__)
@@ -22,9 +23,10 @@ class RecordFileSaver:
         self.drive_service = GoogleDriveService()
 
     def save_record_files(self, record: Record) -> Record:
-        self.storage_manager.store_pdf_manifest(
-            record=record, bucket_name=self.file_bucket
-        )
+        with monitor.span("FileSaver:StorePDFManifest"):
+            self.storage_manager.store_pdf_manifest(
+                record=record, bucket_name=self.file_bucket
+            )
         files_to_store = (
             part
             for part in record.parts
@@ -36,22 +38,28 @@ class RecordFileSaver:
 
         record.state = RecordState.FILES_SAVED.value
 
-        self.db_manager.session.commit()
-        self.db_manager.session.refresh(record)
+        with monitor.span("FileSaver:Commit"):
+            self.db_manager.session.commit()
+            self.db_manager.session.refresh(record)
 
         return record
 
     def store_file(self, part: Part):
         try:
             if "drive.google.com" in part.source_url:
-                self._store_file_from_drive(part)
+                with monitor.span("FileSaver:StoreDriveFile"):
+                    self._store_file_from_drive(part)
             elif part.source_file_key and part.source_file_bucket:
-                self._copy_file(part)
+                with monitor.span("FileSaver:CopyFile"):
+                    self._copy_file(part)
             else:
-                file_contents = self.get_file_contents(part.source_url)
-                self.storage_manager.put_object(
-                    file_contents, part.file_key, part.file_bucket
-                )
+                with monitor.span("FileSaver:DownloadFile"):
+                    file_contents = self.get_file_contents(part.source_url)
+
+                with monitor.span("FileSaver:PutFile"):
+                    self.storage_manager.put_object(
+                        file_contents, part.file_key, part.file_bucket
+                    )
                 del file_contents
 
                 if ".epub" in part.file_key:
@@ -54,6 +54,7 @@ class RecordPipelineProcess:
             db_manager=self.db_manager,
             store_manager=self.storage_manager,
             es_manager=self.es_manager,
+            redis_manager=self.redis_manager,
         )
 
     def runProcess(self, max_attempts: int = 10):
@@ -85,22 +86,32 @@ class RecordPipelineProcess:
 
             self.db_manager.create_session()
 
-            record = (
-                self.db_manager.session.query(Record)
-                .filter(Record.source_id == source_id)
-                .filter(Record.source == source)
-                .first()
-            )
+            with monitor.span("RecordPipeline:LoadRecord"):
+                record = (
+                    self.db_manager.session.query(Record)
+                    .filter(Record.source_id == source_id)
+                    .filter(Record.source == source)
+                    .first()
+                )
 
             if record is None:
                 raise Exception(f"{source} record with source_id {source_id} not found")
 
-            record_with_files = self.record_file_saver.save_record_files(record)
-            embellished_record = self.record_embellisher.embellish_record(
-                record_with_files
-            )
-            clustered_records = self.record_clusterer.cluster_record(embellished_record)
-            self.link_fulfiller.fulfill_records_links(clustered_records)
+            with monitor.span("RecordPipeline:SaveFiles", source=source):
+                record_with_files = self.record_file_saver.save_record_files(record)
+
+            with monitor.span("RecordPipeline:Embellish", source=source):
+                embellished_record = self.record_embellisher.embellish_record(
+                    record_with_files
+                )
+
+            with monitor.span("RecordPipeline:Cluster", source=source):
+                clustered_records = self.record_clusterer.cluster_record(
+                    embellished_record
+                )
+
+            with monitor.span("RecordPipeline:FulfillLinks", source=source):
+                self.link_fulfiller.fulfill_records_links(clustered_records)
 
             self.sqs_manager.acknowledge_message_processed(receipt_handle)
         except Exception:
@@ -0,0 +1,80 @@
+import os
+
+from api.automaticCollectionUtils import materializeAutomaticCollection
+from api.db import DBClient
+from api.elastic import ElasticClient
+from logger import create_log
+from managers import DBManager, ElasticsearchManager, RedisManager
+from model import AutomaticCollection
+
+logger = create_log(__name__)
+
+
+class AutomaticCollectionRefreshProcess:
+    """Runs the saved search of every automatic collection and stores its ordered
+    works in Redis, so that collection feeds page over the stored works rather than
+    searching on each request. Stored works expire after MAX_AGE seconds, which
+    bounds how stale a feed can be if this process stops running.
+    """
+
+    MAX_AGE = 60 * 60 * 6
+    MAX_WORKS = 1000
+
+    def __init__(self, *args):
+        self.max_age = int(os.environ.get("AUTOMATIC_COLLECTION_MAX_AGE", self.MAX_AGE))
+        self.max_works = int(
+            os.environ.get("AUTOMATIC_COLLECTION_MAX_WORKS", self.MAX_WORKS)
+        )
+
+        self.db_manager = DBManager()
+
+        self.redis_manager = RedisManager()
+        self.redis_manager.create_client()
+
+        self.elastic_search_manager = ElasticsearchManager()
+        self.elastic_search_manager.create_elastic_connection()
+
+    def runProcess(self):
+        try:
+            self.db_manager.create_session()
+
+            # The API queries are reused so the stored order matches the live feeds
+            db_client = DBClient(self.db_manager.engine)
+            db_client.session = self.db_manager.session
+
+            automatic_collections = db_client.session.query(AutomaticCollection).all()
+
+            refreshed_count = 0
+
+            for automatic_collection in automatic_collections:
+                try:
+                    self.refresh_collection(db_client, automatic_collection)
+                    refreshed_count += 1
+                except Exception:
+                    logger.exception(
+                        f"Unable to refresh automatic collection {automatic_collection.collection_id}"
+                    )
+
+            logger.info(
+                f"Refreshed {refreshed_count} of {len(automatic_collections)} automatic collections"
+            )
+        except Exception as e:
+            logger.exception("Failed to refresh automatic collections")
+            raise e
+        finally:
+            self.db_manager.close_connection()
+
+    def refresh_collection(self, db_client, automatic_collection):
+        total_count, work_editions = materializeAutomaticCollection(
+            db_client,
+            ElasticClient(self.redis_manager.client),
+            automatic_collection,
+            self.max_works,
+        )
+
+        self.redis_manager.set_automatic_collection_works(
+            automatic_collection.collection_id,
+            work_editions,
+            total_count,
+            self.max_age,
+        )
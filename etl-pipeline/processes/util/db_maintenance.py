@@ -2,6 +2,7 @@ from sqlalchemy import text
 
 from logger import create_log
 from managers import DBManager
+from model import REFRESH_PREFERRED_EDITIONS
 
 logger = create_log(__name__)
 
@@ -25,6 +26,7 @@ class DatabaseMaintenanceProcess:
             self.db_manager.create_session()
 
             self.vacuum_tables()
+            self.refresh_preferred_editions()
 
             logger.info("Database maintenance complete")
         except Exception as e:
@@ -43,3 +45,9 @@ class DatabaseMaintenanceProcess:
             for table_name in self.VACUUMING_TABLES:
                 logger.info(f"Vacuuming {table_name} table")
                 db_connnection.execute(text(f"VACUUM ANALYZE {table_name};"))
+
+    def refresh_preferred_editions(self):
+        logger.info("Refreshing preferred editions")
+
+        with self.db_manager.engine.begin() as db_connection:
+            db_connection.execute(REFRESH_PREFERRED_EDITIONS)
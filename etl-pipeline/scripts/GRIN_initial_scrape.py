@@ -1,17 +1,14 @@
-from datetime import datetime
 from logger import create_log
-from typing import List, Iterator
-from model import GRINState, GRINStatus, Record, FRBRStatus
+from model import GRINStatus
 from managers import DBManager
-from uuid import uuid4
 from processes.grin.grin_client import GRINClient
-from processes.grin.util import chunk
+from processes.grin.reconciliation import reconcile_listings
 import argparse
 
 logger = create_log(__name__)
 
 
-def main(batch_limit=1000):
+def main(batch_limit=None):
     grin_client = GRINClient()
     with DBManager() as db_manager:
         url = grin_client._url(
@@ -22,61 +19,54 @@ def main(batch_limit=1000):
         response = grin_client.session.request("GET", url, timeout=600)
         response.raise_for_status()
 
-        barcodes = response.content.decode("utf8").strip().split("\n")
+        barcodes = parse_barcodes(response.content.decode("utf8").strip().split("\n"))
+
+        if batch_limit:
+            barcodes = barcodes[: int(batch_limit)]
+
         if len(barcodes) > 0:
+            # converted file names have the following pattern 1234.tar.gz.gpg
+            converted_barcodes = parse_barcodes(
+                file_name.split(".", 1)[0]
+                for file_name in grin_client.converted_filenames()
+            )
+
             insert_into_db(
-                barcodes=barcodes, db_manager=db_manager, chunk_size=batch_limit
+                barcodes=barcodes,
+                converted_barcodes=converted_barcodes,
+                db_manager=db_manager,
             )
         else:
             logger.info("No record found")
 
 
-def insert_into_db(barcodes: List[str], db_manager: DBManager, chunk_size: int):
+def parse_barcodes(rows) -> list[str]:
+    return [row.split("\t", 1)[0].strip() for row in rows if row.strip()]
+
+
+def insert_into_db(
+    barcodes: list[str], converted_barcodes: list[str], db_manager: DBManager
+):
     logger.info(f"Processing {len(barcodes)} barcodes")
 
-    for chunked_barcodes in chunk(iter(barcodes), chunk_size):
-        new_records: List[Record] = []
-        for barcode in chunked_barcodes:
-            existing_record = (
-                db_manager.session.query(Record)
-                .filter(Record.source_id == f"{barcode}|grin")
-                .first()
-            )
-            if not existing_record:
-                new_records.append(
-                    Record(
-                        uuid=uuid4(),
-                        frbr_status=FRBRStatus.TODO.value,
-                        source_id=f"{barcode}|grin",
-                        source="grin",
-                        grin_status=GRINStatus(
-                            barcode=barcode,
-                            failed_download=0,
-                            state=GRINState.PENDING_CONVERSION.value,
-                            date_created=datetime(1991, 8, 25),
-                        ),
-                    )
-                )
-        logger.info(f"Inserting {len(new_records)} barcodes into Record")
-
-        try:
-            db_manager.session.add_all(new_records)
-            db_manager.commit_changes()
-        except Exception:
-            logger.exception(f"Failed to insert barcodes: {chunked_barcodes}")
-            raise
-
-        break
+    reconcile_listings(
+        db_manager,
+        barcodes,
+        converted_barcodes,
+        date_created=GRINStatus.backfill_timestamp(),
+    )
+
     logger.info("Complete.")
 
 
 if __name__ == "__main__":
     try:
         parser = argparse.ArgumentParser()
-        parser.add_argument("--batch_limit")
+        parser.add_argument(
+            "--batch_limit", help="Only reconcile the first batch_limit barcodes"
+        )
         args = parser.parse_args()
-        batch_limit = int(args.batch_limit)
 
-        main(batch_limit)
+        main(args.batch_limit)
     except Exception as e:
         logger.exception(e, exc_info=True)
@@ -7,12 +7,19 @@ from digital_assets.utils.get_stored_file_url import get_stored_file_url
 from load_env import load_env_file
 from model import Collection, Edition, Link
 from managers import DBManager
+from managers.pdf_cover_generator import PDFCoverGenerator
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--profile", default="")
     parser.add_argument("--env", default="qa")
+    parser.add_argument(
+        "--generate",
+        action="store_true",
+        help="Generate missing covers from the editions' PDFs",
+    )
+    parser.add_argument("--max_workers", type=int, default=8)
     args = parser.parse_args()
     env = args.env
     load_env_file(f"local-{env}", file_string="config/{}.yaml")
@@ -33,6 +40,7 @@ def main():
         )
         .one()
     )
+    missing_covers = {}
     for edition in collection.editions:
         links_by_url = {link.url: link for link in edition.links}
         for identifier in edition.identifiers:
@@ -44,6 +52,13 @@ def main():
             if cover_url in links_by_url:
                 continue
             if not cover_exists(s3, bucket, cover_key):
+                pdf_url = find_pdf_url(edition)
+                if args.generate and pdf_url:
+                    missing_covers.setdefault(pdf_url, []).append(
+                        (edition, cover_key, cover_url)
+                    )
+                    continue
+
                 print(f"Cover not found for hathi id {hathi_id}")
                 continue
 
@@ -52,6 +67,45 @@ def main():
 
         db_manager.session.commit()
 
+    if missing_covers:
+        generate_covers(db_manager, s3, bucket, missing_covers, args.max_workers)
+
+
+def generate_covers(db_manager, s3, bucket, missing_covers, max_workers):
+    covers = PDFCoverGenerator.extract_covers(
+        missing_covers.keys(), max_workers=max_workers
+    )
+
+    # Editions can share a PDF, so each PDF's cover is extracted once and uploaded
+    # for every edition waiting on it
+    for pdf_url, cover in covers:
+        for edition, cover_key, cover_url in missing_covers[pdf_url]:
+            if cover is None:
+                print(f"Unable to generate cover {cover_key} from {pdf_url}")
+                continue
+
+            cover.seek(0)
+            s3.upload_fileobj(
+                Bucket=bucket,
+                Key=cover_key,
+                Fileobj=cover,
+                ExtraArgs={"ACL": "public-read", "ContentType": "image/png"},
+            )
+
+            link = Link(url=cover_url, media_type="image/png", flags={"cover": True})
+            edition.links.append(link)
+
+    db_manager.session.commit()
+
+
+def find_pdf_url(edition):
+    for item in edition.items:
+        for link in item.links:
+            if link.media_type == "application/pdf":
+                return link.url
+
+    return None
+
 
 def cover_exists(s3, bucket, cover_key) -> bool:
     try:
@@ -1,29 +1,37 @@
 import argparse
-import io
-import traceback
 
 import boto3
-import PIL
 
-from digital_assets import cover_images
+from digital_assets.cover_pipeline import CoverResizePipeline
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--profile", default="")
+    parser.add_argument("--resize_workers", type=int, default=None)
     args = parser.parse_args()
     session = boto3.Session(profile_name=args.profile)
     s3 = session.client("s3")
-    for cover in list_covers(s3):
-        key = cover["Key"]
-        print(f"Processing {key}")
-        try:
-            resize_cover(s3, cover["Key"])
-        except Exception as e:
-            print(f"Resize failed: {str(e)}")
-            traceback.print_exc()
-        else:
-            print("Resize succeeded")
+
+    pipeline = CoverResizePipeline(
+        s3, "drb-files-qa", resize_workers=args.resize_workers
+    )
+    result = pipeline.run(cover["Key"] for cover in list_covers(s3))
+
+    print(
+        f"Resized {len(result.resized)} covers, skipped {len(result.skipped)} unchanged"
+    )
+    for key in result.failed:
+        print(f"Resize failed: {key}")
+
+    # While we're here, let's throw these in prod too
+    for key in result.resized:
+        s3.copy(
+            CopySource={"Bucket": "drb-files-qa", "Key": key},
+            Bucket="drb-files-production",
+            Key=key,
+            ExtraArgs={"ACL": "public-read"},
+        )
 
 
 def list_covers(s3):
@@ -37,30 +45,5 @@ def list_covers(s3):
             yield cover_object
 
 
-def resize_cover(s3, key: str) -> None:
-    image_stream = io.BytesIO()
-    print("Downloading cover")
-    s3.download_fileobj(Bucket="drb-files-qa", Key=key, Fileobj=image_stream)
-    image = PIL.Image.open(image_stream)
-    cover = cover_images.resize_image_for_cover(image)
-    cover_stream = io.BytesIO()
-    cover.save(cover_stream, format=image.format)
-    cover_stream.seek(0)
-    print("Uploading resized cover")
-    s3.upload_fileobj(
-        Bucket="drb-files-qa",
-        Key=key,
-        Fileobj=cover_stream,
-        ExtraArgs={"ACL": "public-read"},
-    )
-    # While we're here, let's throw these in prod too
-    s3.copy(
-        CopySource={"Bucket": "drb-files-qa", "Key": key},
-        Bucket="drb-files-production",
-        Key=key,
-        ExtraArgs={"ACL": "public-read"},
-    )
-
-
 if __name__ == "__main__":
     main()
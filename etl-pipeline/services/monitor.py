@@ -1,6 +1,21 @@
+from collections import defaultdict
+from contextlib import ContextDecorator
+import atexit
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
 import newrelic.agent
 from model import Record
 
+_current_span = contextvars.ContextVar("monitor_span", default=None)
+_timing_exporters = None
+_timing_exporters_lock = threading.Lock()
+
 
 def record_event(event_name: str, data: dict):
     newrelic.agent.record_custom_event(event_name, data)
@@ -84,3 +99,161 @@ def track_records_ingested(number_of_records: int, source: str):
     data = {"number_of_records": number_of_records, "source": source}
 
     record_event(event_name, data)
+
+
+def track_pool_checkout_wait(pool_name: str, wait_time: float):
+    newrelic.agent.record_custom_metric(
+        f"Custom/ConnectionPool/{pool_name}/CheckoutWait", wait_time
+    )
+
+
+class Span(ContextDecorator):
+    """Times a block of code and records its duration under name, as a context
+    manager or a decorator:
+
+        with monitor.span("Cluster:CandidateHop", hop=1):
+            ...
+
+        @monitor.span("Cluster:KMeans")
+        def cluster(...):
+            ...
+
+    Durations are recorded as New Relic custom metrics, which New Relic keeps as
+    count, total, min and max per harvest, and are passed to any local exporters
+    configured with TIMING_EXPORT along with the span's attributes and parent.
+    """
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self.parent = None
+        self.duration = None
+
+    def _recreate_cm(self):
+        # Each decorated call gets its own span so calls can nest and run in threads
+        return Span(self.name, **self.attributes)
+
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self)
+        self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.duration = time.perf_counter() - self._start
+        _current_span.reset(self._token)
+
+        record_timing(
+            self.name,
+            self.duration,
+            parent=self.parent.name if self.parent else None,
+            error=exc_type is not None,
+            **self.attributes,
+        )
+
+        return False
+
+
+def span(name: str, **attributes) -> Span:
+    return Span(name, **attributes)
+
+
+def record_timing(name: str, duration: float, **attributes):
+    newrelic.agent.record_custom_metric(f"Custom/Timing/{name}", duration)
+
+    for exporter in _get_timing_exporters():
+        exporter.export(name, duration, attributes)
+
+
+class StdoutTimingExporter:
+    """Writes each timing to stdout as a line of JSON."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+
+    def export(self, name: str, duration: float, attributes: dict):
+        timing = json.dumps(
+            {"span": name, "duration_ms": round(duration * 1000, 3), **attributes},
+            default=str,
+        )
+
+        with self.lock:
+            self.stream.write(f"{timing}\n")
+
+    def flush(self):
+        self.stream.flush()
+
+
+class JSONTimingExporter:
+    """Collects timings and writes a summary of each span's durations to a JSON
+    file when flushed, for profiling runs offline."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.durations = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def export(self, name: str, duration: float, attributes: dict):
+        with self.lock:
+            self.durations[name].append(duration)
+
+    def summarize(self) -> dict:
+        with self.lock:
+            durations_by_span = {
+                name: sorted(durations) for name, durations in self.durations.items()
+            }
+
+        return {
+            name: {
+                "count": len(durations),
+                "total_ms": round(sum(durations) * 1000, 3),
+                "mean_ms": round(sum(durations) / len(durations) * 1000, 3),
+                "p50_ms": round(_percentile(durations, 0.5) * 1000, 3),
+                "p95_ms": round(_percentile(durations, 0.95) * 1000, 3),
+                "max_ms": round(durations[-1] * 1000, 3),
+            }
+            for name, durations in durations_by_span.items()
+        }
+
+    def flush(self):
+        with open(self.path, "w") as summary_file:
+            json.dump(self.summarize(), summary_file, indent=2)
+
+
+def add_timing_exporter(exporter):
+    _get_timing_exporters().append(exporter)
+
+
+def _get_timing_exporters() -> list:
+    global _timing_exporters
+
+    if _timing_exporters is None:
+        with _timing_exporters_lock:
+            if _timing_exporters is None:
+                _timing_exporters = _create_timing_exporters(
+                    os.environ.get("TIMING_EXPORT")
+                )
+
+    return _timing_exporters
+
+
+def _create_timing_exporters(timing_export: Optional[str]) -> list:
+    if not timing_export:
+        return []
+
+    if timing_export == "stdout":
+        exporter = StdoutTimingExporter()
+    else:
+        exporter = JSONTimingExporter(timing_export)
+
+    atexit.register(exporter.flush)
+
+    return [exporter]
+
+
+def _percentile(sorted_values: list, percentile: float) -> float:
+    return sorted_values[
+        min(int(len(sorted_values) * percentile), len(sorted_values) - 1)
+    ]
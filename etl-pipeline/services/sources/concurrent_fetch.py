@@ -0,0 +1,131 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+from urllib.parse import urlparse
+
+from logger import create_log
+
+logger = create_log(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_HOST_CONCURRENCY = 8
+
+_END_OF_PAGES = object()
+
+
+class HostLimiter:
+    """Caps the number of simultaneous requests made to any single host."""
+
+    def __init__(self, max_per_host: int = DEFAULT_HOST_CONCURRENCY):
+        self.max_per_host = max_per_host
+        self._host_limits = {}
+        self._host_overrides = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, host: str, max_requests: int):
+        with self._lock:
+            self._host_overrides[host] = max_requests
+            self._host_limits.pop(host, None)
+
+    @contextmanager
+    def limit(self, url: str):
+        host_semaphore = self._get_semaphore(urlparse(url).netloc)
+
+        with host_semaphore:
+            yield
+
+    def _get_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(
+                    self._host_overrides.get(host, self.max_per_host)
+                )
+
+            return self._host_limits[host]
+
+
+host_limiter = HostLimiter()
+
+
+def prefetch(pages: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """Iterates pages on a background thread, keeping up to depth pages ready.
+
+    Pages are yielded in the order the source produces them. Exceptions raised
+    by the source are re-raised to the consumer, and closing the returned
+    generator stops the background thread after its current fetch.
+    """
+    page_queue = queue.Queue(maxsize=max(1, depth))
+    stop_event = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                page_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _produce():
+        try:
+            for page in pages:
+                if not _put((page, None)):
+                    return
+
+            _put((_END_OF_PAGES, None))
+        except BaseException as e:
+            _put((_END_OF_PAGES, e))
+
+    producer = threading.Thread(target=_produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            page, error = page_queue.get()
+
+            if error is not None:
+                raise error
+
+            if page is _END_OF_PAGES:
+                return
+
+            yield page
+    finally:
+        stop_event.set()
+
+
+def map_in_order(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 8,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[R]:
+    """Applies func to items on a thread pool and yields results in input order.
+
+    At most max_in_flight calls (default twice the worker count) are submitted
+    ahead of the consumer, so memory stays bounded for unbounded inputs.
+    """
+    max_in_flight = max_in_flight or max_workers * 2
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    in_flight = deque()
+
+    try:
+        for item in items:
+            in_flight.append(executor.submit(func, item))
+
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+        executor.shutdown(wait=False)
@@ -1,4 +1,6 @@
 from datetime import datetime
+import html
+import re
 from typing import Optional, Generator
 import requests
 from io import BytesIO
@@ -6,16 +8,32 @@ from lxml import etree
 
 from constants.get_constants import get_constants
 from logger import create_log
+from managers import RedisManager
 from mappings.base_mapping import MappingError
 from mappings.xml import XMLMapping
 from model import Record
+from .concurrent_fetch import host_limiter, prefetch
+from .resume_checkpoints import ResumeCheckpoints
 from .source_service import SourceService
 
 logger = create_log(__name__)
 
+OAI_PAGE_SIZE = 100
+# DSpace expires resumption tokens long before a week, so checkpoints are only
+# kept for about as long as a token stays valid
+RESUMPTION_TOKEN_TTL = 60 * 60
+# The resumption token is the last element of a ListRecords page
+TOKEN_SCAN_SIZE = 8 * 1024
+
+RESUMPTION_TOKEN_PATTERN = re.compile(
+    rb"<(?:[\w-]+:)?resumptionToken\b[^>]*?(?:/>|>([^<]*)<)"
+)
+OAI_ERROR_PATTERN = re.compile(rb"<(?:[\w-]+:)?error\b[^>]*?\bcode=[\"']([^\"']+)")
+
 
 class DSpaceService(SourceService):
-    ROOT_NAMESPACE = {None: "http://www.openarchives.org/OAI/2.0/"}
+    OAI_NAMESPACE = "http://www.openarchives.org/OAI/2.0/"
+    ROOT_NAMESPACE = {None: OAI_NAMESPACE}
     OAI_NAMESPACES = {
         "oai_dc": "http://www.openarchives.org/OAI/2.0/oai_dc/",
         "dc": "http://purl.org/dc/elements/1.1/",
@@ -33,36 +51,21 @@ class DSpaceService(SourceService):
         self.source_mapping = source_mapping
         self.source_identifier = source_identifier
 
+        self.redis_manager = RedisManager()
+        self.redis_manager.create_client()
+
     def get_records(
         self,
         start_timestamp: Optional[datetime] = None,
         offset: int = 0,
         limit: Optional[int] = None,
     ) -> Generator[Record, None, None]:
-        resumption_token = None
-        record_index = 0
         record_count = 0
 
-        while resumption_token is not None or record_index <= offset:
-            oai_file = self.download_records(
-                start_timestamp=start_timestamp, resumption_token=resumption_token
-            )
-            resumption_token = self.get_resumption_token(oai_file)
-
-            if offset is not None and record_index <= offset:
-                record_index += 100
-                continue
-
-            oaidc_records = etree.parse(oai_file)
-
-            all_records = oaidc_records.findall(
-                ".//record", namespaces=self.ROOT_NAMESPACE
-            )
-
-            for record in all_records:
-                if record is None:
-                    continue
-
+        for oai_file in prefetch(
+            self._download_pages(start_timestamp=start_timestamp, offset=offset)
+        ):
+            for record in self._iter_records(oai_file):
                 try:
                     parsed_record = self.parse_record(record)
 
@@ -77,6 +80,61 @@ class DSpaceService(SourceService):
                 except Exception:
                     logger.error(f"Error parsing DSpace record {record}")
 
+    def _iter_records(self, oai_file: BytesIO) -> Generator[etree._Element, None, None]:
+        for _, record in etree.iterparse(
+            oai_file, events=("end",), tag=f"{{{self.OAI_NAMESPACE}}}record"
+        ):
+            yield record
+
+            # Free mapped records so only the current record stays in memory
+            record.clear()
+            while record.getprevious() is not None:
+                del record.getparent()[0]
+
+    def _download_pages(
+        self, start_timestamp: Optional[datetime] = None, offset: int = 0
+    ) -> Generator[BytesIO, None, None]:
+        harvest_from = (
+            start_timestamp.strftime("%Y-%m-%d") if start_timestamp else "all"
+        )
+        checkpoints = ResumeCheckpoints(
+            self.redis_manager, name=f"dspace/{self.base_url}/{harvest_from}"
+        )
+        resumption_token, record_index = checkpoints.load(offset=offset or 0)
+        resumed = resumption_token is not None
+
+        while True:
+            oai_file = self.download_records(
+                start_timestamp=start_timestamp, resumption_token=resumption_token
+            )
+
+            try:
+                resumption_token = self.get_resumption_token(oai_file)
+            except OAIError as e:
+                if not (resumed and e.code == "badResumptionToken"):
+                    raise e
+
+                logger.warning(
+                    f"Saved resumption token for {self.base_url} expired, harvesting from the start"
+                )
+                checkpoints.clear()
+                resumption_token, record_index, resumed = None, 0, False
+                continue
+
+            resumed = False
+
+            if record_index + OAI_PAGE_SIZE > (offset or 0):
+                yield oai_file
+
+            record_index += OAI_PAGE_SIZE
+
+            if resumption_token is None:
+                break
+
+            checkpoints.save(
+                record_index, resumption_token, expiration_time=RESUMPTION_TOKEN_TTL
+            )
+
     def parse_record(self, record):
         try:
             parsed_record = self.source_mapping(record, self.OAI_NAMESPACES)
@@ -101,15 +159,56 @@ class DSpaceService(SourceService):
             except Exception as e:
                 logger.error(f"Error parsing DSpace record {oaidc_record}")
 
-    def get_resumption_token(self, oai_file):
-        try:
-            oai_XML = etree.parse(oai_file)
-            return oai_XML.find(
-                ".//resumptionToken", namespaces=self.ROOT_NAMESPACE
-            ).text
-        except AttributeError:
+    def get_resumption_token(self, oai_file: BytesIO) -> Optional[str]:
+        """Reads the resumption token from the end of a ListRecords page without
+        parsing the records before it. Raises OAIError if the page is an OAI-PMH
+        error response, other than one for a harvest with no records."""
+        with oai_file.getbuffer() as content:
+            tail = bytes(content[-TOKEN_SCAN_SIZE:])
+
+        if b"ListRecords>" not in tail:
+            oai_error = OAI_ERROR_PATTERN.search(tail)
+
+            if oai_error is None:
+                return self._scan_resumption_token(oai_file)
+
+            error_code = oai_error.group(1).decode("utf-8")
+
+            if error_code == "noRecordsMatch":
+                return None
+
+            raise OAIError(error_code, f"{self.base_url} returned {error_code}")
+
+        token_matches = list(RESUMPTION_TOKEN_PATTERN.finditer(tail))
+
+        if not token_matches:
+            return None
+
+        token = token_matches[-1].group(1)
+
+        if not token or not token.strip():
             return None
 
+        return html.unescape(token.decode("utf-8").strip())
+
+    def _scan_resumption_token(self, oai_file: BytesIO) -> Optional[str]:
+        # Pages whose tail could not be read are scanned in full, clearing each
+        # element so the page tree is not kept
+        resumption_token = None
+
+        try:
+            oai_file.seek(0)
+
+            for _, element in etree.iterparse(oai_file, events=("end",)):
+                if element.tag == f"{{{self.OAI_NAMESPACE}}}resumptionToken":
+                    resumption_token = element.text or None
+
+                element.clear()
+
+            return resumption_token
+        finally:
+            oai_file.seek(0)
+
     def download_records(
         self, start_timestamp: Optional[datetime], resumption_token=None
     ):
@@ -131,16 +230,25 @@ class DSpaceService(SourceService):
         url = f"{self.base_url}{url_params}"
 
         # Warning: bypassing verification of SSL certs is a security concern. However, some sources do not keep their DSpace SSL cert up to date.
-        response = requests.get(
-            url, stream=True, timeout=30, headers=headers, verify=False
-        )
+        with host_limiter.limit(url):
+            response = requests.get(
+                url, stream=True, timeout=30, headers=headers, verify=False
+            )
 
         if response.status_code == 200:
-            content = bytes()
+            content = BytesIO()
 
             for chunk in response.iter_content(1024 * 100):
-                content += chunk
+                content.write(chunk)
 
-            return BytesIO(content)
+            content.seek(0)
+
+            return content
 
         raise Exception(f"Received {response.status_code} status code from {url}")
+
+
+class OAIError(Exception):
+    def __init__(self, code: str, message=None):
+        self.code = code
+        self.message = message
@@ -3,18 +3,25 @@ from lxml import etree
 import os
 import re
 import requests
+import threading
 import yaml
 import time
 from typing import Optional, Generator
 
 from constants.get_constants import get_constants
+from managers import RedisManager
 from mappings.gutenberg import GutenbergMapping
 from model import Record
+from .concurrent_fetch import map_in_order, prefetch
+from .resume_checkpoints import ResumeCheckpoints
 from .source_service import SourceService
 from logger import create_log
 
 logger = create_log(__name__)
 
+FILE_BATCH_SIZE = 25
+RATE_LIMIT_RESERVE = 100
+
 
 class GutenbergService(SourceService):
     GUTENBERG_NAMESPACES = {
@@ -26,7 +33,7 @@ class GutenbergService(SourceService):
         "pgterms": "http://www.gutenberg.org/2009/pgterms/",
     }
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
         self.github_api_key = os.environ.get("GITHUB_API_KEY")
         self.github_api_root = "https://api.github.com/graphql"
 
@@ -34,6 +41,12 @@ class GutenbergService(SourceService):
 
         self.requests_remaining = None
         self.request_limit_reset = None
+        self.rate_limit_lock = threading.Lock()
+
+        self.max_workers = max_workers
+
+        self.redis_manager = RedisManager()
+        self.redis_manager.create_client()
 
         yaml.add_multi_constructor("!", GutenbergService.default_ctor)
 
@@ -43,11 +56,45 @@ class GutenbergService(SourceService):
         offset: int = 0,
         limit: Optional[int] = None,
     ) -> Generator[Record, None, None]:
-        current_position = 0
+        record_count = 0
+
+        for data_files in prefetch(
+            self._get_data_file_pages(start_timestamp=start_timestamp, offset=offset)
+        ):
+            for work_id, rdf_text, yaml_text in data_files:
+                parsed_data_files = self.parse_data_files(work_id, rdf_text, yaml_text)
+
+                if parsed_data_files is None:
+                    continue
+
+                rdf_file, yaml_file = parsed_data_files
+                gutenberg_record = GutenbergMapping(
+                    rdf_file, self.GUTENBERG_NAMESPACES, self.constants, yaml_file
+                )
+                gutenberg_record.applyMapping()
+                record_count += 1
+
+                yield gutenberg_record.record
+
+                if limit is not None and record_count >= limit:
+                    return
+
+    def _get_data_file_pages(
+        self, start_timestamp: Optional[datetime] = None, offset: int = 0
+    ) -> Generator[list, None, None]:
         page_size = 100
 
+        # Cursors are only stable for the complete ingest, which orders by creation date
+        checkpoints = (
+            ResumeCheckpoints(self.redis_manager, name="gutenberg/created_at")
+            if start_timestamp is None
+            else None
+        )
+        cursor, current_position = (
+            checkpoints.load(offset=offset or 0) if checkpoints else (None, 0)
+        )
+
         has_next_page = True
-        cursor = None
 
         while has_next_page:
             repository_data, has_next_page, cursor = self.get_repositories(
@@ -58,25 +105,15 @@ class GutenbergService(SourceService):
                 cursor=cursor,
             )
 
-            if offset and current_position + page_size <= offset:
-                continue
-
-            data_files = self.get_data_files_for_respositories(
-                respository_data=repository_data
-            )
-
-            for rdf_file, yaml_file in data_files:
-                gutenberg_record = GutenbergMapping(
-                    rdf_file, self.GUTENBERG_NAMESPACES, self.constants, yaml_file
+            if not offset or current_position + page_size > offset:
+                yield self.get_data_files_for_respositories(
+                    respository_data=repository_data
                 )
-                gutenberg_record.applyMapping()
-                current_position += 1
 
-                yield gutenberg_record.record
+            current_position += page_size
 
-                if limit is not None and current_position >= limit:
-                    has_next_page = False
-                    break
+            if checkpoints and has_next_page and cursor:
+                checkpoints.save(current_position, cursor)
 
     def get_repositories(
         self,
@@ -134,7 +171,7 @@ class GutenbergService(SourceService):
         )
 
     def get_data_files_for_respositories(self, respository_data: list) -> list:
-        data_files = []
+        repositories = []
 
         for repo in respository_data:
             repo_id = re.search(r"_([0-9]+)$", repo.get("name"))
@@ -142,39 +179,59 @@ class GutenbergService(SourceService):
             if not repo_id:
                 continue
 
-            work_id = repo_id.group(1)
-            data_file = self.get_repository_data_files(work_id, repo)
+            repositories.append((repo_id.group(1), repo))
 
-            if data_file:
-                data_files.append(data_file)
+        repository_batches = [
+            repositories[i : i + FILE_BATCH_SIZE]
+            for i in range(0, len(repositories), FILE_BATCH_SIZE)
+        ]
 
-        return data_files
+        return [
+            data_file
+            for data_files in map_in_order(
+                self.get_repository_data_files,
+                repository_batches,
+                max_workers=self.max_workers,
+            )
+            for data_file in data_files
+        ]
 
-    def get_repository_data_files(self, work_id: str, repo) -> Optional[tuple]:
-        rdf_query = """\
-            {{\
-                repository(owner:"GITenberg", name:"{name}"){{\
+    def get_repository_data_files(self, repositories: list[tuple[str, dict]]) -> list:
+        repository_queries = "".join(
+            """\
+                repo{index}: repository(owner:"GITenberg", name:"{name}"){{\
                     rdf: object(expression:"{master}"){{id, ... on Blob {{text}}}}\
                     yaml: object(expression:"master:metadata.yaml"){{id, ... on Blob {{text}}}}\
                 }}\
-            }}\
-        """.format(name=repo.get("name"), master=f"master:pg{work_id}.rdf")
+            """.format(
+                index=index, name=repo.get("name"), master=f"master:pg{work_id}.rdf"
+            )
+            for index, (work_id, repo) in enumerate(repositories)
+        )
 
-        rdf_response = self.query_graphql(rdf_query)
+        rdf_response = self.query_graphql(f"{{{repository_queries}}}")
+        response_data = rdf_response.get("data") or {}
 
-        repository = rdf_response.get("data", {}).get("repository", {})
-        rdf_data = repository.get("rdf", {})
-        yaml_data = repository.get("yaml", {})
+        data_files = []
 
-        if rdf_data is None:
-            return None
+        for index, (work_id, _) in enumerate(repositories):
+            repository = response_data.get(f"repo{index}") or {}
+            rdf_data = repository.get("rdf")
+            yaml_data = repository.get("yaml")
 
-        rdf_text = rdf_data.get("text") if rdf_data else None
-        yaml_text = yaml_data.get("text") if yaml_data else None
+            rdf_text = rdf_data.get("text") if rdf_data else None
+            yaml_text = yaml_data.get("text") if yaml_data else None
 
-        if rdf_text is None:
-            return None
+            if rdf_text is None:
+                continue
 
+            data_files.append((work_id, rdf_text, yaml_text))
+
+        return data_files
+
+    def parse_data_files(
+        self, work_id: str, rdf_text: str, yaml_text: Optional[str]
+    ) -> Optional[tuple]:
         try:
             return (
                 self.parse_rdf(rdf_text=rdf_text),
@@ -194,8 +251,7 @@ class GutenbergService(SourceService):
         return yaml.full_load(yaml_text)
 
     def query_graphql(self, query, retries: int = 3):
-        if self.requests_remaining == 0:
-            self.wait_until_request_limit_reset()
+        self.pace_requests()
 
         for _ in range(retries):
             graphql_response = requests.post(
@@ -217,12 +273,27 @@ class GutenbergService(SourceService):
         )
 
     def set_rate_limit_fields(self, graphql_response):
-        self.requests_remaining = int(
-            graphql_response.headers.get("X-RateLimit-Remaining", 1)
-        )
-        self.request_limit_reset = int(
-            graphql_response.headers.get("X-RateLimit-Reset", time.time() + 3600)
-        )
+        with self.rate_limit_lock:
+            self.requests_remaining = int(
+                graphql_response.headers.get("X-RateLimit-Remaining", 1)
+            )
+            self.request_limit_reset = int(
+                graphql_response.headers.get("X-RateLimit-Reset", time.time() + 3600)
+            )
+
+    def pace_requests(self):
+        with self.rate_limit_lock:
+            requests_remaining = self.requests_remaining
+            request_limit_reset = self.request_limit_reset
+
+        if requests_remaining is None:
+            return
+
+        if requests_remaining == 0:
+            self.wait_until_request_limit_reset()
+        elif requests_remaining < RATE_LIMIT_RESERVE:
+            # Spread the remaining budget evenly over the time left in the window
+            time.sleep(max(0, request_limit_reset - time.time()) / requests_remaining)
 
     def wait_until_request_limit_reset(self):
         wait_duration = max(0, self.request_limit_reset - int(time.time()))
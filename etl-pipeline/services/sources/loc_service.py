@@ -6,6 +6,7 @@ import requests
 
 from mappings.loc import map_loc_record
 from model import Record
+from .concurrent_fetch import host_limiter, prefetch
 from .source_service import SourceService
 from logger import create_log
 
@@ -40,15 +41,11 @@ class LOCService(SourceService):
         limit: Optional[int] = None,
     ) -> Generator[Record, None, None]:
         record_count = 0
-        page_number = 0
-        completed_import = False
 
         try:
-            while (
-                page_json_data := self._fetch_page_json_data(
-                    page_url=f"{loc_collection_url}&sp={page_number}"
-                )
-            ) is not None:
+            for page_json_data in prefetch(
+                self._fetch_pages(loc_collection_url=loc_collection_url)
+            ):
                 for record_data in page_json_data.get("results", []):
                     if start_timestamp:
                         record_timestamp = datetime.strptime(
@@ -56,8 +53,7 @@ class LOCService(SourceService):
                         )
 
                         if record_timestamp < start_timestamp:
-                            completed_import = True
-                            break
+                            return
 
                     loc_record = map_loc_record(source_record=record_data)
 
@@ -66,26 +62,33 @@ class LOCService(SourceService):
                         record_count += 1
 
                     if limit and record_count >= limit:
-                        completed_import = True
-                        break
-
-                if completed_import:
-                    break
-
-                page_number += 1
-                time.sleep(5)
+                        return
         except Exception:
             logger.exception(f"Failed to import LOC records from: {loc_collection_url}")
             return
 
+    def _fetch_pages(self, loc_collection_url: str) -> Generator[dict, None, None]:
+        page_number = 0
+
+        while (
+            page_json_data := self._fetch_page_json_data(
+                page_url=f"{loc_collection_url}&sp={page_number}"
+            )
+        ) is not None:
+            yield page_json_data
+
+            page_number += 1
+            time.sleep(5)
+
     def _fetch_page_json_data(self, page_url: str) -> Optional[dict]:
         max_attempts = 3
 
         for attempt in (0, max_attempts):
             try:
-                page_response = requests.get(
-                    page_url, headers={"Accept": "application/json"}
-                )
+                with host_limiter.limit(page_url):
+                    page_response = requests.get(
+                        page_url, headers={"Accept": "application/json"}
+                    )
 
                 # If we exceed the last page, a bad request will be returned
                 if page_response.status_code == 400:
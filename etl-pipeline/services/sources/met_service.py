@@ -5,6 +5,7 @@ from typing import Generator, Optional, Union
 from logger import create_log
 from mappings.met import map_met_record
 from model import Record
+from .concurrent_fetch import host_limiter, map_in_order, prefetch
 from .source_service import SourceService
 
 logger = create_log(__name__)
@@ -17,8 +18,8 @@ class METService(SourceService):
     COMPOUND_QUERY = "https://libmma.contentdm.oclc.org/digital/bl/dmwebservices/index.php?q=dmGetCompoundObjectInfo/p15324coll10/{}/json"
     IMAGE_QUERY = "https://libmma.contentdm.oclc.org/digital/api/singleitem/collection/p15324coll10/id/{}"
 
-    def __init__(self):
-        pass
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
 
     def get_records(
         self,
@@ -26,36 +27,57 @@ class METService(SourceService):
         offset: int = 0,
         limit: Optional[int] = None,
     ) -> Generator[Record, None, None]:
-        current_position = offset
         page_size = 50
 
-        while met_records := self._get_met_records(
-            page_size=page_size, current_position=current_position
-        ):
-            for record in met_records:
-                modified_at = record.get("dmmodified")
-                rights = record.get("rights")
+        candidate_records = (
+            record
+            for met_records in prefetch(
+                self._get_met_pages(page_size=page_size, offset=offset, limit=limit)
+            )
+            for record in met_records
+            if self._is_candidate_record(record, start_timestamp)
+        )
 
-                if (
-                    start_timestamp
-                    and datetime.strptime(modified_at, "%Y-%m-%d") >= start_timestamp
-                ) or "copyright" in rights.lower():
-                    continue
+        for mapped_met_record in map_in_order(
+            self._map_met_record, candidate_records, max_workers=self.max_workers
+        ):
+            if mapped_met_record is not None:
+                yield mapped_met_record
 
-                mapped_met_record = self._map_met_record(record)
+    def _get_met_pages(
+        self, page_size: int, offset: int = 0, limit: Optional[int] = None
+    ) -> Generator[list, None, None]:
+        current_position = offset
 
-                if mapped_met_record is not None:
-                    yield mapped_met_record
+        while met_records := self._get_met_records(
+            page_size=page_size, current_position=current_position
+        ):
+            yield met_records
 
             if limit and current_position >= limit:
                 break
 
             current_position += page_size
 
+    def _is_candidate_record(
+        self, record: dict, start_timestamp: Optional[datetime] = None
+    ) -> bool:
+        modified_at = record.get("dmmodified")
+        rights = record.get("rights")
+
+        return not (
+            (
+                start_timestamp
+                and datetime.strptime(modified_at, "%Y-%m-%d") >= start_timestamp
+            )
+            or "copyright" in rights.lower()
+        )
+
     def query_met_api(self, query: str, method: str = "GET") -> Union[str, dict]:
         method = method.upper()
 
-        response = requests.request(method, query, timeout=30)
+        with host_limiter.limit(query):
+            response = requests.request(method, query, timeout=30)
 
         response.raise_for_status()
 
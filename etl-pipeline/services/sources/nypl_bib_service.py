@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 import os
 import requests
 from typing import Generator, Optional
@@ -8,6 +9,7 @@ from logger import create_log
 from managers.db import DBManager
 from managers.nypl_api import NYPLAPIManager
 from mappings.nypl import NYPLMapping
+from .concurrent_fetch import map_in_order, prefetch
 from .source_service import SourceService
 from sqlalchemy import text
 from model import Record
@@ -15,9 +17,12 @@ from model import Record
 
 logger = create_log(__name__)
 
+BIB_PAGE_SIZE = 1000
+LOOKUP_CACHE_SIZE = 100000
+
 
 class NYPLBibService(SourceService):
-    def __init__(self):
+    def __init__(self, max_workers: int = 8):
         self.bib_db_connection = DBManager(
             user=os.environ["NYPL_BIB_USER"],
             pswd=os.environ["NYPL_BIB_PSWD"],
@@ -35,39 +40,91 @@ class NYPLBibService(SourceService):
 
         self.constants = get_constants()
 
+        self.max_workers = max_workers
+        self.lccn_copyright_status = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(
+            self._query_lccn_copyright_status
+        )
+
     def get_records(
         self,
         start_timestamp: datetime = None,
         offset: int = 0,
         limit: Optional[int] = None,
     ) -> Generator[Record, None, None]:
+        bibs = (
+            bib
+            for bib_page in prefetch(
+                self.fetch_bib_pages(
+                    start_timestamp=start_timestamp, offset=offset, limit=limit
+                )
+            )
+            for bib in bib_page
+            if bib["var_fields"] is not None
+        )
+
+        for nypl_bib_record in map_in_order(
+            self.parse_nypl_bib, bibs, max_workers=self.max_workers
+        ):
+            if nypl_bib_record:
+                yield nypl_bib_record.record
+
+    def fetch_bib_pages(
+        self,
+        start_timestamp: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Generator[list[dict], None, None]:
         nypl_bib_query = "SELECT * FROM bib WHERE publish_year <= 1965"
+        query_params = {}
 
         if start_timestamp:
-            nypl_bib_query += " and updated_date > "
-            nypl_bib_query += "'{}'".format(
-                start_timestamp.strftime("%Y-%m-%dT%H:%M:%S%z")
+            nypl_bib_query += " AND updated_date > :start_timestamp"
+            query_params["start_timestamp"] = start_timestamp.strftime(
+                "%Y-%m-%dT%H:%M:%S%z"
             )
 
-        if offset:
-            nypl_bib_query += f" OFFSET {offset}"
-
-        if limit:
-            nypl_bib_query += f" LIMIT {limit}"
+        last_key = None
+        bib_count = 0
 
-        with self.bib_db_connection.engine.connect() as db_connection:
-            bib_results = db_connection.execution_options(stream_results=True).execute(
-                text(nypl_bib_query)
+        while limit is None or bib_count < limit:
+            page_query = nypl_bib_query
+            page_params = dict(query_params)
+            page_size = (
+                BIB_PAGE_SIZE
+                if limit is None
+                else min(BIB_PAGE_SIZE, limit - bib_count)
             )
 
-            for bib_result_mapping in bib_results.mappings():
-                if bib_result_mapping["var_fields"] is None:
-                    continue
+            # Seek past the last bib of the previous page rather than paging with OFFSET
+            if last_key is not None:
+                page_query += " AND (nypl_source, id) > (:last_source, :last_id)"
+                page_params["last_source"], page_params["last_id"] = last_key
+
+            page_query += " ORDER BY nypl_source, id LIMIT :page_size"
+            page_params["page_size"] = page_size
+
+            if offset and last_key is None:
+                page_query += " OFFSET :offset"
+                page_params["offset"] = offset
 
-                nypl_bib_record = self.parse_nypl_bib(bib_result_mapping)
+            with self.bib_db_connection.engine.connect() as db_connection:
+                bib_page = [
+                    dict(bib_mapping)
+                    for bib_mapping in db_connection.execute(
+                        text(page_query), page_params
+                    ).mappings()
+                ]
 
-                if nypl_bib_record:
-                    yield nypl_bib_record.record
+            if not bib_page:
+                break
+
+            yield bib_page
+
+            bib_count += len(bib_page)
+            last_key = (bib_page[-1]["nypl_source"], bib_page[-1]["id"])
+
+            if len(bib_page) < page_size:
+                break
 
     def parse_nypl_bib(self, bib) -> Optional[NYPLMapping]:
         try:
@@ -126,6 +183,9 @@ class NYPLBibService(SourceService):
 
         lccn_no = lccn_data[0]["subfields"][0]["content"].replace("sn", "").strip()
 
+        return self.lccn_copyright_status(lccn_no)
+
+    def _query_lccn_copyright_status(self, lccn_no: str) -> bool:
         copyright_url = f"{self.cce_api}/lccn/{lccn_no}"
 
         copyright_response = requests.get(copyright_url)
@@ -8,6 +8,7 @@ from logger import create_log
 from mappings.publisher_backlist import PublisherBacklistMapping
 from model import Record
 from services.ssm_service import SSMService
+from .concurrent_fetch import host_limiter, prefetch
 from .source_service import SourceService
 
 logger = create_log(__name__)
@@ -29,14 +30,9 @@ class PublisherBacklistService(SourceService):
         offset: Optional[int] = None,
         limit: Optional[int] = None,
     ) -> Generator[Record, None, None]:
-        filter_by_formula = self._build_filter_by_formula_parameter(start_timestamp)
-        url = f"{BASE_URL}&pageSize={PAGE_SIZE}{filter_by_formula}"
-        headers = {"Authorization": f"Bearer {self.airtable_auth_token}"}
         record_count = 0
 
-        while response := requests.get(url, headers=headers):
-            response_data = response.json()
-
+        for response_data in prefetch(self._get_pages(start_timestamp)):
             for record in response_data.get("records", []):
                 try:
                     record_metadata = record.get("fields")
@@ -55,6 +51,24 @@ class PublisherBacklistService(SourceService):
                         f"Failed to process Publisher Backlist record: {record_metadata}"
                     )
 
+    def _get_pages(
+        self, start_timestamp: Optional[datetime] = None
+    ) -> Generator[dict, None, None]:
+        filter_by_formula = self._build_filter_by_formula_parameter(start_timestamp)
+        url = f"{BASE_URL}&pageSize={PAGE_SIZE}{filter_by_formula}"
+        headers = {"Authorization": f"Bearer {self.airtable_auth_token}"}
+
+        while True:
+            with host_limiter.limit(url):
+                response = requests.get(url, headers=headers)
+
+            if not response:
+                break
+
+            response_data = response.json()
+
+            yield response_data
+
             if "offset" not in response_data:
                 break
 
@@ -0,0 +1,53 @@
+from typing import Optional
+
+from logger import create_log
+from managers import RedisManager
+from managers.redis import ONE_WEEK
+
+logger = create_log(__name__)
+
+
+class ResumeCheckpoints:
+    """Stores source paging cursors by record position so offset ingests can resume."""
+
+    def __init__(self, redis_manager: RedisManager, name: str):
+        self.redis_manager = redis_manager
+        self.key = f"{redis_manager.environment}/checkpoints/{name}"
+
+    def load(self, offset: int) -> tuple[Optional[str], int]:
+        if not offset:
+            return None, 0
+
+        try:
+            checkpoints = self.redis_manager.client.hgetall(self.key)
+        except Exception:
+            logger.warning(f"Unable to load resume checkpoints for {self.key}")
+            return None, 0
+
+        resumable_positions = [
+            int(position) for position in checkpoints if int(position) <= offset
+        ]
+
+        if not resumable_positions:
+            return None, 0
+
+        position = max(resumable_positions)
+
+        logger.info(f"Resuming {self.key} from record {position}")
+
+        return checkpoints[str(position).encode("utf-8")].decode("utf-8"), position
+
+    def save(self, position: int, cursor: str, expiration_time: int = ONE_WEEK):
+        try:
+            pipe = self.redis_manager.client.pipeline()
+            pipe.hset(self.key, position, cursor)
+            pipe.expire(self.key, expiration_time)
+            pipe.execute()
+        except Exception:
+            logger.warning(f"Unable to save resume checkpoint for {self.key}")
+
+    def clear(self):
+        try:
+            self.redis_manager.client.delete(self.key)
+        except Exception:
+            logger.warning(f"Unable to clear resume checkpoints for {self.key}")
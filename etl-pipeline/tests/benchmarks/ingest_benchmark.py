@@ -0,0 +1,324 @@
+"""Per-source ingest throughput benchmark.
+
+Replicates the fixtures in tests/fixtures into large synthetic volumes and runs them
+through each source mapping and, unless --mapping-only is set, through RecordIngestor
+and RecordBuffer against the local Postgres and LocalStack SQS from docker-compose.
+
+    python -m tests.benchmarks.ingest_benchmark --env local --copies 5000 --sources doab loc
+"""
+
+import argparse
+from bs4 import BeautifulSoup
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, ExitStack
+import json
+from lxml import etree
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from typing import Callable, Iterator
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from pymarc import parse_xml_to_array
+
+from model import Record, Source
+from services.sources.dspace_service import DSpaceService
+
+FIXTURES = "tests/fixtures"
+BENCHMARK_SOURCE_ID_TAG = "benchmark"
+CLACSO_PDF_LINK = '<a href="/bitstream/CLACSO/16936/1/benchmark.pdf">PDF</a>'
+
+
+class StageTimer:
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.totals[name] += time.perf_counter() - start
+            self.calls[name] += 1
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+
+        return timed
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _load_json(file_name: str) -> dict:
+    with open(f"{FIXTURES}/{file_name}") as fixture:
+        return json.load(fixture)
+
+
+def _load_oai_records(file_name: str) -> list:
+    return etree.parse(f"{FIXTURES}/{file_name}").findall(
+        ".//record", namespaces=DSpaceService.ROOT_NAMESPACE
+    )
+
+
+def _map_doab(record) -> Record:
+    from mappings.doab import DOABMapping
+
+    return DOABMapping(record, DSpaceService.OAI_NAMESPACES).record
+
+
+def _map_clacso(record) -> Record:
+    from mappings.clacso import CLACSOMapping
+
+    return CLACSOMapping(record, DSpaceService.OAI_NAMESPACES).record
+
+
+def _map_publisher_backlist(fields: dict) -> Record:
+    from mappings.publisher_backlist import PublisherBacklistMapping
+
+    publisher_record = PublisherBacklistMapping(fields)
+    publisher_record.applyMapping()
+
+    return publisher_record.record
+
+
+def _parse_muse_page(html: str) -> Record:
+    from managers import MUSEManager
+
+    record = Record(source_id="42", has_part=[])
+    muse_manager = MUSEManager(record, "https://muse.jhu.edu/book/42", "text/html")
+
+    with patch.object(MUSEManager, "load_muse_page", return_value=html):
+        muse_manager.parse_muse_page()
+
+    muse_manager.identify_readable_versions()
+
+    return record
+
+
+def _parse_springer_page(html: str) -> Record:
+    from managers.parsers import SpringerParser
+
+    record = Record(source_id="9783642208973", identifiers=[], has_part=[])
+    springer_parser = SpringerParser(
+        "https://springer.com/gp/book/9783642208973", "text/html", record
+    )
+
+    with patch("managers.parsers.springer_parser.requests.get") as mock_get:
+        mock_get.return_value = MagicMock(status_code=200, text=html)
+        springer_parser.find_oa_link()
+
+    return record
+
+
+def _read_text(file_name: str) -> str:
+    with open(f"{FIXTURES}/{file_name}") as fixture:
+        return fixture.read()
+
+
+def source_benchmarks() -> dict:
+    from mappings.loc import map_loc_record
+    from mappings.marc_record import map_marc_record
+    from mappings.met import map_met_record
+    from mappings.oclc_bib import map_oclc_record
+
+    with open(f"{FIXTURES}/grin-mets.xml", "rb") as grin_file:
+        grin_records = parse_xml_to_array(grin_file)
+
+    return {
+        "doab": (_load_oai_records("test-doab.xml"), _map_doab),
+        "clacso": (_load_oai_records("test-clacso.xml"), _map_clacso),
+        "loc": ([_load_json("test-loc.json")], map_loc_record),
+        "met": ([_load_json("test-met.json")], map_met_record),
+        "oclc": ([_load_json("test-oclc.json")], map_oclc_record),
+        "grin": (
+            grin_records,
+            lambda marc_record: map_marc_record(marc_record, source=Source.GRIN),
+        ),
+        "publisher_backlist": (
+            [_load_json("test-publisher-backlist-record.json")],
+            _map_publisher_backlist,
+        ),
+        "muse": ([_read_text("muse_book_42.html")], _parse_muse_page),
+        "springer": (
+            [_read_text("springer_book_9783642208973.html")],
+            _parse_springer_page,
+        ),
+    }
+
+
+def network_stand_ins() -> ExitStack:
+    """Replaces outbound link lookups made during mapping with no-op stand-ins."""
+    stand_ins = ExitStack()
+    stand_ins.enter_context(patch("mappings.doab.DOABMapping._get_links"))
+    # CLACSO records without a PDF part are not mapped, so the handle page lookup
+    # returns a PDF link and the PDF check succeeds
+    stand_ins.enter_context(
+        patch(
+            "mappings.clacso.CLACSOMapping._get_links",
+            side_effect=lambda url: BeautifulSoup(
+                CLACSO_PDF_LINK, "html.parser"
+            ).find_all("a"),
+        )
+    )
+    stand_ins.enter_context(
+        patch("mappings.clacso.requests.head", return_value=MagicMock(status_code=200))
+    )
+    stand_ins.enter_context(patch("mappings.doab.S3Manager"))
+
+    return stand_ins
+
+
+def synthetic_records(
+    fixtures: list, map_source: Callable, copies: int, timer: StageTimer
+) -> Iterator[Record]:
+    for copy in range(copies):
+        for fixture in fixtures:
+            with timer.stage("map"):
+                record = map_source(fixture)
+
+            if record is None:
+                continue
+
+            record.uuid = uuid4()
+            record.source_id = f"{record.source_id}-{BENCHMARK_SOURCE_ID_TAG}-{copy}"
+
+            yield record
+
+
+def run_benchmark(source: str, copies: int, mapping_only: bool) -> dict:
+    fixtures, map_source = source_benchmarks()[source]
+    timer = StageTimer()
+    start = time.perf_counter()
+
+    with network_stand_ins():
+        records = synthetic_records(fixtures, map_source, copies, timer)
+
+        if mapping_only:
+            record_count = sum(1 for _ in records)
+        else:
+            from processes import RecordIngestor
+
+            record_ingestor = RecordIngestor(source=source)
+            record_buffer = record_ingestor.record_buffer
+            record_buffer.add = timer.wrap("buffer_add", record_buffer.add)
+            record_buffer.db_manager.bulk_save_objects = timer.wrap(
+                "bulk_save", record_buffer.db_manager.bulk_save_objects
+            )
+            record_ingestor.sqs_manager.send_message_to_queue = timer.wrap(
+                "sqs_send", record_ingestor.sqs_manager.send_message_to_queue
+            )
+
+            record_count = record_ingestor.ingest(records)
+
+            _delete_benchmark_records(record_buffer.db_manager)
+
+    elapsed = time.perf_counter() - start
+
+    if not record_count:
+        raise Exception(f"No {source} records were mapped from the fixtures")
+
+    return {
+        "source": source,
+        "records": record_count,
+        "seconds": round(elapsed, 3),
+        "records_per_second": round(record_count / elapsed, 1) if elapsed else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "stages": {
+            name: {"seconds": round(total, 3), "calls": timer.calls[name]}
+            for name, total in timer.totals.items()
+        },
+    }
+
+
+def run_isolated_benchmark(source: str, copies: int, mapping_only: bool) -> dict:
+    # ru_maxrss is a high-water mark for the whole process, so each source runs in a
+    # fresh process for its peak RSS to be its own
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(run_benchmark, source, copies, mapping_only).result()
+
+
+def _delete_benchmark_records(db_manager):
+    db_manager.session.query(Record).filter(
+        Record.source_id.like(f"%-{BENCHMARK_SOURCE_ID_TAG}-%")
+    ).delete(synchronize_session=False)
+    db_manager.session.commit()
+
+
+def print_report(results: list[dict]):
+    print(
+        f"{'source':<20}{'records':>10}{'seconds':>10}{'rec/sec':>12}{'peak MB':>10}  stages"
+    )
+
+    for result in results:
+        stages = ", ".join(
+            f"{name}={stage['seconds']}s" for name, stage in result["stages"].items()
+        )
+        print(
+            f"{result['source']:<20}{result['records']:>10}{result['seconds']:>10}"
+            f"{result['records_per_second']:>12}{result['peak_rss_mb']:>10}  {stages}"
+        )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark ingest throughput")
+    parser.add_argument("--env", default="local", help="Config file to load")
+    parser.add_argument(
+        "--sources",
+        nargs="*",
+        default=None,
+        help="Sources to benchmark, defaults to all fixtures",
+    )
+    parser.add_argument(
+        "--copies", type=int, default=1000, help="Times to replicate each fixture"
+    )
+    parser.add_argument(
+        "--mapping-only",
+        action="store_true",
+        help="Skip RecordIngestor so no Postgres or SQS is required",
+    )
+    parser.add_argument(
+        "--queue",
+        default="test-queue",
+        help="SQS queue that receives ingest messages during the benchmark",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parsed_args = parser.parse_args(args)
+
+    if not parsed_args.mapping_only:
+        from load_env import load_env_file
+
+        load_env_file(parsed_args.env, file_string=f"config/{parsed_args.env}.yaml")
+        os.environ["RECORD_PIPELINE_SQS_QUEUE"] = parsed_args.queue
+
+    os.environ.setdefault("FILE_BUCKET", "drb-files-local")
+    os.environ.setdefault("PDF_BUCKET", "ump-pdf-repository-local")
+
+    sources = parsed_args.sources or list(source_benchmarks().keys())
+    results = [
+        run_isolated_benchmark(source, parsed_args.copies, parsed_args.mapping_only)
+        for source in sources
+    ]
+
+    if parsed_args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""OPDS2 feed rendering benchmark.
+
+Maps the JSON fixtures in tests/fixtures into in-memory works, builds an OPDS2 feed of
+--publications publications from them and times constructing the feed and rendering it
+to a JSON response through APIUtils.formatOPDS2Object. No database or search cluster is
+required.
+
+    python -m tests.benchmarks.opds_benchmark --publications 100 --iterations 50
+"""
+
+import argparse
+from datetime import date, datetime, timezone
+import json
+import os
+import statistics
+import time
+from uuid import uuid4
+
+from model import Edition, Identifier, Item, Link, Record, Rights, Work
+from tests.benchmarks.ingest_benchmark import _load_json
+
+PUBLICATION_FEED_PATH = "/opds/new"
+
+
+def fixture_records() -> list[Record]:
+    from mappings.loc import map_loc_record
+    from mappings.met import map_met_record
+    from mappings.oclc_bib import map_oclc_record
+
+    return [
+        map_loc_record(_load_json("test-loc.json")),
+        map_met_record(_load_json("test-met.json")),
+        map_oclc_record(_load_json("test-oclc.json")),
+    ]
+
+
+def _split(value: str, fields: int) -> list:
+    parts = value.split("|")
+    return parts + [""] * (fields - len(parts))
+
+
+def build_work(record: Record, copy: int) -> Work:
+    created = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    identifiers = [
+        Identifier(identifier=value, authority=authority)
+        for value, authority, *_ in (
+            _split(identifier, 2) for identifier in record.identifiers or []
+        )
+    ]
+
+    links = []
+    for part in record.has_part or []:
+        _, url, _, media_type, flags = _split(part, 5)
+        links.append(
+            Link(
+                id=copy,
+                url=url,
+                media_type=media_type,
+                flags=json.loads(flags or "{}"),
+            )
+        )
+
+    rights = []
+    if record.rights:
+        source, license, statement, *_ = _split(record.rights, 3)
+        rights.append(
+            Rights(source=source, license=license, rights_statement=statement)
+        )
+
+    authors = [
+        {"name": name, "viaf": viaf, "lcnaf": lcnaf, "primary": primary}
+        for name, viaf, lcnaf, primary, *_ in (
+            _split(author, 4) for author in record.authors or []
+        )
+    ]
+    contributors = [
+        {"name": name, "roles": [role]}
+        for name, _, _, role, *_ in (
+            _split(contributor, 4) for contributor in record.contributors or []
+        )
+    ]
+    languages = [
+        {"language": language, "iso_2": iso_2, "iso_3": iso_3}
+        for language, iso_2, iso_3, *_ in (
+            _split(language, 3) for language in record.languages or []
+        )
+    ]
+
+    edition = Edition(
+        id=copy,
+        title=record.title,
+        alt_titles=record.alternative or [],
+        publication_date=date(2000, 1, 1),
+        publication_place=record.spatial,
+        summary=record.abstract,
+        publishers=[{"name": _split(p, 1)[0]} for p in record.publisher or []],
+        contributors=contributors,
+        languages=languages,
+        identifiers=identifiers,
+        items=[Item(source=record.source, links=links, rights=rights)],
+        date_created=created,
+        date_modified=created,
+    )
+
+    return Work(
+        uuid=uuid4(),
+        title=f"{record.title} {copy}",
+        alt_titles=record.alternative or [],
+        authors=authors,
+        contributors=contributors,
+        languages=languages,
+        subjects=[
+            {"heading": _split(subject, 1)[0]} for subject in record.subjects or []
+        ],
+        identifiers=identifiers,
+        editions=[edition],
+        date_created=created,
+        date_modified=created,
+    )
+
+
+def build_feed(works: list):
+    from api.blueprints.drbOPDS2 import addPublications, constructBaseFeed
+
+    feed = constructBaseFeed(
+        PUBLICATION_FEED_PATH, "New Publications: Digital Research Books"
+    )
+    addPublications(feed, works)
+
+    return feed
+
+
+def run_benchmark(publications: int, iterations: int) -> dict:
+    from api.app import FlaskAPI
+    from api.utils import APIUtils
+
+    records = fixture_records()
+    works = [
+        build_work(records[copy % len(records)], copy) for copy in range(publications)
+    ]
+
+    api = FlaskAPI(None, None)
+    build_times = []
+    render_times = []
+
+    with api.app.test_request_context(PUBLICATION_FEED_PATH):
+        for _ in range(iterations):
+            start = time.perf_counter()
+            feed = build_feed(works)
+            built = time.perf_counter()
+            response, _ = APIUtils.formatOPDS2Object(200, feed)
+            rendered = time.perf_counter()
+
+            build_times.append(built - start)
+            render_times.append(rendered - built)
+
+    return {
+        "publications": publications,
+        "iterations": iterations,
+        "response_bytes": len(response.get_data()),
+        "json_provider": type(api.app.json).__name__,
+        "build_ms": round(statistics.median(build_times) * 1000, 3),
+        "render_ms": round(statistics.median(render_times) * 1000, 3),
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark OPDS2 feed rendering")
+    parser.add_argument(
+        "--publications", type=int, default=100, help="Publications in the feed"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=50, help="Times to build and render the feed"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parsed_args = parser.parse_args(args)
+
+    os.environ.setdefault("READER_VERSION", "v2")
+    os.environ.setdefault("ENVIRONMENT", "local")
+    os.environ.setdefault("DEFAULT_COVER_URL", "https://example.com/cover.png")
+
+    result = run_benchmark(parsed_args.publications, parsed_args.iterations)
+
+    if parsed_args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            "{publications} publications, {response_bytes} bytes via {json_provider}: "
+            "build {build_ms}ms, render {render_ms}ms (median of {iterations})".format(
+                **result
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -120,3 +120,22 @@ def test_search_readable_format_flags(endpoint, test_title):
 
         if is_downloadable:
             assert flags.get("downloadable", False)
+
+
+def test_search_paging_through_cursor(test_title):
+    endpoint = "/search?query=keyword:{keyword}&page={page}&size=2"
+    seen_works = []
+
+    # Pages after the first are served from the cursor stored by the page before
+    for page in range(1, 5):
+        url = os.getenv("DRB_API_URL") + endpoint.format(
+            keyword=quote(test_title), page=page
+        )
+        response = requests.get(url)
+
+        assert_response_status(url, response, 200)
+
+        works = response.json().get("data", {}).get("works", [])
+        seen_works.extend(work["uuid"] for work in works)
+
+    assert len(seen_works) == len(set(seen_works))
@@ -0,0 +1,70 @@
+import pytest
+
+from model import GRINState
+from processes.grin.bulk_download import GRINBulkDownload
+
+
+class TestGRINBulkDownload:
+    @pytest.fixture
+    def test_instance(self, mocker):
+        mocker.patch("processes.grin.bulk_download.GRINClient")
+        mocker.patch("processes.grin.bulk_download.S3Manager")
+
+        test_instance = GRINBulkDownload(max_workers=4)
+        test_instance.db_manager = mocker.MagicMock()
+
+        return test_instance
+
+    def _mock_book(self, mocker, barcode):
+        book = mocker.MagicMock(source_id=f"{barcode}|grin")
+        book.grin_status.failed_download = 0
+
+        return book
+
+    def test_transfer_books_concurrently(self, test_instance, mocker):
+        books = [self._mock_book(mocker, barcode) for barcode in range(6)]
+
+        test_instance.download_and_upload_books(books)
+
+        assert test_instance.client.download_stream.call_count == 6
+        test_instance.client.download_stream.assert_any_call("5.tar.gz.gpg")
+        test_instance.s3_manager.upload_fileobj.assert_any_call(
+            test_instance.client.download_stream.return_value.raw,
+            "grin/5.tar.gz.gpg",
+            test_instance.bucket,
+            storage_class="GLACIER_IR",
+        )
+        assert all(
+            book.grin_status.state == GRINState.DOWNLOADED.value for book in books
+        )
+        assert test_instance.db_manager.commit_changes.call_count == 6
+
+    def test_transfer_books_concurrently_failures(self, test_instance, mocker):
+        books = [self._mock_book(mocker, barcode) for barcode in range(3)]
+        download_response = mocker.MagicMock()
+
+        def mock_download_stream(file_name):
+            if file_name == "0.tar.gz.gpg":
+                raise IOError("GRIN unavailable")
+
+            return download_response
+
+        test_instance.client.download_stream.side_effect = mock_download_stream
+        test_instance.s3_manager.upload_fileobj.side_effect = [
+            Exception("upload failed"),
+            None,
+        ]
+
+        test_instance.download_and_upload_books(books)
+
+        assert books[0].grin_status.failed_download == 1
+        assert books[0].grin_status.state != GRINState.DOWNLOADED.value
+
+        downloaded_books = [
+            book
+            for book in books[1:]
+            if book.grin_status.state == GRINState.DOWNLOADED.value
+        ]
+        assert len(downloaded_books) == 1
+        assert download_response.close.call_count == 2
+        assert test_instance.db_manager.commit_changes.call_count == 2
@@ -0,0 +1,168 @@
+import gnupg
+import io
+import pytest
+import requests
+import shutil
+import tarfile
+import threading
+
+from model import GRINState
+from processes.grin.download import GRINDownload
+
+
+@pytest.mark.skipif(shutil.which("gpg") is None, reason="requires the gpg binary")
+class TestGRINDownload:
+    PASSPHRASE = "test-access-key"
+
+    @pytest.fixture
+    def gpg(self, tmp_path):
+        return gnupg.GPG(gnupghome=str(tmp_path))
+
+    @pytest.fixture
+    def test_instance(self, mocker, gpg):
+        mocker.patch("processes.grin.download.GRINClient")
+        mocker.patch("processes.grin.download.S3Manager")
+        mocker.patch("processes.grin.download.SSMService")
+        mocker.patch("processes.grin.download.gnupg.GPG", return_value=gpg)
+
+        test_instance = GRINDownload(1234, stream=True)
+        test_instance.ssm_service.get_parameter.return_value = self.PASSPHRASE
+        test_instance.db_manager = mocker.MagicMock()
+
+        test_instance.uploads = {}
+
+        def mock_upload(fileobj, key, bucket, **kwargs):
+            test_instance.uploads[key] = fileobj.read()
+
+        test_instance.s3_manager.upload_fileobj.side_effect = mock_upload
+
+        return test_instance
+
+    def _encrypted_archive(self, gpg, files):
+        tar_content = io.BytesIO()
+
+        with tarfile.open(fileobj=tar_content, mode="w:gz") as tar_file:
+            for name, content in files.items():
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = len(content)
+                tar_file.addfile(tar_info, io.BytesIO(content))
+
+        return gpg.encrypt(
+            tar_content.getvalue(),
+            None,
+            symmetric=True,
+            passphrase=self.PASSPHRASE,
+            armor=False,
+        ).data
+
+    def _mock_response(self, mocker, content, chunk_size=4096):
+        response = mocker.MagicMock()
+        response.iter_content.return_value = (
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        )
+        return response
+
+    def test_stream_book(self, test_instance, gpg, mocker):
+        mocker.patch.object(GRINDownload, "CHUNK_SIZE", 64 * 1024)
+        large_page = bytes(range(256)) * 1024
+        archive = self._encrypted_archive(
+            gpg,
+            {"1234/page1.txt": b"first page", "1234/page2.html": large_page},
+        )
+        test_instance.grin_client.download_stream.return_value = self._mock_response(
+            mocker, archive
+        )
+        grin_status = test_instance.db_manager.session.get.return_value
+
+        test_instance.stream_book()
+
+        assert test_instance.uploads == {
+            "grin/1234/1234.tar.gz.gpg": archive,
+            "grin/1234/1234/page1.txt": b"first page",
+            "grin/1234/1234/page2.html": large_page,
+        }
+        assert grin_status.state == GRINState.DOWNLOADED.value
+        test_instance.db_manager.commit_changes.assert_called_once()
+
+    def test_stream_book_decryption_failure(self, test_instance, gpg, mocker):
+        archive = self._encrypted_archive(gpg, {"1234/page1.txt": b"first page"})
+        test_instance.ssm_service.get_parameter.return_value = "wrong-key"
+        test_instance.grin_client.download_stream.return_value = self._mock_response(
+            mocker, archive
+        )
+        grin_status = test_instance.db_manager.session.get.return_value
+
+        test_instance.stream_book()
+
+        assert test_instance.uploads == {"grin/1234/1234.tar.gz.gpg": archive}
+        assert grin_status.state != GRINState.DOWNLOADED.value
+        test_instance.db_manager.commit_changes.assert_not_called()
+
+    def test_stream_book_key_fetch_failure_aborts_upload(
+        self, test_instance, gpg, mocker
+    ):
+        abort = threading.Event()
+        mocker.patch("processes.grin.download.Event", return_value=abort)
+        test_instance.ssm_service.get_parameter.side_effect = Exception("SSM error")
+
+        archive = self._encrypted_archive(gpg, {"1234/page1.txt": b"first page"})
+        response = mocker.MagicMock()
+
+        def iter_content(chunk_size):
+            yield archive[:10]
+            abort.wait(timeout=5)
+            yield archive[10:]
+
+        response.iter_content.side_effect = iter_content
+        test_instance.grin_client.download_stream.return_value = response
+        grin_status = test_instance.db_manager.session.get.return_value
+
+        test_instance.stream_book()
+
+        test_instance.s3_manager.upload_fileobj.assert_called_once()
+        assert test_instance.uploads == {}
+        assert grin_status.state != GRINState.DOWNLOADED.value
+        test_instance.db_manager.commit_changes.assert_not_called()
+
+    def test_stream_book_response_failure_aborts_upload(
+        self, test_instance, gpg, mocker
+    ):
+        archive = self._encrypted_archive(gpg, {"1234/page1.txt": b"first page"})
+        response = mocker.MagicMock()
+
+        def iter_content(chunk_size):
+            yield archive[:10]
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        response.iter_content.side_effect = iter_content
+        test_instance.grin_client.download_stream.return_value = response
+        grin_status = test_instance.db_manager.session.get.return_value
+
+        upload_errors = []
+        mock_upload = test_instance.s3_manager.upload_fileobj.side_effect
+
+        def failing_upload(fileobj, key, bucket, **kwargs):
+            try:
+                mock_upload(fileobj, key, bucket, **kwargs)
+            except IOError as e:
+                upload_errors.append(e)
+                raise
+
+        test_instance.s3_manager.upload_fileobj.side_effect = failing_upload
+
+        test_instance.stream_book()
+
+        assert len(upload_errors) == 1
+        assert test_instance.uploads == {}
+        assert grin_status.state != GRINState.DOWNLOADED.value
+        test_instance.db_manager.commit_changes.assert_not_called()
+
+    def test_stream_book_download_failure(self, test_instance):
+        test_instance.grin_client.download_stream.side_effect = IOError
+        grin_status = test_instance.db_manager.session.get.return_value
+        grin_status.failed_download = 0
+
+        test_instance.stream_book()
+
+        assert grin_status.failed_download == 1
+        test_instance.s3_manager.upload_fileobj.assert_not_called()
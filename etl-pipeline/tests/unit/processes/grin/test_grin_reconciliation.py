@@ -0,0 +1,76 @@
+import csv
+from datetime import datetime
+import pytest
+
+from model import GRINState
+from processes.grin.reconciliation import (
+    COPY_LISTING,
+    INSERT_NEW_BOOKS,
+    UPDATE_CONVERTED_BOOKS,
+    reconcile_listings,
+)
+
+
+class TestGRINReconciliation:
+    @pytest.fixture
+    def mock_db_manager(self, mocker):
+        mock_db_manager = mocker.MagicMock()
+        mock_cursor = mock_db_manager.engine.raw_connection.return_value.cursor.return_value.__enter__.return_value
+        mock_cursor.copied_rows = []
+
+        def mock_copy(sql, listing_file):
+            mock_cursor.copied_rows.extend(csv.reader(listing_file))
+
+        mock_cursor.copy_expert.side_effect = mock_copy
+
+        return mock_db_manager
+
+    def test_reconcile_listings(self, mock_db_manager, mocker):
+        connection = mock_db_manager.engine.raw_connection.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        type(cursor).rowcount = mocker.PropertyMock(side_effect=[2, 1])
+
+        assert reconcile_listings(
+            mock_db_manager,
+            ["1", "2", "2"],
+            ["2", "3"],
+            date_created=datetime(1991, 8, 25),
+        ) == (2, 1)
+
+        assert cursor.copy_expert.call_args[0][0] == COPY_LISTING
+        assert sorted(row[:3] for row in cursor.copied_rows) == [
+            ["1", "t", "f"],
+            ["2", "t", "t"],
+            ["3", "f", "t"],
+        ]
+
+        cursor.execute.assert_any_call(
+            INSERT_NEW_BOOKS,
+            {
+                "frbr_status": "to_do",
+                "converted_state": GRINState.CONVERTED.value,
+                "new_state": GRINState.PENDING_CONVERSION.value,
+                "date_created": datetime(1991, 8, 25),
+            },
+        )
+        cursor.execute.assert_any_call(
+            UPDATE_CONVERTED_BOOKS,
+            {
+                "converted_state": GRINState.CONVERTED.value,
+                "convertible_states": ("pending_conversion", "converting"),
+            },
+        )
+        connection.commit.assert_called_once()
+        connection.close.assert_called_once()
+
+    def test_reconcile_listings_rolls_back(self, mock_db_manager):
+        connection = mock_db_manager.engine.raw_connection.return_value
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = [None, Exception("insert failed")]
+
+        with pytest.raises(Exception):
+            reconcile_listings(mock_db_manager, ["1"], [])
+
+        connection.rollback.assert_called_once()
+        connection.commit.assert_not_called()
+        connection.close.assert_called_once()
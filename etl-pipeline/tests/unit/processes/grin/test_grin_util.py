@@ -0,0 +1,35 @@
+from processes.grin.util import AdaptiveConcurrency, chunk
+
+
+def test_chunk():
+    assert list(chunk(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+class TestAdaptiveConcurrency:
+    def test_increases_while_responses_are_steady(self):
+        concurrency = AdaptiveConcurrency(3)
+
+        for _ in range(5):
+            concurrency.record_success(1.0)
+
+        assert concurrency.limit == 3
+
+    def test_halves_on_slow_response(self):
+        concurrency = AdaptiveConcurrency(8)
+
+        for _ in range(7):
+            concurrency.record_success(1.0)
+
+        concurrency.record_success(5.0)
+
+        assert concurrency.limit == 4
+
+    def test_halves_on_failure_down_to_minimum(self):
+        concurrency = AdaptiveConcurrency(8, min_limit=2)
+        concurrency.limit = 5
+
+        concurrency.record_failure()
+        assert concurrency.limit == 2
+
+        concurrency.record_failure()
+        assert concurrency.limit == 2
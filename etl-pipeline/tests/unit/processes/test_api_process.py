@@ -36,6 +36,25 @@ class TestAPIProcess:
             mock_flask_api.createErrorResponses.assert_called_once()
             mock_flask_api.run.assert_called_once()
 
+    def test_run_process_sizes_pools_to_threads(self, api_process: APIProcess):
+        with (
+            patch("processes.api.FlaskAPI"),
+            patch("processes.api.TimedBlockingConnectionPool") as MockRedisPool,
+            patch.dict("os.environ", {"API_THREADS": "12"}),
+        ):
+            api_process.runProcess()
+
+            engine_options = api_process.db_manager.generate_engine.call_args.kwargs
+            assert engine_options["pool_size"] == 12
+            assert engine_options["max_overflow"] == 6
+            assert MockRedisPool.call_args.kwargs["max_connections"] == 24
+            api_process.redis_manager.create_client.assert_called_once_with(
+                connection_pool=MockRedisPool.return_value
+            )
+            api_process.elastic_search_manager.create_elastic_connection.assert_called_once_with(
+                maxsize=24
+            )
+
     def test_run_process_failure(self, api_process: APIProcess):
         api_process.elastic_search_manager.create_elastic_connection.side_effect = (
             Exception("Connection error")
@@ -0,0 +1,53 @@
+import pytest
+
+from processes import AutomaticCollectionRefreshProcess
+
+
+class TestAutomaticCollectionRefreshProcess:
+    @pytest.fixture
+    def test_process(self, mocker):
+        mocker.patch.dict("os.environ", {"AUTOMATIC_COLLECTION_MAX_AGE": "600"})
+        mocker.patch("processes.util.automatic_collection_refresh.DBManager")
+        mocker.patch("processes.util.automatic_collection_refresh.RedisManager")
+        mocker.patch("processes.util.automatic_collection_refresh.ElasticsearchManager")
+
+        return AutomaticCollectionRefreshProcess()
+
+    def test_initializer(self, test_process):
+        assert test_process.max_age == 600
+        assert test_process.max_works == AutomaticCollectionRefreshProcess.MAX_WORKS
+
+    def test_run_process(self, test_process, mocker):
+        first_collection = mocker.MagicMock(collection_id=1)
+        second_collection = mocker.MagicMock(collection_id=2)
+        test_process.db_manager.session.query().all.return_value = [
+            first_collection,
+            second_collection,
+        ]
+
+        mock_refresh = mocker.patch.object(
+            AutomaticCollectionRefreshProcess,
+            "refresh_collection",
+            side_effect=[Exception("search failed"), None],
+        )
+
+        test_process.runProcess()
+
+        assert mock_refresh.call_count == 2
+        assert mock_refresh.call_args[0][1] == second_collection
+        test_process.db_manager.close_connection.assert_called_once()
+
+    def test_refresh_collection(self, test_process, mocker):
+        mocker.patch("processes.util.automatic_collection_refresh.ElasticClient")
+        mock_materialize = mocker.patch(
+            "processes.util.automatic_collection_refresh.materializeAutomaticCollection",
+            return_value=(20, [[3], [4]]),
+        )
+        automatic_collection = mocker.MagicMock(collection_id=1)
+
+        test_process.refresh_collection(mocker.sentinel.db_client, automatic_collection)
+
+        assert mock_materialize.call_args[0][3] == test_process.max_works
+        test_process.redis_manager.set_automatic_collection_works.assert_called_once_with(
+            1, [[3], [4]], 20, 600
+        )
@@ -2,6 +2,7 @@ import pytest
 from sqlalchemy import text
 from unittest.mock import patch
 
+from model import REFRESH_PREFERRED_EDITIONS
 from processes import DatabaseMaintenanceProcess
 
 
@@ -33,4 +34,8 @@ class TestDatabaseMaintenanceProcess:
             db_maintenance_process.VACUUMING_TABLES
         )
 
+        db_maintenance_process.db_manager.engine.begin().__enter__().execute.assert_called_once_with(
+            REFRESH_PREFERRED_EDITIONS
+        )
+
         db_maintenance_process.db_manager.close_connection.assert_called_once()
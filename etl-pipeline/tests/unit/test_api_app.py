@@ -1,4 +1,5 @@
 import os
+from flask import Flask, g
 import pytest
 
 from api.app import FlaskAPI
@@ -28,4 +29,56 @@ class TestFlaskAPI:
 
         testInstance.run()
 
-        mockServe.assert_called_once_with(testInstance.app, host="0.0.0.0", port=80)
+        mockServe.assert_called_once_with(
+            testInstance.app, host="0.0.0.0", port=80, threads=8
+        )
+
+    def test_run_gunicorn(self, testInstance, mocker):
+        mocker.patch.dict(
+            "os.environ",
+            {
+                "STAGE": "production",
+                "API_SERVER": "gunicorn",
+                "API_WORKERS": "4",
+                "API_THREADS": "16",
+            },
+        )
+        mockServer = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"api.server": mockServer})
+        mockServe = mocker.patch("api.app.serve")
+
+        testInstance.run()
+
+        mockServer.GunicornServer.assert_called_once_with(
+            testInstance.app,
+            {
+                "bind": "0.0.0.0:80",
+                "worker_class": "gthread",
+                "workers": 4,
+                "threads": 16,
+                "post_fork": testInstance.resetConnectionPools,
+            },
+        )
+        mockServer.GunicornServer.return_value.run.assert_called_once()
+        mockServe.assert_not_called()
+
+    def test_resetConnectionPools(self, testInstance, mocker):
+        mockEngine = mocker.MagicMock()
+        testInstance.app.config = {"DB_CLIENT": mockEngine}
+
+        testInstance.resetConnectionPools("server", "worker")
+
+        mockEngine.dispose.assert_called_once_with(close=False)
+
+    def test_closeRequestSessions(self, mocker):
+        mockSessions = [mocker.MagicMock(), mocker.MagicMock()]
+
+        with Flask("test").app_context():
+            g.dbSessions = mockSessions
+
+            FlaskAPI.closeRequestSessions()
+
+            assert "dbSessions" not in g
+
+        for mockSession in mockSessions:
+            mockSession.close.assert_called_once()
@@ -1,6 +1,9 @@
 import pytest
 
-from api.automaticCollectionUtils import fetchAutomaticCollectionEditions
+from api.automaticCollectionUtils import (
+    fetchAutomaticCollectionEditions,
+    materializeAutomaticCollection,
+)
 
 
 def test_fetchAutomaticCollectionEditions_mostRecent(mocker):
@@ -17,6 +20,7 @@ def test_fetchAutomaticCollectionEditions_mostRecent(mocker):
     dbClient.fetchAllPreferredEditions.return_value = (
         20,
         mocker.sentinel.sortedEditions,
+        mocker.sentinel.lastSortKey,
     )
     total, editions = fetchAutomaticCollectionEditions(
         dbClient,
@@ -29,6 +33,52 @@ def test_fetchAutomaticCollectionEditions_mostRecent(mocker):
     assert editions == mocker.sentinel.sortedEditions
 
 
+def test_fetchAutomaticCollectionEditions_mostRecent_cached_page(mocker):
+    dbClient = mocker.MagicMock()
+    dbClient.fetchAutomaticCollection.return_value = mocker.MagicMock(
+        collection_id=1,
+        keyword_query=None,
+        author_query=None,
+        title_query=None,
+        subject_query=None,
+        sort_field="title",
+        sort_direction="ASC",
+        limit=None,
+    )
+    dbClient.fetchAllPreferredEditions.return_value = (
+        None,
+        mocker.sentinel.sortedEditions,
+        ("title c", 3),
+    )
+    pageCache = mocker.MagicMock()
+    pageCache.getTotal.return_value = 20
+    pageCache.getCursor.return_value = ("title b", 2)
+
+    total, editions = fetchAutomaticCollectionEditions(
+        dbClient,
+        mocker.sentinel.esClient,
+        1,
+        perPage=10,
+        page=2,
+        pageCache=pageCache,
+    )
+
+    assert total == 20
+    assert editions == mocker.sentinel.sortedEditions
+    dbClient.fetchAllPreferredEditions.assert_called_once_with(
+        sortField="title",
+        sortDirection="ASC",
+        page=2,
+        perPage=10,
+        after=("title b", 2),
+        countTotal=False,
+    )
+    pageCache.setTotal.assert_not_called()
+    pageCache.setCursor.assert_called_once_with(
+        pageCache.generateKey.return_value, 3, ("title c", 3)
+    )
+
+
 def test_fetchAutomaticCollectionEditions_searchBased(mocker):
     dbClient = mocker.MagicMock()
     dbClient.fetchAutomaticCollection.return_value = mocker.MagicMock(
@@ -85,7 +135,7 @@ def test_fetchAutomaticCollectionEditions_searchBased(mocker):
             "sort": [("date", "DESC")],
             "show_all": True,
         },
-        page=1,
+        page=0,
         perPage=10,
     )
     dbClient.fetchEditions.assert_called_once_with(
@@ -95,3 +145,147 @@ def test_fetchAutomaticCollectionEditions_searchBased(mocker):
             mocker.sentinel.edition3,
         ],
     )
+
+
+def _mockStoredWorks(mocker, totalCount, storedCount, works):
+    redisClient = mocker.MagicMock()
+    redisClient.pipeline.return_value.execute.return_value = [
+        totalCount,
+        storedCount,
+        works,
+    ]
+    return redisClient
+
+
+def test_fetchAutomaticCollectionEditions_storedWorks(mocker):
+    mocker.patch.dict("os.environ", {"ENVIRONMENT": "test"})
+    dbClient = mocker.MagicMock()
+    dbClient.fetchAutomaticCollection.return_value = mocker.MagicMock(
+        keyword_query="test",
+        limit=None,
+    )
+    dbClient.fetchEditions.return_value = mocker.sentinel.editions
+    esClient = mocker.MagicMock()
+    redisClient = _mockStoredWorks(mocker, b"30", 30, [b"4,5", b"6"])
+
+    assert fetchAutomaticCollectionEditions(
+        dbClient, esClient, 1, perPage=2, page=2, redisClient=redisClient
+    ) == (30, mocker.sentinel.editions)
+
+    redisClient.pipeline.return_value.lrange.assert_called_once_with(
+        "test/api/automatic-collections/1/works", 2, 3
+    )
+    dbClient.fetchEditions.assert_called_once_with([4, 5, 6])
+    esClient.searchQuery.assert_not_called()
+
+
+def test_fetchAutomaticCollectionEditions_storedWorks_too_short(mocker):
+    dbClient = mocker.MagicMock()
+    dbClient.fetchAutomaticCollection.return_value = mocker.MagicMock(
+        keyword_query=None,
+        author_query=None,
+        title_query=None,
+        subject_query=None,
+        sort_field="date",
+        sort_direction="DESC",
+        limit=None,
+    )
+    dbClient.fetchAllPreferredEditions.return_value = (
+        5000,
+        mocker.sentinel.sortedEditions,
+        None,
+    )
+    redisClient = _mockStoredWorks(mocker, b"5000", 1000, [])
+
+    assert fetchAutomaticCollectionEditions(
+        dbClient,
+        mocker.sentinel.esClient,
+        1,
+        perPage=10,
+        page=101,
+        redisClient=redisClient,
+    ) == (5000, mocker.sentinel.sortedEditions)
+
+    dbClient.fetchAllPreferredEditions.assert_called_once()
+
+
+def test_fetchAutomaticCollectionEditions_storedWorks_expired(mocker):
+    dbClient = mocker.MagicMock()
+    dbClient.fetchAutomaticCollection.return_value = mocker.MagicMock(
+        keyword_query="test",
+        limit=None,
+    )
+    esClient = mocker.MagicMock()
+    esClient.searchQuery.return_value = mocker.MagicMock(
+        hits=mocker.MagicMock(total=mocker.MagicMock(value=0))
+    )
+    redisClient = _mockStoredWorks(mocker, None, 0, [])
+
+    fetchAutomaticCollectionEditions(
+        dbClient, esClient, 1, perPage=10, page=1, redisClient=redisClient
+    )
+
+    esClient.searchQuery.assert_called_once()
+
+
+def test_materializeAutomaticCollection_mostRecent(mocker):
+    dbClient = mocker.MagicMock()
+    dbClient.fetchPreferredEditionIDs.return_value = (20, [3, 1])
+    automaticCollection = mocker.MagicMock(
+        keyword_query=None,
+        author_query=None,
+        title_query=None,
+        subject_query=None,
+        sort_field="title",
+        sort_direction="ASC",
+        limit=50,
+    )
+
+    assert materializeAutomaticCollection(
+        dbClient, mocker.sentinel.esClient, automaticCollection, 1000
+    ) == (20, [[3], [1]])
+
+    dbClient.fetchPreferredEditionIDs.assert_called_once_with("title", "ASC", 50)
+
+
+def test_materializeAutomaticCollection_searchBased(mocker):
+    esClient = mocker.MagicMock()
+    esClient.searchQuery.return_value.hits.total.value = 2000
+    esClient.searchQuery.return_value.hits.__iter__.return_value = [
+        mocker.MagicMock(
+            meta=mocker.MagicMock(
+                inner_hits=mocker.MagicMock(
+                    editions=mocker.MagicMock(
+                        hits=[
+                            mocker.MagicMock(edition_id=4),
+                            mocker.MagicMock(edition_id=5),
+                        ]
+                    )
+                )
+            )
+        )
+    ]
+    automaticCollection = mocker.MagicMock(
+        keyword_query="test",
+        author_query=None,
+        title_query=None,
+        subject_query=None,
+        sort_field="date",
+        sort_direction="DESC",
+        limit=None,
+    )
+
+    assert materializeAutomaticCollection(
+        mocker.sentinel.dbClient, esClient, automaticCollection, 1000
+    ) == (2000, [[4, 5]])
+
+    esClient.searchQuery.assert_called_once_with(
+        {
+            "query": [("keyword", "test")],
+            "sort": [("date", "DESC")],
+            "filter": [],
+            "show_all": True,
+        },
+        page=0,
+        perPage=1000,
+    )
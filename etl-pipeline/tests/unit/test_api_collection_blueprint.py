@@ -726,9 +726,11 @@ class TestCollectionBlueprint:
         mock_db_client = mocker.patch("api.blueprints.drbCollection.DBClient")
         mock_db_client.return_value = mock_db
 
-        collection1 = mocker.MagicMock(uuid="uuid1")
-        collection2 = mocker.MagicMock(uuid="uuid2")
+        collection1 = mocker.MagicMock(uuid="uuid1", id=1)
+        collection2 = mocker.MagicMock(uuid="uuid2", id=2)
         mock_db.fetchCollections.return_value = [collection1, collection2]
+        mock_db.fetchCollectionCount.return_value = 12
+        mock_db.fetchCollectionItemCounts.return_value = {1: 3, 2: 0}
 
         mock_feed = mocker.MagicMock()
         mock_feed_init = mocker.patch("api.blueprints.drbCollection.Feed")
@@ -748,8 +750,9 @@ class TestCollectionBlueprint:
 
             mock_db.createSession.assert_called_once()
             mock_db.fetchCollections.assert_called_once_with(
-                sort="title", page=1, perPage=10
+                sort="title", page=1, perPage=10, after=None
             )
+            mock_db.fetchCollectionItemCounts.assert_called_once_with([1, 2])
 
             mock_feed_init.assert_called_once()
             mock_feed.addMetadata.assert_called_once_with(
@@ -760,7 +763,7 @@ class TestCollectionBlueprint:
             )
 
             mock_paging.assert_called_once_with(
-                mock_feed, "/list?", 2, page=1, perPage=10
+                mock_feed, "/list?", 12, page=1, perPage=10
             )
 
             mockConstruct.assert_has_calls(
@@ -771,6 +774,7 @@ class TestCollectionBlueprint:
                         perPage=5,
                         path="/collection/uuid1",
                         build_publications=False,
+                        number_of_items=3,
                     ),
                     mocker.call(
                         collection2,
@@ -778,6 +782,7 @@ class TestCollectionBlueprint:
                         perPage=5,
                         path="/collection/uuid2",
                         build_publications=False,
+                        number_of_items=0,
                     ),
                 ]
             )
@@ -804,7 +809,7 @@ class TestCollectionBlueprint:
 
             mock_db.createSession.assert_called_once()
             mock_db.fetchCollections.assert_called_once_with(
-                sort="title", page=1, perPage=10
+                sort="title", page=1, perPage=10, after=None
             )
 
             mock_utils["formatResponseObject"].assert_called_once_with(
@@ -859,12 +864,17 @@ class TestCollectionBlueprint:
         mock_pub_init.return_value = mock_pub
 
         mock_db = mocker.MagicMock()
+        mock_db.fetchCollectionEditions.return_value = [
+            mocker.MagicMock(id=1),
+            mocker.MagicMock(id=2),
+        ]
+        mock_db.fetchCollectionItemCounts.return_value = {1: 12}
         collection = mocker.MagicMock(
+            id=1,
             uuid="testUUID",
             title="Test Collection",
             creator="Test Creator",
             description="Test Description",
-            editions=[mocker.MagicMock(id=1), mocker.MagicMock(id=2)],
             type="static",
         )
 
@@ -920,8 +930,12 @@ class TestCollectionBlueprint:
 
             mock_sort_con.assert_called_once_with("test")
 
+            mock_db.fetchCollectionEditions.assert_called_once_with(
+                1, page=1, perPage=10
+            )
+            mock_db.fetchCollectionItemCounts.assert_called_once_with([1])
             mock_paging.assert_called_once_with(
-                mock_feed, "/collection/testUUID", 2, page=1, perPage=10
+                mock_feed, "/collection/testUUID", 12, page=1, perPage=10
             )
 
     def test_construct_opds_Feed_success_auto_collection(
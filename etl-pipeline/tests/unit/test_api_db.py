@@ -1,9 +1,12 @@
-from datetime import date
+from datetime import date, datetime, timedelta
+from flask import Flask, g
 import pytest
-from sqlalchemy.sql import text
+from sqlalchemy import create_engine
+from sqlalchemy.sql import select, text
 
 from api.db import DBClient
 from api.utils import APIUtils
+from model import CREATE_PREFERRED_EDITIONS, PREFERRED_EDITIONS
 
 
 class TestDBClient:
@@ -38,13 +41,22 @@ class TestDBClient:
         mockMaker.assert_called_once_with(bind=testInstance.engine)
         mockCreator.assert_called_once()
 
+    def test_createSession_registers_request_session(self, testInstance, mocker):
+        mockSession = mocker.MagicMock()
+        mocker.patch("api.db.sessionmaker").return_value.return_value = mockSession
+
+        with Flask("test").app_context():
+            testInstance.createSession()
+
+            assert g.dbSessions == [mockSession]
+
     def test_closeSession(self, testInstance):
         testInstance.closeSession()
 
         testInstance.session.close.assert_called_once()
 
     def test_fetchSearchedWorks(self, testInstance, mocker):
-        testInstance.session.query().join().options().filter().all.return_value = [
+        testInstance.session.query().options().filter().all.return_value = [
             "work1",
             "work3",
         ]
@@ -57,7 +69,8 @@ class TestDBClient:
         )
 
         assert workResult == ["work1", "work3"]
-        testInstance.session.query().join().options().filter().all.assert_called_once()
+        testInstance.session.query().options().filter().all.assert_called_once()
+        testInstance.session.query().join.assert_not_called()
 
     def test_fetchSingleWork(self, testInstance, mocker):
         testInstance.session.query().options().filter().first.return_value = "testWork"
@@ -77,6 +90,31 @@ class TestDBClient:
         assert editionResult == "testEdition"
         testInstance.session.query().options().filter().first.assert_called_once()
 
+    def test_fetchEditionCollections(self, testInstance):
+        testInstance.session.query().join().join().filter().order_by.return_value = [
+            (1, "uuid1", "Collection 1", "Creator 1", "Description 1", 3),
+            (1, "uuid2", "Collection 2", "Creator 2", "Description 2", 5),
+            (2, "uuid1", "Collection 1", "Creator 1", "Description 1", 3),
+        ]
+
+        editionCollections = testInstance.fetchEditionCollections([1, 2, 3])
+
+        assert list(editionCollections.keys()) == [1, 2]
+        assert [c["uuid"] for c in editionCollections[1]] == ["uuid1", "uuid2"]
+        assert editionCollections[2] == [
+            {
+                "uuid": "uuid1",
+                "title": "Collection 1",
+                "creator": "Creator 1",
+                "description": "Description 1",
+                "numberOfItems": 3,
+            }
+        ]
+
+    def test_fetchEditionCollections_no_editions(self, testInstance):
+        assert testInstance.fetchEditionCollections([]) == {}
+        testInstance.session.query.assert_not_called()
+
     def test_fetchSingleLink(self, testInstance, mocker):
         testInstance.session.query().filter().first.return_value = "testLink"
 
@@ -102,27 +140,157 @@ class TestDBClient:
         testInstance.session.execute.call_args[0][0].compare(testCountQuery)
 
     def test_fetchNewWorks(self, testInstance):
-        testInstance.session.query().filter().count.return_value = 1
-        testInstance.session.query().filter().offset().limit().all.return_value = (
-            "testWorks"
-        )
+        baseQuery = testInstance.session.query().filter()
+        baseQuery.count.return_value = 1
+        baseQuery.order_by().offset().limit().all.return_value = "testWorks"
 
         testResult = testInstance.fetchNewWorks()
 
         assert testResult[0] == 1
         assert testResult[1] == "testWorks"
 
-        testInstance.session.query().filter().count.assert_called_once()
-        testInstance.session.query().filter().offset().limit().all.assert_called_once()
+        baseQuery.count.assert_called_once()
+        baseQuery.order_by().offset.assert_called_with(0)
 
-    def test_fetchSingleCollection(self, testInstance):
-        testInstance.session.query().options().filter().one.return_value = (
-            "testCollection"
+    def test_fetchNewWorks_seeks_after_cursor(self, testInstance):
+        baseQuery = testInstance.session.query().filter()
+        baseQuery.order_by().filter().limit().all.return_value = "testWorks"
+
+        testResult = testInstance.fetchNewWorks(
+            page=3, after=(datetime(2024, 1, 1), 10), countTotal=False
+        )
+
+        assert testResult == (None, "testWorks")
+        baseQuery.count.assert_not_called()
+        baseQuery.order_by().offset.assert_not_called()
+
+    def test_fetchAllPreferredEditions(self, testInstance):
+        editionsQuery = testInstance.session.query().join().filter().order_by()
+        editionsQuery.offset().limit().all.return_value = [
+            ("edition1", "title a", 1),
+            ("edition2", "title b", 2),
+        ]
+        testInstance.session.query().select_from().filter().scalar.return_value = 7
+
+        total, editions, lastSortKey = testInstance.fetchAllPreferredEditions(
+            "title", "ASC", 2, 2
         )
 
+        assert total == 7
+        assert editions == ["edition1", "edition2"]
+        assert lastSortKey == ("title b", 2)
+        editionsQuery.offset.assert_called_with(2)
+
+    def test_fetchAllPreferredEditions_seeks_after_cursor(self, testInstance):
+        editionsQuery = testInstance.session.query().join().filter().order_by()
+        editionsQuery.filter().limit().all.return_value = []
+
+        total, editions, lastSortKey = testInstance.fetchAllPreferredEditions(
+            "date", "DESC", 3, 10, after=(datetime(2024, 1, 1), 5), countTotal=False
+        )
+
+        assert (total, editions, lastSortKey) == (None, [], None)
+        editionsQuery.offset.assert_not_called()
+
+    def test_fetchAllPreferredEditions_invalid_sort(self, testInstance):
+        with pytest.raises(ValueError):
+            testInstance.fetchAllPreferredEditions("author", "ASC", 1, 10)
+
+    def test_preferredEditionsSort_ranks_editions_inside_window(self):
+        engine = create_engine("sqlite://")
+
+        def daysAgo(days):
+            return datetime.now() - timedelta(days=days)
+
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE TABLE works "
+                    "(id INTEGER, uuid TEXT, title TEXT, date_created TIMESTAMP)"
+                )
+            )
+            connection.execute(
+                text(
+                    "CREATE TABLE editions "
+                    "(id INTEGER, work_id INTEGER, date_created TIMESTAMP)"
+                )
+            )
+            # SQLite has no materialized views, so the same query backs a plain view
+            connection.execute(
+                text(
+                    CREATE_PREFERRED_EDITIONS[0].text.replace(
+                        "CREATE MATERIALIZED VIEW IF NOT EXISTS", "CREATE VIEW"
+                    )
+                )
+            )
+            connection.execute(
+                text("INSERT INTO works VALUES (:id, :uuid, :title, :date_created)"),
+                [
+                    {"id": 1, "uuid": "1", "title": "a", "date_created": daysAgo(10)},
+                    {"id": 2, "uuid": "2", "title": "b", "date_created": daysAgo(10)},
+                    {"id": 3, "uuid": "3", "title": "c", "date_created": daysAgo(200)},
+                ],
+            )
+            connection.execute(
+                text("INSERT INTO editions VALUES (:id, :work_id, :date_created)"),
+                [
+                    {"id": 11, "work_id": 1, "date_created": daysAgo(300)},
+                    {"id": 12, "work_id": 1, "date_created": daysAgo(5)},
+                    {"id": 13, "work_id": 1, "date_created": daysAgo(3)},
+                    {"id": 21, "work_id": 2, "date_created": daysAgo(8)},
+                    {"id": 22, "work_id": 2, "date_created": daysAgo(2)},
+                    {"id": 31, "work_id": 3, "date_created": daysAgo(5)},
+                ],
+            )
+
+            sortColumn, recentFilter = DBClient._preferredEditionsSort("title")
+
+            preferredEditions = connection.execute(
+                select(PREFERRED_EDITIONS.c.work_id, PREFERRED_EDITIONS.c.edition_id)
+                .where(recentFilter)
+                .order_by(sortColumn)
+            ).all()
+
+        # Work 1's oldest edition predates the window, so its oldest edition inside
+        # the window is preferred, and work 3 was created before the window
+        assert preferredEditions == [(1, 12), (2, 21)]
+
+    def test_fetchPreferredEditionIDs(self, testInstance):
+        testInstance.session.query().filter().order_by().limit().all.return_value = [
+            (3,),
+            (1,),
+        ]
+        testInstance.session.query().select_from().filter().scalar.return_value = 12
+
+        assert testInstance.fetchPreferredEditionIDs("title", "DESC", 2) == (
+            12,
+            [3, 1],
+        )
+
+    def test_fetchCollectionItemCounts(self, testInstance):
+        testInstance.session.query().filter().group_by.return_value = [(1, 4)]
+
+        assert testInstance.fetchCollectionItemCounts([1, 2]) == {1: 4, 2: 0}
+
+    def test_fetchSingleCollection(self, testInstance):
+        testInstance.session.query().filter().one.return_value = "testCollection"
+
         assert testInstance.fetchSingleCollection("uuid") == "testCollection"
 
-        testInstance.session.query().options().filter().one.assert_called_once()
+        testInstance.session.query().filter().one.assert_called_once()
+
+    def test_fetchCollectionEditions(self, testInstance):
+        mockQuery = testInstance.session.query().join().options().filter().order_by()
+        mockQuery.offset().limit().all.return_value = ["ed3", "ed4"]
+        mockQuery.offset.reset_mock()
+
+        assert testInstance.fetchCollectionEditions(1, page=2, perPage=2) == [
+            "ed3",
+            "ed4",
+        ]
+
+        mockQuery.offset.assert_called_once_with(2)
+        mockQuery.offset().limit.assert_called_with(2)
 
     def test_createStaticCollection(self, testInstance, mocker):
         mockUUID = mocker.patch("api.db.uuid4")
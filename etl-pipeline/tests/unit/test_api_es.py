@@ -1,5 +1,7 @@
+import json
 import pytest
 
+from elasticsearch.exceptions import NotFoundError
 from elasticsearch_dsl import Search, Q, A
 from tests.helper import TestHelpers
 from api.elastic import ElasticClient, ElasticClientError
@@ -21,6 +23,10 @@ class TestElasticClient:
                 self.esIndex = "test_es_index"
                 self.environment = "test"
                 self.searchedFields = []
+                self.sortReversed = False
+                self.cachedFacets = None
+                self.totalHitsLimit = None
+                self.separateFacets = False
 
         return MockElasticClient()
 
@@ -31,6 +37,7 @@ class TestElasticClient:
         mockHit = mocker.MagicMock(meta=mocker.MagicMock(sort=["testSort"]))
         mockResults.hits = [mockHit]
         mockSearch.query.return_value = mockSearch
+        mockSearch.index.return_value = mockSearch
         mockSearch.extra.return_value = mockSearch
         mockSearch.__getitem__.return_value = mockSearch
         mockSearch.execute.return_value = mockResults
@@ -56,6 +63,12 @@ class TestElasticClient:
             generateQueryHash=mocker.DEFAULT,
             getPageResultCache=mocker.DEFAULT,
             setPageResultCache=mocker.DEFAULT,
+            getSearchResultCache=mocker.DEFAULT,
+            setSearchResultCache=mocker.DEFAULT,
+            applyFacetCache=mocker.DEFAULT,
+            executeCursorQuery=mocker.DEFAULT,
+            openPointInTime=mocker.DEFAULT,
+            closePointInTime=mocker.DEFAULT,
         )
 
     def test_createSearch(self, testInstance, mocker):
@@ -67,14 +80,27 @@ class TestElasticClient:
 
         assert searchClient == mockSearchClient.params()
         mockSearch.assert_called_once_with(index="test_es_index")
+        mockSearchClient.params.assert_any_call(track_total_hits=True)
+
+    def test_createSearch_capped_total_hits(self, testInstance, mocker):
+        mockSearch = mocker.patch("api.elastic.Search")
+
+        testInstance.totalHitsLimit = 10000
+        testInstance.createSearch()
+
+        mockSearch.return_value.params.assert_called_once_with(track_total_hits=10000)
 
     def test_searchQuery(self, testInstance, mocker):
+        mockFacets = mocker.patch.object(ElasticClient, "getFacetCache")
+        mockFacets.return_value = "testFacets"
         mockGenerate = mocker.patch.object(ElasticClient, "generateSearchQuery")
         mockExecute = mocker.patch.object(ElasticClient, "executeSearchQuery")
         mockExecute.return_value = "testResponse"
 
         assert testInstance.searchQuery("testParams") == "testResponse"
+        assert testInstance.cachedFacets == "testFacets"
 
+        mockFacets.assert_called_once_with("testParams")
         mockGenerate.assert_called_once_with("testParams")
         mockExecute.assert_called_once_with("testParams", 0, 10)
 
@@ -423,10 +449,19 @@ class TestElasticClient:
         searchMocks["addFiltersAndAggregations"].assert_called_once_with(3)
         searchMocks["addSearchHighlighting"].assert_called_once()
 
-    def test_executeSearchQuery_standard(self, testInstance, mockSearch, searchMocks):
-        searchMocks["getFromSize"].return_value = (0, 10)
-        searchMocks["generateQueryHash"].return_value = "testHash"
+    @pytest.fixture
+    def executeMocks(self, searchMocks):
+        searchMocks["generateQueryHash"].side_effect = lambda params, pos: f"hash{pos}"
+        searchMocks["getSearchResultCache"].return_value = None
         searchMocks["getPageResultCache"].return_value = None
+        searchMocks["applyFacetCache"].side_effect = (
+            lambda params, res, facetFuture=None: res
+        )
+
+        return searchMocks
+
+    def test_executeSearchQuery_standard(self, testInstance, mockSearch, executeMocks):
+        executeMocks["getFromSize"].return_value = (0, 10)
 
         testInstance.query = mockSearch
 
@@ -434,19 +469,40 @@ class TestElasticClient:
 
         assert testResult._extract_mock_name() == "mockRes"
 
-        searchMocks["getFromSize"].assert_called_once_with(0, 10)
-        searchMocks["generateQueryHash"].assert_called_once_with({}, 0)
-        searchMocks["getPageResultCache"].assert_not_called()
-        searchMocks["setPageResultCache"].assert_called_once_with(
-            "testHash", ["testSort"]
+        executeMocks["getFromSize"].assert_called_once_with(0, 10)
+        executeMocks["getSearchResultCache"].assert_called_once_with("hash0")
+        executeMocks["getPageResultCache"].assert_not_called()
+        mockSearch.extra.assert_called_once_with(
+            pit={
+                "id": executeMocks["openPointInTime"].return_value,
+                "keep_alive": "5m",
+            }
+        )
+        executeMocks["setPageResultCache"].assert_called_once_with(
+            "hash10", {"pit": testResult.pit_id, "searchAfter": ["testSort"]}
         )
+        executeMocks["setSearchResultCache"].assert_called_once_with(
+            "hash0", testResult.to_dict()
+        )
+
+    def test_executeSearchQuery_cached_results(self, testInstance, executeMocks):
+        executeMocks["getFromSize"].return_value = (0, 10)
+        executeMocks["getSearchResultCache"].return_value = json.dumps(
+            {"hits": {"total": {"value": 1}, "hits": [{"_source": {"uuid": "1"}}]}}
+        )
+
+        testInstance.query = Search()
+
+        testResult = testInstance.executeSearchQuery({}, 0, 10)
+
+        assert testResult.hits.total.value == 1
+        assert testResult.hits[0].uuid == "1"
+        executeMocks["setSearchResultCache"].assert_not_called()
 
     def test_executeSearchQuery_no_results(
-        self, testInstance, mockSearch, searchMocks, mocker
+        self, testInstance, mockSearch, executeMocks, mocker
     ):
-        searchMocks["getFromSize"].return_value = (0, 10)
-        searchMocks["generateQueryHash"].return_value = "testHash"
-        searchMocks["getPageResultCache"].return_value = None
+        executeMocks["getFromSize"].return_value = (0, 10)
 
         mockEmptyRes = mocker.MagicMock(name="mockRes", hits=[])
         mockSearch.execute.return_value = mockEmptyRes
@@ -457,36 +513,66 @@ class TestElasticClient:
 
         assert testResult._extract_mock_name() == "mockRes"
 
-        searchMocks["getFromSize"].assert_called_once_with(0, 10)
-        searchMocks["generateQueryHash"].assert_called_once_with({}, 0)
-        searchMocks["getPageResultCache"].assert_not_called()
-        searchMocks["setPageResultCache"].assert_not_called()
+        executeMocks["getFromSize"].assert_called_once_with(0, 10)
+        executeMocks["getPageResultCache"].assert_not_called()
+        executeMocks["setPageResultCache"].assert_not_called()
+
+    def test_executeSearchQuery_cache_keys_include_page_size(
+        self, testInstance, mockSearch, executeMocks
+    ):
+        executeMocks["generateQueryHash"].side_effect = (
+            lambda params, pos: f"hash{params['size']}-{pos}"
+        )
+        testInstance.query = mockSearch
 
-    def test_executeSearchQuery_cached(self, testInstance, mockSearch, searchMocks):
-        searchMocks["getFromSize"].return_value = (10, 20)
-        searchMocks["generateQueryHash"].return_value = "testHash"
-        searchMocks["getPageResultCache"].return_value = b"test|sort"
+        executeMocks["getFromSize"].return_value = (0, 10)
+        testInstance.executeSearchQuery({"query": [("keyword", "test")]}, 0, 10)
+
+        executeMocks["getFromSize"].return_value = (0, 50)
+        testInstance.executeSearchQuery({"query": [("keyword", "test")]}, 0, 50)
+
+        assert [
+            call.args[0] for call in executeMocks["getSearchResultCache"].call_args_list
+        ] == ["hash10-0", "hash50-0"]
+        assert [
+            call.args[0] for call in executeMocks["setPageResultCache"].call_args_list
+        ] == ["hash10-10", "hash50-50"]
+
+    def test_executeSearchQuery_cached(self, testInstance, mockSearch, executeMocks):
+        executeMocks["getFromSize"].return_value = (10, 20)
+        executeMocks[
+            "getPageResultCache"
+        ].return_value = b'{"pit": "testPIT", "searchAfter": ["test", "sort"]}'
+        executeMocks["executeCursorQuery"].return_value = mockSearch.execute()
 
         testInstance.query = mockSearch
 
-        testResult = testInstance.executeSearchQuery({}, 10, 10)
+        testResult = testInstance.executeSearchQuery({}, 1, 10)
 
         assert testResult._extract_mock_name() == "mockRes"
 
-        mockSearch.extra.assert_called_once_with(search_after=["test", "sort"])
-        searchMocks["getFromSize"].assert_called_once_with(10, 10)
-        searchMocks["generateQueryHash"].assert_called_once_with({}, 10)
-        searchMocks["getPageResultCache"].assert_called_once_with("testHash")
-        searchMocks["setPageResultCache"].assert_not_called()
+        executeMocks["executeCursorQuery"].assert_called_once_with(
+            {"pit": "testPIT", "searchAfter": ["test", "sort"]}, 10
+        )
+        executeMocks["getSearchResultCache"].assert_not_called()
+        executeMocks["getPageResultCache"].assert_called_once_with("hash10")
+        executeMocks["setPageResultCache"].assert_called_once_with(
+            "hash20", {"pit": testResult.pit_id, "searchAfter": ["testSort"]}
+        )
+        executeMocks["setSearchResultCache"].assert_not_called()
 
     def test_executeSearchQuery_reverse(
-        self, testInstance, mockSearch, searchMocks, mocker
+        self, testInstance, mockSearch, executeMocks, mocker
     ):
-        searchMocks["getFromSize"].return_value = (7000, 7010)
-        searchMocks["generateQueryHash"].return_value = "testHash"
-        searchMocks["getPageResultCache"].return_value = None
-        mockExecuteReversed = mocker.patch.object(ElasticClient, "executeReversedQuery")
-        mockExecuteReversed.return_value = mockSearch.execute()
+        executeMocks["getFromSize"].return_value = (7000, 7010)
+
+        def mockReversed(*args):
+            testInstance.sortReversed = True
+            return mockSearch.execute()
+
+        mockExecuteReversed = mocker.patch.object(
+            ElasticClient, "executeReversedQuery", side_effect=mockReversed
+        )
 
         mockSearch.count.return_value = 7500
         testInstance.query = mockSearch
@@ -495,20 +581,67 @@ class TestElasticClient:
 
         assert testResult._extract_mock_name() == "mockRes"
 
-        searchMocks["getFromSize"].assert_called_once_with(700, 10)
-        searchMocks["generateQueryHash"].assert_called_once_with({}, 7000)
-        searchMocks["getPageResultCache"].assert_called_once_with("testHash")
+        executeMocks["getFromSize"].assert_called_once_with(700, 10)
+        executeMocks["getPageResultCache"].assert_called_once_with("hash7000")
         mockExecuteReversed.assert_called_once_with({}, 7500, 7000, 10)
-        searchMocks["setPageResultCache"].assert_called_once_with(
-            "testHash", ["testSort"]
-        )
+        executeMocks["setPageResultCache"].assert_not_called()
+
+    def test_executeSearchQuery_reverse_cached_total(
+        self, testInstance, mockSearch, executeMocks, mocker
+    ):
+        executeMocks["getFromSize"].return_value = (7000, 7010)
+        mockExecuteReversed = mocker.patch.object(ElasticClient, "executeReversedQuery")
+
+        testInstance.cachedFacets = {
+            "aggregations": {},
+            "total": 7500,
+            "relation": "eq",
+        }
+        testInstance.query = mockSearch
+
+        testInstance.executeSearchQuery({}, 700, 10)
+
+        mockSearch.count.assert_not_called()
+        mockExecuteReversed.assert_called_once_with({}, 7500, 7000, 10)
+
+    def test_executeSearchQuery_deep_capped_total(
+        self, testInstance, mockSearch, executeMocks, mocker
+    ):
+        executeMocks["getFromSize"].return_value = (7000, 7010)
+        mockExecuteReversed = mocker.patch.object(ElasticClient, "executeReversedQuery")
+
+        mockSearch.count.return_value = 12000
+        testInstance.cachedFacets = {
+            "aggregations": {},
+            "total": 10000,
+            "relation": "gte",
+        }
+        testInstance.query = mockSearch
+
+        testInstance.executeSearchQuery({}, 700, 10)
+
+        mockSearch.count.assert_called_once()
+        mockExecuteReversed.assert_called_once_with({}, 12000, 7000, 10)
+
+    def test_executeSearchQuery_separate_facets(
+        self, testInstance, mockSearch, executeMocks, mocker
+    ):
+        executeMocks["getFromSize"].return_value = (0, 10)
+        mockFacetQuery = mocker.patch.object(ElasticClient, "executeFacetQuery")
+
+        testInstance.separateFacets = True
+        testInstance.query = mockSearch
+
+        testInstance.executeSearchQuery({}, 0, 10)
+
+        mockFacetQuery.assert_called_once_with(mockSearch)
+        facetFuture = executeMocks["applyFacetCache"].call_args.kwargs["facetFuture"]
+        assert facetFuture.result() == mockFacetQuery.return_value
 
     def test_executeSearchQuery_deep(
-        self, testInstance, mockSearch, searchMocks, mocker
+        self, testInstance, mockSearch, executeMocks, mocker
     ):
-        searchMocks["getFromSize"].return_value = (7000, 7010)
-        searchMocks["generateQueryHash"].return_value = "testHash"
-        searchMocks["getPageResultCache"].return_value = None
+        executeMocks["getFromSize"].return_value = (7000, 7010)
         mockDeepReversed = mocker.patch.object(ElasticClient, "executeDeepQuery")
         mockDeepReversed.return_value = mockSearch.execute()
 
@@ -519,12 +652,171 @@ class TestElasticClient:
 
         assert testResult._extract_mock_name() == "mockRes"
 
-        searchMocks["getFromSize"].assert_called_once_with(700, 10)
-        searchMocks["generateQueryHash"].assert_called_once_with({}, 7000)
-        searchMocks["getPageResultCache"].assert_called_once_with("testHash")
+        executeMocks["getFromSize"].assert_called_once_with(700, 10)
+        executeMocks["getPageResultCache"].assert_called_once_with("hash7000")
         mockDeepReversed.assert_called_once_with(7000, 10)
-        searchMocks["setPageResultCache"].assert_called_once_with(
-            "testHash", ["testSort"]
+        executeMocks["setPageResultCache"].assert_called_once_with(
+            "hash7010", {"pit": testResult.pit_id, "searchAfter": ["testSort"]}
+        )
+
+    def test_executePointInTimeQuery_full_page(
+        self, testInstance, mockSearch, executeMocks
+    ):
+        executeMocks["openPointInTime"].return_value = "newPIT"
+        testInstance.query = mockSearch
+
+        testResult = testInstance.executePointInTimeQuery(1)
+
+        assert testResult._extract_mock_name() == "mockRes"
+        mockSearch.index.assert_called_once_with()
+        mockSearch.extra.assert_called_once_with(
+            pit={"id": "newPIT", "keep_alive": "5m"}
+        )
+        executeMocks["closePointInTime"].assert_not_called()
+
+    def test_executePointInTimeQuery_last_page(
+        self, testInstance, mockSearch, executeMocks
+    ):
+        testInstance.query = mockSearch
+
+        testResult = testInstance.executePointInTimeQuery(10)
+
+        executeMocks["closePointInTime"].assert_called_once_with(testResult.pit_id)
+
+    def test_executePointInTimeQuery_error(
+        self, testInstance, mockSearch, executeMocks
+    ):
+        executeMocks["openPointInTime"].return_value = "newPIT"
+        mockSearch.execute.side_effect = Exception("search failed")
+        testInstance.query = mockSearch
+
+        with pytest.raises(Exception):
+            testInstance.executePointInTimeQuery(10)
+
+        executeMocks["closePointInTime"].assert_called_once_with("newPIT")
+
+    def test_executeCursorQuery(self, testInstance, mockSearch):
+        mockSearch.index.return_value = mockSearch
+        testInstance.query = mockSearch
+
+        testResult = testInstance.executeCursorQuery(
+            {"pit": "testPIT", "searchAfter": ["testSort"]}, 10
+        )
+
+        assert testResult._extract_mock_name() == "mockRes"
+        mockSearch.index.assert_called_once_with()
+        mockSearch.extra.assert_called_once_with(
+            pit={"id": "testPIT", "keep_alive": "5m"}, search_after=["testSort"]
+        )
+
+    def test_executeCursorQuery_without_point_in_time(
+        self, testInstance, mockSearch, mocker
+    ):
+        mockConnections = mocker.patch("api.elastic.connections")
+        testInstance.query = mockSearch
+
+        testInstance.executeCursorQuery({"pit": None, "searchAfter": ["testSort"]}, 10)
+
+        mockConnections.get_connection().open_point_in_time.assert_not_called()
+        mockSearch.index.assert_not_called()
+        mockSearch.extra.assert_called_once_with(search_after=["testSort"])
+
+    def test_executeCursorQuery_expired_point_in_time(
+        self, testInstance, mockSearch, mocker
+    ):
+        pitSearch = mocker.MagicMock()
+        pitSearch.extra.return_value.__getitem__.return_value.execute.side_effect = (
+            NotFoundError(404, "search_context_missing_exception")
+        )
+        mockSearch.index.return_value = pitSearch
+        testInstance.query = mockSearch
+
+        testResult = testInstance.executeCursorQuery(
+            {"pit": "expiredPIT", "searchAfter": ["testSort", 42]}, 10
+        )
+
+        assert testResult._extract_mock_name() == "mockRes"
+        mockSearch.extra.assert_called_once_with(search_after=["testSort"])
+
+    def test_closePointInTime(self, testInstance, mocker):
+        mockConnections = mocker.patch("api.elastic.connections")
+
+        testInstance.closePointInTime("testPIT")
+
+        mockConnections.get_connection().close_point_in_time.assert_called_once_with(
+            body={"id": "testPIT"}
+        )
+
+    def test_closePointInTime_already_closed(self, testInstance, mocker):
+        mockConnections = mocker.patch("api.elastic.connections")
+        mockConnections.get_connection().close_point_in_time.side_effect = (
+            NotFoundError(404, "search_context_missing_exception")
+        )
+
+        testInstance.closePointInTime("testPIT")
+
+    def test_applyFacetCache_stores_facets(self, testInstance, mocker):
+        mockSetFacets = mocker.patch.object(ElasticClient, "setFacetCache")
+        mockRes = mocker.MagicMock()
+        mockRes.to_dict.return_value = {
+            "hits": {"total": {"value": 25}, "hits": []},
+            "aggregations": {"govDoc": {}},
+        }
+
+        assert testInstance.applyFacetCache({}, mockRes) == mockRes
+
+        mockSetFacets.assert_called_once_with(
+            {}, {"aggregations": {"govDoc": {}}, "total": 25, "relation": "eq"}
+        )
+
+    def test_applyFacetCache_separate_facet_request(self, testInstance, mocker):
+        mockSetFacets = mocker.patch.object(ElasticClient, "setFacetCache")
+        mockRes = mocker.MagicMock()
+        mockRes.to_dict.return_value = {
+            "hits": {"total": {"value": 10000, "relation": "gte"}, "hits": []}
+        }
+        mockFuture = mocker.MagicMock()
+        mockFuture.result().to_dict.return_value = {
+            "hits": {"total": {"value": 10000, "relation": "gte"}, "hits": []},
+            "aggregations": {"govDoc": {}},
+        }
+
+        testInstance.query = Search()
+
+        testResult = testInstance.applyFacetCache({}, mockRes, facetFuture=mockFuture)
+
+        assert testResult.aggregations.to_dict() == {"govDoc": {}}
+        assert testResult.hits.total.relation == "gte"
+        mockSetFacets.assert_called_once_with(
+            {}, {"aggregations": {"govDoc": {}}, "total": 10000, "relation": "gte"}
+        )
+
+    def test_executeFacetQuery(self, testInstance, mocker):
+        mockAggregations = mocker.patch.object(ElasticClient, "applyAggregations")
+        mockQuery = mocker.MagicMock()
+        testInstance.query = mocker.MagicMock(name="replacedQuery")
+
+        assert testInstance.executeFacetQuery(mockQuery) == mockQuery.extra().execute()
+
+        mockQuery.extra.assert_any_call(size=0)
+        mockAggregations.assert_called_once_with(mockQuery.extra())
+
+    def test_applyFacetCache_merges_cached_facets(self, testInstance, mocker):
+        mockRes = mocker.MagicMock()
+        mockRes.to_dict.return_value = {"hits": {"total": {"value": 25}, "hits": []}}
+
+        testInstance.query = Search()
+        testInstance.cachedFacets = {"aggregations": {"govDoc": {}}, "total": 25}
+
+        testResult = testInstance.applyFacetCache({}, mockRes)
+
+        assert testResult.aggregations.to_dict() == {"govDoc": {}}
+
+    def test_generateFacetHash_ignores_sort(self):
+        assert ElasticClient.generateFacetHash(
+            {"query": [("keyword", "test")], "sort": [("title", "asc")]}
+        ) == ElasticClient.generateFacetHash(
+            {"query": [("keyword", "test")], "sort": []}
         )
 
     def test_executeReversedQuery(self, testInstance, mockSearch, searchMocks):
@@ -559,10 +851,14 @@ class TestElasticClient:
     def test_setPageResultCache(self, testInstance, mocker):
         testInstance.redis = mocker.MagicMock()
 
-        testInstance.setPageResultCache("testCacheKey", ["Test", "Sort"])
+        testInstance.setPageResultCache(
+            "testCacheKey", {"pit": None, "searchAfter": ["Test", "Sort"]}
+        )
 
         testInstance.redis.set.assert_called_once_with(
-            "test/queryPaging/testCacheKey", "Test|Sort", ex=86400
+            "test/queryCursor/testCacheKey",
+            '{"pit": null, "searchAfter": ["Test", "Sort"]}',
+            ex=86400,
         )
 
     def test_getPageResultCache(self, testInstance, mocker):
@@ -570,7 +866,7 @@ class TestElasticClient:
 
         testInstance.getPageResultCache("testCacheKey")
 
-        testInstance.redis.get("test/queryPaging/testCacheKey")
+        testInstance.redis.get.assert_called_once_with("test/queryCursor/testCacheKey")
 
     def test_generateQueryHash(self, mocker):
         mockMakeHashable = mocker.patch.object(ElasticClient, "makeDictHashable")
@@ -581,6 +877,13 @@ class TestElasticClient:
             == "1711934bfb75c5942d7683190e93b7efc5d89274"
         )
 
+    def test_generateQueryHash_differs_by_page_size(self):
+        params = {"query": [("keyword", "test")], "sort": [], "filter": []}
+
+        assert ElasticClient.generateQueryHash(
+            {**params, "size": 10}, 0
+        ) != ElasticClient.generateQueryHash({**params, "size": 50}, 0)
+
     def test_makeDictHashable(self, mocker):
         testHashable = ElasticClient.makeDictHashable(
             {
@@ -1206,6 +1509,25 @@ class TestElasticClient:
         mockFilters.assert_called_once_with(size=1)
         mockAggregations.assert_called_once()
 
+    def test_addFiltersAndAggregations_cached_facets(self, testInstance, mocker):
+        mockFilters = mocker.patch.object(ElasticClient, "applyFilters")
+        mockAggregations = mocker.patch.object(ElasticClient, "applyAggregations")
+
+        testInstance.cachedFacets = {"aggregations": {}, "total": 1}
+        testInstance.addFiltersAndAggregations(1)
+
+        mockFilters.assert_called_once_with(size=1)
+        mockAggregations.assert_not_called()
+
+    def test_addFiltersAndAggregations_separate_facets(self, testInstance, mocker):
+        mocker.patch.object(ElasticClient, "applyFilters")
+        mockAggregations = mocker.patch.object(ElasticClient, "applyAggregations")
+
+        testInstance.separateFacets = True
+        testInstance.addFiltersAndAggregations(1)
+
+        mockAggregations.assert_not_called()
+
     def test_geneateDateRange_start_end(self):
         testRange = ElasticClient.generateDateRange(
             [("startYear", 1900), ("endYear", 2000)]
@@ -0,0 +1,191 @@
+import pytest
+
+from elasticsearch.exceptions import NotFoundError, RequestError
+from elasticsearch_dsl import Search
+from elasticsearch_dsl.connections import connections
+from tests.helper import TestHelpers
+from api.elastic import ElasticClient
+
+
+class FakeElasticsearch:
+    """An in-memory stand-in for the search and point in time APIs that rejects the
+    requests Elasticsearch rejects: an index alongside a point in time, an unknown
+    point in time, and a search_after that does not match the sort, which gains an
+    implicit _shard_doc tiebreaker in point in time searches
+    """
+
+    def __init__(self, docs):
+        self.docs = [
+            {"_id": str(shardDoc), "_source": doc, "_shard_doc": shardDoc}
+            for shardDoc, doc in enumerate(docs)
+        ]
+        self.openPits = set()
+        self.pitCount = 0
+        self.requests = []
+
+    def open_point_in_time(self, index, keep_alive):
+        self.pitCount += 1
+        pitID = f"pit{self.pitCount}"
+        self.openPits.add(pitID)
+
+        return {"id": pitID}
+
+    def close_point_in_time(self, body):
+        if body["id"] not in self.openPits:
+            raise NotFoundError(404, "search_context_missing_exception")
+
+        self.openPits.remove(body["id"])
+
+    def search(self, index=None, **request):
+        self.requests.append(request)
+
+        pit = request.get("pit")
+        sortFields = [
+            sort if isinstance(sort, str) else list(sort.keys())[0]
+            for sort in request["sort"]
+        ]
+
+        if pit:
+            if index:
+                raise RequestError(400, "illegal_argument_exception")
+
+            if pit["id"] not in self.openPits:
+                raise NotFoundError(404, "search_context_missing_exception")
+
+            sortFields.append("_shard_doc")
+
+        searchAfter = request.get("search_after")
+
+        if searchAfter is not None and len(searchAfter) != len(sortFields):
+            raise RequestError(400, "search_after does not match the sort")
+
+        def sortValues(doc):
+            return [
+                doc["_shard_doc"] if field == "_shard_doc" else doc["_source"][field]
+                for field in sortFields
+            ]
+
+        hits = sorted(self.docs, key=sortValues)
+
+        if searchAfter is not None:
+            hits = [hit for hit in hits if sortValues(hit) > searchAfter]
+
+        start = request.get("from_", 0)
+        hits = hits[start : start + request.get("size", 10)]
+
+        response = {
+            "hits": {
+                "total": {"value": len(self.docs), "relation": "eq"},
+                "hits": [
+                    {
+                        "_id": hit["_id"],
+                        "_source": hit["_source"],
+                        "sort": sortValues(hit),
+                    }
+                    for hit in hits
+                ],
+            }
+        }
+
+        if pit:
+            response["pit_id"] = pit["id"]
+
+        return response
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class TestElasticClientPaging:
+    PARAMS = {"query": [("keyword", "test")], "filter": [], "sort": []}
+
+    @classmethod
+    def setup_class(cls):
+        TestHelpers.setEnvVars()
+
+    @classmethod
+    def teardown_class(cls):
+        TestHelpers.clearEnvVars()
+
+    @pytest.fixture
+    def fakeES(self, mocker):
+        # Titles repeat so that pages break inside runs of equal titles
+        fakeES = FakeElasticsearch(
+            [{"uuid": uuid, "sort_title": f"title{uuid // 2}"} for uuid in range(11)]
+        )
+        mocker.patch.dict(connections._conns, {"default": fakeES})
+
+        return fakeES
+
+    @pytest.fixture
+    def redis(self):
+        return FakeRedis()
+
+    def search(self, redis, page, perPage=3):
+        class PagingElasticClient(ElasticClient):
+            def __init__(self, redisClient):
+                self.esIndex = "test_es_index"
+                self.environment = "test"
+                self.redis = redisClient
+                self.sortReversed = False
+                self.cachedFacets = None
+                self.separateFacets = False
+
+        client = PagingElasticClient(redis)
+        client.query = Search(index="test_es_index").sort(
+            {"sort_title": "asc"}, {"uuid": "asc"}
+        )
+
+        res = client.executeSearchQuery(self.PARAMS, page, perPage)
+
+        return [hit.uuid for hit in res.hits]
+
+    def test_pages_through_point_in_time(self, fakeES, redis):
+        pages = [self.search(redis, page) for page in range(4)]
+
+        assert pages == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10]]
+        assert [request.get("pit") is not None for request in fakeES.requests] == [
+            True,
+            True,
+            True,
+            True,
+        ]
+
+    def test_first_page_reuses_cached_point_in_time(self, fakeES, redis):
+        self.search(redis, 0)
+        self.search(redis, 0)
+        self.search(redis, 1)
+        self.search(redis, 1)
+
+        assert fakeES.pitCount == 1
+        assert len(fakeES.requests) == 3
+
+    def test_single_page_closes_point_in_time(self, fakeES, redis):
+        assert self.search(redis, 0, perPage=20) == list(range(11))
+
+        assert fakeES.pitCount == 1
+        assert fakeES.openPits == set()
+
+    def test_expired_point_in_time_pages_without_it(self, fakeES, redis):
+        self.search(redis, 0)
+        self.search(redis, 1)
+
+        fakeES.openPits.clear()
+
+        assert self.search(redis, 2) == [6, 7, 8]
+        assert self.search(redis, 3) == [9, 10]
+        assert fakeES.pitCount == 1
+
+    def test_cursor_without_point_in_time(self, fakeES, redis):
+        assert self.search(redis, 1) == [3, 4, 5]
+        assert self.search(redis, 2) == [6, 7, 8]
+
+        assert fakeES.pitCount == 0
@@ -0,0 +1,52 @@
+from datetime import datetime
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+import pytest
+
+from api.jsonProvider import createJSONProvider, OrjsonProvider
+
+
+class TestJSONProvider:
+    @pytest.fixture
+    def testApp(self):
+        return Flask("test")
+
+    @pytest.fixture
+    def testObject(self):
+        return {
+            "title": "Test Title",
+            "modified": datetime(2024, 1, 2, 3, 4, 5),
+            "links": [{"href": "/test", "templated": True}],
+            "rank": 1.5,
+            "sub_title": None,
+        }
+
+    def test_createJSONProvider_without_orjson(self, testApp, mocker):
+        mocker.patch("api.jsonProvider.orjson", None)
+
+        assert type(createJSONProvider(testApp)) is DefaultJSONProvider
+
+    def test_createJSONProvider_with_orjson(self, testApp):
+        pytest.importorskip("orjson")
+
+        assert isinstance(createJSONProvider(testApp), OrjsonProvider)
+
+    def test_response_matches_default_provider(self, testApp, testObject):
+        pytest.importorskip("orjson")
+
+        with testApp.app_context():
+            defaultResponse = DefaultJSONProvider(testApp).response(testObject)
+            fastResponse = OrjsonProvider(testApp).response(testObject)
+
+        assert fastResponse.get_data() == defaultResponse.get_data()
+        assert fastResponse.mimetype == "application/json"
+
+    def test_loads_round_trip(self, testApp):
+        pytest.importorskip("orjson")
+
+        provider = OrjsonProvider(testApp)
+
+        assert provider.loads(provider.dumps({"b": 1, "a": [2]})) == {
+            "a": [2],
+            "b": 1,
+        }
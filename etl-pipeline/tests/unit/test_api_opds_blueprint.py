@@ -98,7 +98,8 @@ class TestOPDSBlueprint:
         mockDB = mocker.MagicMock()
         mockDBClient = mocker.patch("api.blueprints.drbOPDS2.DBClient")
         mockDBClient.return_value = mockDB
-        mockDB.fetchNewWorks.return_value = (3, ["pub1", "pub2", "pub3"])
+        testPubs = [mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()]
+        mockDB.fetchNewWorks.return_value = (3, testPubs)
 
         opdsMocks["constructBaseFeed"].return_value = "testBaseFeed"
 
@@ -114,12 +115,14 @@ class TestOPDSBlueprint:
             opdsMocks["constructBaseFeed"].assert_called_once_with(
                 "/new?", "New Publications: Digital Research Books", grouped=True
             )
-            mockDB.fetchNewWorks.assert_called_once_with(page=0, size=25)
+            mockDB.fetchNewWorks.assert_called_once_with(
+                page=0, size=25, after=None, countTotal=True
+            )
             mockAddPaging.assert_called_once_with(
                 "testBaseFeed", "/new?", 3, page=1, perPage=25
             )
             opdsMocks["addPublications"].assert_called_once_with(
-                "testBaseFeed", ["pub1", "pub2", "pub3"], grouped=True
+                "testBaseFeed", testPubs, grouped=True
             )
             mockUtils["formatOPDS2Object"].assert_called_once_with(200, "testBaseFeed")
 
@@ -0,0 +1,72 @@
+from datetime import datetime
+import pytest
+
+from api.pageCache import PageCache
+
+
+class TestPageCache:
+    @pytest.fixture
+    def testInstance(self, mocker):
+        mocker.patch.dict("os.environ", {"ENVIRONMENT": "test"})
+
+        return PageCache(mocker.MagicMock(), "newWorks")
+
+    def test_generateKey(self, testInstance):
+        firstKey = testInstance.generateKey(1, "title", 10)
+
+        assert firstKey == testInstance.generateKey(1, "title", 10)
+        assert firstKey != testInstance.generateKey(2, "title", 10)
+        assert firstKey.startswith("test/api/pages/newWorks/")
+
+    def test_setCursor_and_getCursor(self, testInstance):
+        testInstance.setCursor("testKey", 3, (datetime(2024, 1, 2, 3, 4), 10))
+
+        testInstance.redis.pipeline().hset.assert_called_once_with(
+            "testKey/cursors", 3, '["2024-01-02T03:04:00", 10]'
+        )
+
+        testInstance.redis.hget.return_value = b'["2024-01-02T03:04:00", 10]'
+
+        assert testInstance.getCursor("testKey", 3, (datetime.fromisoformat, int)) == (
+            datetime(2024, 1, 2, 3, 4),
+            10,
+        )
+        testInstance.redis.hget.assert_called_once_with("testKey/cursors", 3)
+
+    def test_getCursor_first_page(self, testInstance):
+        assert testInstance.getCursor("testKey", 1, (str, int)) is None
+
+        testInstance.redis.hget.assert_not_called()
+
+    def test_getCursor_redis_error(self, testInstance):
+        testInstance.redis.hget.side_effect = Exception
+
+        assert testInstance.getCursor("testKey", 2, (str, int)) is None
+
+    def test_total(self, testInstance):
+        testInstance.setTotal("testKey", 25)
+        testInstance.redis.set.assert_called_once_with(
+            "testKey/total", 25, ex=PageCache.CACHE_TIME
+        )
+
+        testInstance.redis.get.return_value = b"25"
+        assert testInstance.getTotal("testKey") == 25
+
+        testInstance.redis.get.return_value = None
+        assert testInstance.getTotal("testKey") is None
+
+    def test_getCounts_skips_missing(self, testInstance):
+        testInstance.redis.hmget.return_value = [b"4", None]
+
+        assert testInstance.getCounts("testKey", [1, 2]) == {1: 4}
+
+    def test_no_redis_client(self):
+        pageCache = PageCache(None, "newWorks")
+
+        pageCache.setTotal("testKey", 10)
+        pageCache.setCursor("testKey", 2, ("title", 1))
+
+        assert pageCache.getTotal("testKey") is None
+        assert pageCache.getCursor("testKey", 2, (str, int)) is None
+        assert pageCache.getCounts("testKey", [1]) == {}
+        assert pageCache.fetchCollectionsVersion() is None
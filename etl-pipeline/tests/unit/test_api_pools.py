@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy.exc import TimeoutError
+
+from api.pools import TimedBlockingConnectionPool, TimedQueuePool
+
+
+class TestConnectionPools:
+    @pytest.fixture
+    def mockTrack(self, mocker):
+        return mocker.patch("api.pools.monitor.track_pool_checkout_wait")
+
+    def test_TimedQueuePool_reports_checkout_wait(self, mockTrack, mocker):
+        mockConnection = mocker.MagicMock()
+        pool = TimedQueuePool(lambda: mockConnection, pool_size=1, max_overflow=0)
+
+        pool.connect().close()
+
+        mockTrack.assert_called_once()
+        assert mockTrack.call_args.args[0] == "Postgres"
+        assert mockTrack.call_args.args[1] >= 0
+
+    def test_TimedQueuePool_reports_timeouts(self, mockTrack, mocker):
+        pool = TimedQueuePool(
+            lambda: mocker.MagicMock(), pool_size=1, max_overflow=0, timeout=0.01
+        )
+        heldConnection = pool.connect()
+
+        with pytest.raises(TimeoutError):
+            pool.connect()
+
+        assert mockTrack.call_count == 2
+        heldConnection.close()
+
+    def test_TimedBlockingConnectionPool_reports_checkout_wait(self, mockTrack, mocker):
+        mocker.patch("redis.connection.Connection.connect")
+        pool = TimedBlockingConnectionPool(max_connections=1)
+
+        connection = pool.get_connection("GET")
+
+        mockTrack.assert_called_once()
+        assert mockTrack.call_args.args[0] == "Redis"
+        pool.release(connection)
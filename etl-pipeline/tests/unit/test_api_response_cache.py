@@ -0,0 +1,99 @@
+from flask import Flask, request
+import pytest
+
+from api.responseCache import ResponseCache
+
+
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def clear_local_cache(self):
+        ResponseCache.localCache.clear()
+
+    @pytest.fixture
+    def test_app(self):
+        return Flask("test")
+
+    @pytest.fixture
+    def test_instance(self, mocker):
+        mocker.patch.dict("os.environ", {"ENVIRONMENT": "test"})
+
+        return ResponseCache(mocker.MagicMock(), "work")
+
+    def test_generateKey_ignores_param_order(self, test_instance, test_app):
+        with test_app.test_request_context("/?showAll=true&filter=format:pdf"):
+            firstKey = test_instance.generateKey("uuid1", request, "v2")
+
+        with test_app.test_request_context("/?filter=format:pdf&showAll=true"):
+            secondKey = test_instance.generateKey("uuid1", request, "v2")
+
+        with test_app.test_request_context("/?filter=format:pdf&showAll=true"):
+            readerKey = test_instance.generateKey("uuid1", request, "v1")
+
+        assert firstKey == secondKey
+        assert firstKey != readerKey
+        assert firstKey.startswith("test/api/responses/work/uuid1/")
+
+    def test_fetchVersion(self, test_instance):
+        test_instance.redis.mget.return_value = [b"3", None]
+
+        assert test_instance.fetchVersion("uuid1") == "3:0"
+        test_instance.redis.mget.assert_called_once_with(
+            ["test/api/versions/work/uuid1", "test/api/versions/collections"]
+        )
+
+    def test_get_current_version(self, test_instance):
+        test_instance.redis.hgetall.return_value = {
+            b"workUUID": b"uuid1",
+            b"version": b"3:1",
+            b"body": b'{"uuid": "uuid1"}',
+        }
+        test_instance.redis.mget.return_value = [b"3", b"1"]
+
+        assert test_instance.get("testKey") == {"uuid": "uuid1"}
+
+    def test_get_stale_version(self, test_instance):
+        test_instance.redis.hgetall.return_value = {
+            b"workUUID": b"uuid1",
+            b"version": b"3:1",
+            b"body": b'{"uuid": "uuid1"}',
+        }
+        test_instance.redis.mget.return_value = [b"4", b"1"]
+
+        assert test_instance.get("testKey") is None
+
+    def test_get_no_redis_client(self):
+        assert ResponseCache(None, "work").get("testKey") is None
+
+    def test_set_serves_from_local_cache(self, test_instance, test_app):
+        test_instance.redis.mget.return_value = [b"3", None]
+
+        with test_app.app_context():
+            test_instance.set("testKey", "uuid1", "3:0", {"uuid": "uuid1"})
+
+        assert test_instance.get("testKey") == {"uuid": "uuid1"}
+        test_instance.redis.pipeline().hset.assert_called_once()
+        test_instance.redis.hgetall.assert_not_called()
+
+    def test_set_without_version(self, test_instance):
+        test_instance.set("testKey", "uuid1", None, {"uuid": "uuid1"})
+
+        test_instance.redis.pipeline.assert_not_called()
+        assert ResponseCache.localCache == {}
+
+    def test_local_cache_evicts_least_recently_used(
+        self, test_instance, test_app, mocker
+    ):
+        mocker.patch.object(ResponseCache, "LOCAL_CACHE_SIZE", 2)
+
+        with test_app.app_context():
+            for key in ["key1", "key2", "key3"]:
+                test_instance.set(key, "uuid1", "1:0", {})
+
+        assert list(ResponseCache.localCache.keys()) == ["key2", "key3"]
+
+    def test_invalidateCollections(self, test_instance):
+        test_instance.invalidateCollections()
+
+        test_instance.redis.pipeline().incr.assert_called_once_with(
+            "test/api/versions/collections"
+        )
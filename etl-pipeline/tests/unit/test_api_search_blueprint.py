@@ -154,6 +154,7 @@ class TestSearchBlueprint:
                 "searchResponse",
                 {
                     "totalWorks": 5,
+                    "totalWorksLabel": "5",
                     "works": "testWorks",
                     "paging": "testPaging",
                     "facets": "testFacets",
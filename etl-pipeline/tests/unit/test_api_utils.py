@@ -2,9 +2,14 @@ from hashlib import scrypt
 import pytest
 from random import shuffle
 from flask import Flask, request
+from sqlalchemy import create_engine, event, insert, text
+import uuid
 
+from api.db import DBClient
 from api.utils import APIUtils
 from datetime import datetime, timezone
+from model import Collection
+from model.postgres.collection import COLLECTION_EDITIONS
 
 
 class TestAPIUtils:
@@ -289,7 +294,11 @@ class TestAPIUtils:
 
         with testApp.test_request_context("/"):
             outWork = APIUtils.formatWorkOutput(
-                "testWork", None, mocker.sentinel.dbClient, request=request
+                "testWork",
+                None,
+                mocker.sentinel.dbClient,
+                request=request,
+                editionCollections=mocker.sentinel.editionCollections,
             )
 
         assert outWork["uuid"] == 1
@@ -302,6 +311,7 @@ class TestAPIUtils:
             mocker.sentinel.dbClient,
             reader=None,
             request=request,
+            editionCollections=mocker.sentinel.editionCollections,
         )
 
     def test_formatWorkOutput_multiple_works(self, mocker, testApp):
@@ -322,6 +332,7 @@ class TestAPIUtils:
                 ],
                 dbClient=mocker.sentinel.dbClient,
                 request=request,
+                editionCollections=mocker.sentinel.editionCollections,
             )
 
         assert outWorks == ["formattedWork1", "formattedWork2"]
@@ -335,6 +346,7 @@ class TestAPIUtils:
                     formats=None,
                     reader=None,
                     request=request,
+                    editionCollections=mocker.sentinel.editionCollections,
                 ),
                 mocker.call(
                     testWorks[1],
@@ -344,6 +356,7 @@ class TestAPIUtils:
                     formats=None,
                     reader=None,
                     request=request,
+                    editionCollections=mocker.sentinel.editionCollections,
                 ),
             ]
         )
@@ -355,6 +368,100 @@ class TestAPIUtils:
             ]
         )
 
+    def test_formatWorkOutput_fetches_collections_once(self, mocker, testApp):
+        mockFormatEdition = mocker.patch.object(APIUtils, "formatEdition")
+        mockFormatEdition.side_effect = lambda edition, *args, **kwargs: {
+            "edition_id": edition.id,
+            "inCollections": kwargs["editionInCollection"],
+            "items": [{"item_id": edition.id}],
+        }
+        mocker.patch.object(APIUtils, "addWorkMeta")
+
+        testWorks = []
+        for workIndex in range(10):
+            editions = [
+                mocker.MagicMock(id=workIndex * 50 + editionIndex, items=[])
+                for editionIndex in range(50)
+            ]
+            testWorks.append(
+                mocker.MagicMock(
+                    uuid=f"uuid{workIndex}",
+                    editions=editions,
+                    __iter__=lambda _: iter([]),
+                )
+            )
+
+        engine = create_engine("sqlite://")
+
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE TABLE collections (id INTEGER, uuid CHAR(32), "
+                    "title TEXT, creator TEXT, description TEXT, "
+                    "date_created TIMESTAMP, date_modified TIMESTAMP)"
+                )
+            )
+            connection.execute(
+                text(
+                    "CREATE TABLE collection_editions "
+                    "(collection_id INTEGER, edition_id INTEGER)"
+                )
+            )
+            connection.execute(
+                insert(Collection.__table__),
+                [
+                    {"id": 1, "uuid": uuid.UUID(int=1), "title": "Collection 1"},
+                    {"id": 2, "uuid": uuid.UUID(int=2), "title": "Collection 2"},
+                ],
+            )
+            connection.execute(
+                insert(COLLECTION_EDITIONS),
+                [
+                    {"collection_id": 1, "edition_id": 0},
+                    {"collection_id": 2, "edition_id": 1},
+                    {"collection_id": 2, "edition_id": 499},
+                ],
+            )
+
+        statements = []
+        event.listen(
+            engine,
+            "after_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        dbClient = DBClient(engine)
+        dbClient.createSession()
+
+        with testApp.test_request_context("/"):
+            outWorks = APIUtils.formatWorkOutput(
+                testWorks,
+                [(f"uuid{workIndex}", None, None) for workIndex in range(10)],
+                dbClient=dbClient,
+                request=request,
+            )
+
+        dbClient.closeSession()
+
+        # Every edition on the page is resolved by a single statement, so looking up
+        # collections per work or per edition fails here
+        assert len(statements) == 1
+        assert [c["uuid"] for c in outWorks[0]["inCollections"]] == [
+            uuid.UUID(int=1),
+            uuid.UUID(int=2),
+        ]
+        assert outWorks[0]["editions"][0]["inCollections"] == [
+            {
+                "uuid": uuid.UUID(int=1),
+                "title": "Collection 1",
+                "creator": None,
+                "description": None,
+                "numberOfItems": 1,
+            }
+        ]
+        assert outWorks[1]["inCollections"] == []
+        assert [c["numberOfItems"] for c in outWorks[9]["inCollections"]] == [2]
+
     def test_formatWork_showAll(self, testWork, mocker, testApp):
         mockFormatEdition = mocker.patch.object(APIUtils, "formatEdition")
         mockFormatEdition.return_value = {
@@ -456,6 +563,7 @@ class TestAPIUtils:
         mockEdition = mocker.MagicMock(dcdw_uuids="testUUID")
 
         mockDB.fetchSingleEdition.return_value = mockEdition
+        mockDBClient.fetchEditionCollections.return_value = {}
 
         with testApp.test_request_context("/"):
             assert APIUtils.formatEditionOutput(
@@ -192,6 +192,27 @@ class TestWorkBlueprint:
                 },
             )
 
+    def test_get_work_cached(self, mock_utils, test_app, mocker):
+        mock_db = mocker.MagicMock()
+        mock_db.__enter__.return_value = mock_db
+        mocker.patch("api.blueprints.drbWork.DBClient", return_value=mock_db)
+
+        mock_cache = mocker.patch("api.blueprints.drbWork.ResponseCache")
+        mock_cache.return_value.get.return_value = {"uuid": "cachedWork"}
+
+        mock_utils["normalizeQueryParams"].return_value = {}
+        mock_utils["formatResponseObject"].return_value = "singleWorkResponse"
+
+        with test_app.test_request_context("/"):
+            test_api_response = get_work("a8512b02-779b-45c6-95a3-56f90831be46")
+
+            assert test_api_response == "singleWorkResponse"
+            mock_db.fetchSingleWork.assert_not_called()
+            mock_utils["formatWorkOutput"].assert_not_called()
+            mock_utils["formatResponseObject"].assert_called_once_with(
+                200, "singleWork", {"uuid": "cachedWork"}
+            )
+
     def test_get_work_invalid_id(self, mock_utils, test_app):
         mock_utils["formatResponseObject"].return_value = "400Response"
 
@@ -0,0 +1,86 @@
+import threading
+import time
+import pytest
+
+from services.sources.concurrent_fetch import HostLimiter, map_in_order, prefetch
+
+
+class TestConcurrentFetch:
+    def test_prefetch_yields_pages_in_order(self):
+        assert list(prefetch(iter(range(10)), depth=3)) == list(range(10))
+
+    def test_prefetch_reraises_source_errors(self):
+        def failing_pages():
+            yield 1
+            raise ValueError("page failed")
+
+        pages = prefetch(failing_pages())
+
+        assert next(pages) == 1
+
+        with pytest.raises(ValueError):
+            next(pages)
+
+    def test_prefetch_stops_producer_when_closed(self):
+        fetched = []
+
+        def pages():
+            for page in range(100):
+                fetched.append(page)
+                yield page
+
+        prefetched_pages = prefetch(pages(), depth=1)
+
+        assert next(prefetched_pages) == 0
+
+        prefetched_pages.close()
+        time.sleep(0.3)
+
+        assert len(fetched) < 100
+
+    def test_map_in_order_preserves_input_order(self):
+        def slow_double(value):
+            time.sleep(0.01 * (5 - value % 5))
+            return value * 2
+
+        assert list(map_in_order(slow_double, range(20), max_workers=4)) == [
+            value * 2 for value in range(20)
+        ]
+
+    def test_map_in_order_bounds_in_flight_calls(self):
+        submitted = []
+
+        def items():
+            for item in range(50):
+                submitted.append(item)
+                yield item
+
+        results = map_in_order(
+            lambda item: item, items(), max_workers=2, max_in_flight=4
+        )
+
+        assert next(results) == 0
+        assert len(submitted) == 4
+
+        results.close()
+
+    def test_host_limiter_caps_concurrent_requests(self):
+        host_limiter = HostLimiter(max_per_host=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def request(_):
+            with host_limiter.limit("https://example.com/page"):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+
+                time.sleep(0.01)
+
+                with lock:
+                    active.pop()
+
+        list(map_in_order(request, range(10), max_workers=5))
+
+        assert max(peak) <= 2
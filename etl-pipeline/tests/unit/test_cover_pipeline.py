@@ -0,0 +1,103 @@
+import hashlib
+import io
+
+from botocore.exceptions import ClientError
+from PIL import Image
+import pytest
+
+from digital_assets import cover_images
+from digital_assets.cover_pipeline import CoverResizePipeline
+
+
+def encode_image(size, image_format):
+    image_stream = io.BytesIO()
+    Image.new("RGB", size, "red").save(image_stream, format=image_format)
+
+    return image_stream.getvalue()
+
+
+class TestCoverImages:
+    @pytest.mark.parametrize("image_format", ["JPEG", "PNG"])
+    def test_resize_cover_bytes(self, image_format):
+        cover = Image.open(
+            io.BytesIO(
+                cover_images.resize_cover_bytes(
+                    encode_image((1200, 1600), image_format)
+                )
+            )
+        )
+
+        assert cover.size == (300, 400)
+        assert cover.format == image_format
+
+
+class TestCoverResizePipeline:
+    @pytest.fixture
+    def source_image(self):
+        return encode_image((1200, 1600), "JPEG")
+
+    @pytest.fixture
+    def mock_s3(self, mocker, source_image):
+        mock_s3 = mocker.MagicMock()
+        mock_s3.head_object.return_value = {"ETag": '"sourceHash"', "Metadata": {}}
+        mock_s3.get_object.return_value = {"Body": io.BytesIO(source_image)}
+
+        return mock_s3
+
+    @pytest.fixture
+    def test_instance(self, mock_s3):
+        return CoverResizePipeline(
+            mock_s3, "test_bucket", download_workers=2, resize_workers=1
+        )
+
+    def test_run_resizes_in_place(self, test_instance, mock_s3):
+        result = test_instance.run(["covers/test.jpg"])
+
+        assert result.resized == ["covers/test.jpg"]
+        upload_args = mock_s3.upload_fileobj.call_args.kwargs
+        cover = upload_args["Fileobj"].getvalue()
+        assert upload_args["Key"] == "covers/test.jpg"
+        assert upload_args["ExtraArgs"]["ContentType"] == "image/jpeg"
+        assert upload_args["ExtraArgs"]["Metadata"] == {
+            "source-hash": "sourceHash",
+            "cover-hash": hashlib.md5(cover).hexdigest(),
+        }
+        assert Image.open(io.BytesIO(cover)).size == (300, 400)
+
+    def test_run_skips_resized_covers(self, test_instance, mock_s3):
+        mock_s3.head_object.return_value = {
+            "ETag": '"coverHash"',
+            "Metadata": {"source-hash": "sourceHash", "cover-hash": "coverHash"},
+        }
+
+        result = test_instance.run(["covers/test.jpg"])
+
+        assert result.skipped == ["covers/test.jpg"]
+        mock_s3.get_object.assert_not_called()
+        mock_s3.upload_fileobj.assert_not_called()
+
+    def test_run_from_urls(self, test_instance, mock_s3, mocker, source_image):
+        mock_s3.head_object.side_effect = ClientError({}, "head_object")
+        mock_get = mocker.patch("digital_assets.cover_pipeline.requests.get")
+        mock_get.return_value.content = source_image
+
+        result = test_instance.run(
+            ["https://example.com/test.jpg"],
+            destination_key=lambda url: "covers/test.jpg",
+        )
+
+        assert result.resized == ["covers/test.jpg"]
+        assert (
+            mock_s3.upload_fileobj.call_args.kwargs["ExtraArgs"]["Metadata"][
+                "source-hash"
+            ]
+            == hashlib.md5(source_image).hexdigest()
+        )
+
+    def test_run_records_failures(self, test_instance, mock_s3):
+        mock_s3.get_object.return_value = {"Body": io.BytesIO(b"not an image")}
+
+        result = test_instance.run(["covers/test.jpg", "covers/other.jpg"])
+
+        assert sorted(result.failed) == ["covers/other.jpg", "covers/test.jpg"]
+        mock_s3.upload_fileobj.assert_not_called()
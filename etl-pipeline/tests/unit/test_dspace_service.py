@@ -0,0 +1,173 @@
+from io import BytesIO
+import pytest
+
+from services.sources.dspace_service import (
+    DSpaceService,
+    OAIError,
+    RESUMPTION_TOKEN_TTL,
+)
+
+OAI_PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+    <ListRecords>
+        <record><header><identifier>{page}-1</identifier></header></record>
+        <record><header><identifier>{page}-2</identifier></header></record>
+        {token}
+    </ListRecords>
+</OAI-PMH>
+"""
+
+
+def build_page(page: int, token: str = None) -> BytesIO:
+    resumption_token = (
+        f"<resumptionToken>{token}</resumptionToken>" if token else "<resumptionToken/>"
+    )
+
+    return BytesIO(OAI_PAGE.format(page=page, token=resumption_token).encode("utf-8"))
+
+
+def build_error_page(code: str) -> BytesIO:
+    return BytesIO(
+        f"""<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+    <error code="{code}">The value of the resumptionToken argument is invalid</error>
+</OAI-PMH>
+""".encode("utf-8")
+    )
+
+
+class TestDSpaceService:
+    @pytest.fixture
+    def test_instance(self, mocker):
+        mocker.patch("services.sources.dspace_service.RedisManager")
+
+        service = DSpaceService(base_url="https://test.org/oai?", source_mapping=None)
+        service.redis_manager.environment = "test"
+
+        return service
+
+    def test_get_resumption_token(self, test_instance):
+        assert test_instance.get_resumption_token(build_page(1, "token-2")) == "token-2"
+        assert test_instance.get_resumption_token(build_page(1)) is None
+
+    def test_get_resumption_token_unescapes_token(self, test_instance):
+        page = build_page(1, "set=a&amp;cursor=100")
+
+        assert test_instance.get_resumption_token(page) == "set=a&cursor=100"
+        assert page.tell() == 0
+
+    def test_get_resumption_token_scans_page_without_readable_tail(self, test_instance):
+        page = BytesIO(build_page(1, "token-2").getvalue() + b" " * 10000)
+
+        assert test_instance.get_resumption_token(page) == "token-2"
+
+    def test_get_resumption_token_no_records_match(self, test_instance):
+        assert (
+            test_instance.get_resumption_token(build_error_page("noRecordsMatch"))
+            is None
+        )
+
+    def test_get_resumption_token_error(self, test_instance):
+        with pytest.raises(OAIError) as oai_error:
+            test_instance.get_resumption_token(build_error_page("badResumptionToken"))
+
+        assert oai_error.value.code == "badResumptionToken"
+
+    def test_iter_records_clears_parsed_records(self, test_instance):
+        identifiers = []
+
+        for record in test_instance._iter_records(build_page(1)):
+            identifiers.append(record.findtext(".//{*}identifier"))
+
+        assert identifiers == ["1-1", "1-2"]
+
+    def test_download_pages_saves_checkpoints(self, test_instance, mocker):
+        pages = {None: build_page(1, "token-2"), "token-2": build_page(2)}
+        mocker.patch.object(
+            test_instance,
+            "download_records",
+            side_effect=lambda start_timestamp, resumption_token: pages[
+                resumption_token
+            ],
+        )
+
+        downloaded_pages = list(test_instance._download_pages())
+
+        assert len(downloaded_pages) == 2
+        test_instance.redis_manager.client.pipeline().hset.assert_called_once_with(
+            "test/checkpoints/dspace/https://test.org/oai?/all", 100, "token-2"
+        )
+        test_instance.redis_manager.client.pipeline().expire.assert_called_once_with(
+            "test/checkpoints/dspace/https://test.org/oai?/all", RESUMPTION_TOKEN_TTL
+        )
+
+    def test_download_pages_resumes_from_checkpoint(self, test_instance, mocker):
+        test_instance.redis_manager.client.hgetall.return_value = {
+            b"100": b"token-2",
+            b"200": b"token-3",
+        }
+        mock_download = mocker.patch.object(
+            test_instance, "download_records", return_value=build_page(3)
+        )
+
+        downloaded_pages = list(test_instance._download_pages(offset=250))
+
+        assert len(downloaded_pages) == 1
+        mock_download.assert_called_once_with(
+            start_timestamp=None, resumption_token="token-3"
+        )
+
+    def test_download_pages_skips_pages_before_offset(self, test_instance, mocker):
+        test_instance.redis_manager.client.hgetall.return_value = {}
+        pages = {None: build_page(1, "token-2"), "token-2": build_page(2)}
+        mocker.patch.object(
+            test_instance,
+            "download_records",
+            side_effect=lambda start_timestamp, resumption_token: pages[
+                resumption_token
+            ],
+        )
+
+        downloaded_pages = list(test_instance._download_pages(offset=100))
+
+        assert downloaded_pages == [pages["token-2"]]
+
+    def test_download_pages_restarts_on_expired_checkpoint(self, test_instance, mocker):
+        test_instance.redis_manager.client.hgetall.return_value = {b"100": b"expired"}
+        pages = {
+            "expired": build_error_page("badResumptionToken"),
+            None: build_page(1, "token-2"),
+            "token-2": build_page(2),
+        }
+        mocker.patch.object(
+            test_instance,
+            "download_records",
+            side_effect=lambda start_timestamp, resumption_token: pages[
+                resumption_token
+            ],
+        )
+
+        downloaded_pages = list(test_instance._download_pages(offset=150))
+
+        assert downloaded_pages == [pages["token-2"]]
+        test_instance.redis_manager.client.delete.assert_called_once_with(
+            "test/checkpoints/dspace/https://test.org/oai?/all"
+        )
+
+    def test_download_pages_raises_on_expired_harvest_token(
+        self, test_instance, mocker
+    ):
+        pages = {
+            None: build_page(1, "token-2"),
+            "token-2": build_error_page("badResumptionToken"),
+        }
+        mocker.patch.object(
+            test_instance,
+            "download_records",
+            side_effect=lambda start_timestamp, resumption_token: pages[
+                resumption_token
+            ],
+        )
+
+        with pytest.raises(OAIError):
+            list(test_instance._download_pages())
@@ -63,6 +63,14 @@ class TestElasticsearchManager:
             max_retries=3,
         )
 
+    def test_create_elastic_connection_pool_size(self, test_instance, mocker):
+        mock_connection = mocker.patch("managers.elasticsearch.connections")
+        mocker.patch("managers.elasticsearch.Elasticsearch")
+
+        test_instance.create_elastic_connection(maxsize=16)
+
+        assert mock_connection.create_connection.call_args.kwargs["maxsize"] == 16
+
     def test_create_elastic_connection_multi_host_success(
         self, test_instance_2, mocker
     ):
@@ -0,0 +1,102 @@
+import pytest
+
+from services.sources.gutenberg_service import GutenbergService
+
+
+class TestGutenbergService:
+    @pytest.fixture
+    def test_instance(self, mocker):
+        mocker.patch("services.sources.gutenberg_service.RedisManager")
+
+        return GutenbergService()
+
+    def test_get_data_files_for_respositories_batches_queries(
+        self, test_instance, mocker
+    ):
+        repositories = [{"name": f"Book_{i}"} for i in range(30)] + [
+            {"name": "no-work-id"}
+        ]
+
+        def mock_query(query):
+            return {
+                "data": {
+                    f"repo{index}": {"rdf": {"text": "<rdf/>"}, "yaml": None}
+                    for index in range(query.count("repository("))
+                }
+            }
+
+        mock_query_graphql = mocker.patch.object(
+            test_instance, "query_graphql", side_effect=mock_query
+        )
+
+        data_files = test_instance.get_data_files_for_respositories(repositories)
+
+        assert mock_query_graphql.call_count == 2
+        assert [work_id for work_id, _, _ in data_files] == [str(i) for i in range(30)]
+        assert data_files[0] == ("0", "<rdf/>", None)
+
+    def test_get_repository_data_files_skips_missing_rdf(self, test_instance, mocker):
+        mocker.patch.object(
+            test_instance,
+            "query_graphql",
+            return_value={
+                "data": {
+                    "repo0": {"rdf": None, "yaml": {"text": "title: test"}},
+                    "repo1": {"rdf": {"text": "<rdf/>"}, "yaml": {"text": "a: b"}},
+                }
+            },
+        )
+
+        data_files = test_instance.get_repository_data_files(
+            [("1", {"name": "Book_1"}), ("2", {"name": "Book_2"})]
+        )
+
+        assert data_files == [("2", "<rdf/>", "a: b")]
+
+    def test_pace_requests_spreads_low_budget(self, test_instance, mocker):
+        mock_sleep = mocker.patch("services.sources.gutenberg_service.time.sleep")
+        mocker.patch("services.sources.gutenberg_service.time.time", return_value=1000)
+
+        test_instance.requests_remaining = 10
+        test_instance.request_limit_reset = 1100
+
+        test_instance.pace_requests()
+
+        mock_sleep.assert_called_once_with(10)
+
+    def test_pace_requests_with_full_budget(self, test_instance, mocker):
+        mock_sleep = mocker.patch("services.sources.gutenberg_service.time.sleep")
+
+        test_instance.requests_remaining = 4000
+        test_instance.request_limit_reset = 1100
+
+        test_instance.pace_requests()
+
+        mock_sleep.assert_not_called()
+
+    def test_get_data_file_pages_skips_to_offset(self, test_instance, mocker):
+        test_instance.redis_manager.client.hgetall.return_value = {}
+        mocker.patch.object(
+            test_instance,
+            "get_repositories",
+            side_effect=[
+                ([{"name": "Book_1"}], True, "cursor-1"),
+                ([{"name": "Book_2"}], False, "cursor-2"),
+            ],
+        )
+        mocker.patch.object(
+            test_instance,
+            "get_data_files_for_respositories",
+            side_effect=lambda respository_data: respository_data,
+        )
+
+        pages = list(test_instance._get_data_file_pages(offset=100))
+
+        assert pages == [[{"name": "Book_2"}]]
+        test_instance.redis_manager.client.pipeline().hset.assert_called_once_with(
+            "{}/checkpoints/gutenberg/created_at".format(
+                test_instance.redis_manager.environment
+            ),
+            100,
+            "cursor-1",
+        )
@@ -0,0 +1,96 @@
+import io
+import json
+
+import pytest
+
+from services import monitor
+
+
+class TestMonitorSpans:
+    @pytest.fixture
+    def mock_metric(self, mocker):
+        return mocker.patch("services.monitor.newrelic.agent.record_custom_metric")
+
+    @pytest.fixture
+    def exporter(self, mocker):
+        exporter = mocker.MagicMock()
+        mocker.patch("services.monitor._timing_exporters", [exporter])
+
+        return exporter
+
+    def test_span_records_duration_as_context_manager(self, mock_metric, exporter):
+        with monitor.span("Test:Block", hop=2) as block_span:
+            pass
+
+        mock_metric.assert_called_once_with(
+            "Custom/Timing/Test:Block", block_span.duration
+        )
+        exporter.export.assert_called_once_with(
+            "Test:Block",
+            block_span.duration,
+            {"parent": None, "error": False, "hop": 2},
+        )
+
+    def test_span_records_each_call_as_decorator(self, mock_metric, exporter):
+        @monitor.span("Test:Function")
+        def timed_function(value):
+            return value * 2
+
+        assert timed_function(2) == 4
+        assert timed_function(3) == 6
+
+        assert mock_metric.call_count == 2
+        assert all(
+            call.args[0] == "Custom/Timing/Test:Function"
+            for call in mock_metric.call_args_list
+        )
+
+    def test_span_records_parent_of_nested_span(self, mock_metric, exporter):
+        with monitor.span("Test:Outer"):
+            with monitor.span("Test:Inner"):
+                pass
+
+        inner_call, outer_call = exporter.export.call_args_list
+
+        assert inner_call.args[0] == "Test:Inner"
+        assert inner_call.args[2]["parent"] == "Test:Outer"
+        assert outer_call.args[2]["parent"] is None
+
+    def test_span_records_error_and_reraises(self, mock_metric, exporter):
+        with pytest.raises(ValueError):
+            with monitor.span("Test:Failure"):
+                raise ValueError("failed")
+
+        assert exporter.export.call_args.args[2]["error"] is True
+
+    def test_StdoutTimingExporter_writes_json_lines(self):
+        stream = io.StringIO()
+        exporter = monitor.StdoutTimingExporter(stream)
+
+        exporter.export("Test:Block", 0.25, {"hop": 1})
+
+        assert json.loads(stream.getvalue()) == {
+            "span": "Test:Block",
+            "duration_ms": 250.0,
+            "hop": 1,
+        }
+
+    def test_JSONTimingExporter_summarizes_durations(self, tmp_path):
+        summary_path = tmp_path / "timings.json"
+        exporter = monitor.JSONTimingExporter(str(summary_path))
+
+        for duration in (0.4, 0.1, 0.2, 0.3):
+            exporter.export("Test:Block", duration, {})
+
+        exporter.flush()
+
+        assert json.loads(summary_path.read_text()) == {
+            "Test:Block": {
+                "count": 4,
+                "total_ms": 1000.0,
+                "mean_ms": 250.0,
+                "p50_ms": 300.0,
+                "p95_ms": 400.0,
+                "max_ms": 400.0,
+            }
+        }
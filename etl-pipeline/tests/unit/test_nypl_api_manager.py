@@ -1,5 +1,6 @@
 from oauthlib.oauth2 import TokenExpiredError
 import pytest
+import threading
 
 from managers import NYPLAPIManager
 from tests.helper import TestHelpers
@@ -108,3 +109,50 @@ class TestNYPLAPIManager:
         test_instance.client.get.side_effect = TimeoutError
 
         assert test_instance.query_api("test/path/request") == {}
+
+    def test_query_api_concurrent_token_refresh(self, test_instance, mocker):
+        # Both threads see the expired token before either refreshes it
+        expired_barrier = threading.Barrier(2, timeout=5)
+
+        def expired_get(*args, **kwargs):
+            expired_barrier.wait()
+            raise TokenExpiredError
+
+        mock_error_client = mocker.MagicMock()
+        mock_error_client.get.side_effect = expired_get
+        test_instance.client = mock_error_client
+
+        mock_resp = mocker.MagicMock()
+        mock_resp.json.return_value = "testAPIResponse"
+        mock_repeat_client = mocker.MagicMock()
+        mock_repeat_client.get.return_value = mock_resp
+
+        def reset_client():
+            test_instance.client = mock_repeat_client
+
+        mock_client_create = mocker.patch.object(
+            NYPLAPIManager, "create_client", side_effect=reset_client
+        )
+        mock_token_generate = mocker.patch.object(
+            NYPLAPIManager, "generate_access_token"
+        )
+
+        responses = []
+        threads = [
+            threading.Thread(
+                target=lambda: responses.append(
+                    test_instance.query_api("test/path/request")
+                )
+            )
+            for _ in range(2)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert responses == ["testAPIResponse", "testAPIResponse"]
+        assert mock_error_client.get.call_count == 2
+        mock_token_generate.assert_called_once()
+        mock_client_create.assert_called_once()
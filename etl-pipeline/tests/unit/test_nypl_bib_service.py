@@ -0,0 +1,95 @@
+import pytest
+
+from services.sources.nypl_bib_service import NYPLBibService
+
+
+def build_bib(bib_id: str) -> dict:
+    return {"nypl_source": "sierra-nypl", "id": bib_id, "var_fields": []}
+
+
+class TestNYPLBibService:
+    @pytest.fixture
+    def test_instance(self, mocker, monkeypatch):
+        for env_var in (
+            "NYPL_BIB_USER",
+            "NYPL_BIB_PSWD",
+            "NYPL_BIB_HOST",
+            "NYPL_BIB_PORT",
+            "NYPL_BIB_NAME",
+            "BARDO_CCE_API",
+        ):
+            monkeypatch.setenv(env_var, "test")
+
+        mocker.patch("services.sources.nypl_bib_service.DBManager")
+        mocker.patch("services.sources.nypl_bib_service.NYPLAPIManager")
+        mocker.patch.object(NYPLBibService, "load_location_codes")
+        mocker.patch("services.sources.nypl_bib_service.BIB_PAGE_SIZE", 2)
+
+        return NYPLBibService()
+
+    @pytest.fixture
+    def mock_execute(self, test_instance):
+        mock_connect = test_instance.bib_db_connection.engine.connect
+
+        return mock_connect.return_value.__enter__.return_value.execute
+
+    def mock_pages(self, mocker, mock_execute, pages):
+        mock_execute.side_effect = [
+            mocker.MagicMock(mappings=mocker.MagicMock(return_value=page))
+            for page in pages
+        ]
+
+    def test_fetch_bib_pages_seeks_past_page_boundary(
+        self, test_instance, mock_execute, mocker
+    ):
+        pages = [[build_bib("1"), build_bib("2")], [build_bib("3")]]
+        self.mock_pages(mocker, mock_execute, pages)
+
+        assert list(test_instance.fetch_bib_pages()) == pages
+
+        first_query, first_params = mock_execute.call_args_list[0].args
+        second_query, second_params = mock_execute.call_args_list[1].args
+
+        assert "(nypl_source, id) >" not in str(first_query)
+        assert "(nypl_source, id) > (:last_source, :last_id)" in str(second_query)
+        assert second_params["last_source"] == "sierra-nypl"
+        assert second_params["last_id"] == "2"
+
+    def test_fetch_bib_pages_applies_offset_to_first_page(
+        self, test_instance, mock_execute, mocker
+    ):
+        pages = [[build_bib("6"), build_bib("7")], [build_bib("8")]]
+        self.mock_pages(mocker, mock_execute, pages)
+
+        list(test_instance.fetch_bib_pages(offset=5))
+
+        first_query, first_params = mock_execute.call_args_list[0].args
+        second_query, second_params = mock_execute.call_args_list[1].args
+
+        assert "OFFSET :offset" in str(first_query)
+        assert first_params["offset"] == 5
+        assert "OFFSET" not in str(second_query)
+        assert "offset" not in second_params
+
+    def test_fetch_bib_pages_stops_at_limit(self, test_instance, mock_execute, mocker):
+        pages = [[build_bib("1"), build_bib("2")], [build_bib("3")]]
+        self.mock_pages(mocker, mock_execute, pages)
+
+        assert list(test_instance.fetch_bib_pages(limit=3)) == pages
+
+        assert mock_execute.call_args_list[1].args[1]["page_size"] == 1
+        assert mock_execute.call_count == 2
+
+    def test_get_copyright_status_caches_lccn_lookups(self, test_instance, mocker):
+        mock_get = mocker.patch("services.sources.nypl_bib_service.requests.get")
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {
+            "data": {"results": [{"renewals": []}]}
+        }
+
+        var_fields = [{"marcTag": "010", "subfields": [{"content": "sn 12345"}]}]
+
+        assert test_instance.get_copyright_status(var_fields) is True
+        assert test_instance.get_copyright_status(var_fields) is True
+
+        mock_get.assert_called_once_with("test/lccn/12345")
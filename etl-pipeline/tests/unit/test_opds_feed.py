@@ -161,6 +161,43 @@ class TestOPDSFacet:
             "metadata": {"title": "test", "other": "value"},
         }
 
+    def test_toDict_nested_components(self, testFeed):
+        testFeed.addMetadata({"title": "Test Feed"})
+        testFeed.addLink({"rel": "self", "href": "/opds/test"})
+        testFeed.addGroup(
+            {
+                "metadata": {"title": "Publications"},
+                "publications": [
+                    {
+                        "metadata": {"title": "Test Pub"},
+                        "images": [{"href": "cover.png", "type": "image/png"}],
+                    }
+                ],
+            }
+        )
+
+        assert testFeed.toDict() == {
+            "metadata": {"title": "Test Feed"},
+            "links": [{"rel": "self", "href": "/opds/test"}],
+            "groups": [
+                {
+                    "metadata": {"title": "Publications"},
+                    "publications": [
+                        {
+                            "type": "application/opds-publication+json",
+                            "metadata": {
+                                "title": "Test Pub",
+                                "@type": "http://schema.org/Book",
+                            },
+                            "links": [],
+                            "editions": [],
+                            "images": [{"href": "cover.png", "type": "image/png"}],
+                        }
+                    ],
+                }
+            ],
+        }
+
     def test_iter_error(self, testFeed, testIterableClass):
         testFeed.links = [testIterableClass("other")]
 
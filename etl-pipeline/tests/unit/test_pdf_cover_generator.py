@@ -0,0 +1,145 @@
+import io
+
+from PIL import Image
+import pytest
+
+from managers.pdf_cover_generator import (
+    PDFCoverError,
+    PDFCoverGenerator,
+    RangeRequestFile,
+)
+
+
+class FakeRangeSession:
+    def __init__(self, content, mocker):
+        self.content = content
+        self.mocker = mocker
+        self.requested_ranges = []
+
+    def head(self, url, **kwargs):
+        return self.mocker.MagicMock(
+            url=url,
+            headers={
+                "Accept-Ranges": "bytes",
+                "Content-Length": str(len(self.content)),
+            },
+        )
+
+    def get(self, url, headers, **kwargs):
+        start, end = (int(bound) for bound in headers["Range"][6:].split("-"))
+        self.requested_ranges.append((start, end))
+
+        return self.mocker.MagicMock(
+            status_code=206, content=self.content[start : end + 1]
+        )
+
+
+class TestPDFCoverGenerator:
+    @staticmethod
+    def build_pdf(*page_colors, size=(1200, 1600)):
+        pages = [Image.new("RGB", size, color) for color in page_colors]
+        # Noise keeps the first page from being mistaken for a blank image
+        pages[0] = Image.effect_noise(size, 64).convert("RGB")
+
+        pdf = io.BytesIO()
+        pages[0].save(pdf, format="PDF", save_all=True, append_images=pages[1:])
+
+        return pdf.getvalue()
+
+    def test_extract_cover_content(self):
+        generator = PDFCoverGenerator(io.BytesIO(self.build_pdf("white", "red")))
+        cover = io.BytesIO()
+
+        generator.extract_cover_content(cover)
+
+        assert Image.open(cover).size == (300, 400)
+
+    def test_extract_cover_image_skips_blank_pages(self, mocker):
+        generator = PDFCoverGenerator(io.BytesIO(self.build_pdf("white", "red")))
+        blank_image = mocker.MagicMock(entropy=mocker.MagicMock(return_value=0))
+        cover_image = mocker.MagicMock(entropy=mocker.MagicMock(return_value=4))
+        mocker.patch.object(
+            generator, "_decode_page_image", side_effect=[blank_image, cover_image]
+        )
+
+        assert generator._extract_cover_image() == cover_image
+
+    def test_extract_cover_image_no_images(self, mocker):
+        generator = PDFCoverGenerator(io.BytesIO(self.build_pdf("white")))
+        mocker.patch.object(generator, "_decode_page_image", return_value=None)
+
+        with pytest.raises(PDFCoverError):
+            generator._extract_cover_image()
+
+    def test_decode_page_image_thumbnail(self):
+        generator = PDFCoverGenerator(io.BytesIO(self.build_pdf("white")))
+
+        image = generator._decode_page_image(generator.pdf.pages[0])
+
+        assert image.size == (600, 800)
+
+    def test_from_url_stream_reads_ranges(self, mocker):
+        pdf_content = self.build_pdf(*["white"] * 20)
+        session = FakeRangeSession(pdf_content, mocker)
+        mocker.patch(
+            "managers.pdf_cover_generator.requests.Session", return_value=session
+        )
+        mock_get = mocker.patch("managers.pdf_cover_generator.requests.get")
+
+        generator = PDFCoverGenerator.from_url("https://example.com/book.pdf", True)
+        generator.extract_cover_content(io.BytesIO())
+
+        mock_get.assert_not_called()
+        fetched_bytes = sum(end - start + 1 for start, end in session.requested_ranges)
+        assert fetched_bytes < len(pdf_content)
+
+    def test_from_url_stream_without_range_support(self, mocker):
+        pdf_content = self.build_pdf("white")
+        mocker.patch(
+            "managers.pdf_cover_generator.RangeRequestFile.open", return_value=None
+        )
+        mock_get = mocker.patch("managers.pdf_cover_generator.requests.get")
+        mock_get.return_value.iter_content.return_value = [pdf_content]
+
+        generator = PDFCoverGenerator.from_url("https://example.com/book.pdf", True)
+
+        assert len(generator.pdf.pages) == 1
+
+    def test_extract_covers(self, mocker):
+        mock_from_url = mocker.patch.object(PDFCoverGenerator, "from_url")
+        mock_from_url.side_effect = [
+            PDFCoverGenerator(io.BytesIO(self.build_pdf("white"))),
+            Exception("Unable to fetch PDF"),
+        ]
+
+        covers = list(PDFCoverGenerator.extract_covers(["pdf1", "pdf2"], max_workers=1))
+
+        assert covers[0][0] == "pdf1"
+        assert Image.open(covers[0][1]).format == "PNG"
+        assert covers[1] == ("pdf2", None)
+
+
+class TestRangeRequestFile:
+    def test_read_and_seek(self, mocker):
+        content = bytes(range(256)) * 40
+        session = FakeRangeSession(content, mocker)
+        range_file = RangeRequestFile("https://example.com", len(content), session, 100)
+
+        range_file.seek(-10, io.SEEK_END)
+        assert range_file.read() == content[-10:]
+
+        range_file.seek(150)
+        assert range_file.read(100) == content[150:250]
+        assert range_file.read(60) == content[250:310]
+
+        assert session.requested_ranges == [
+            (10200, 10239),
+            (100, 299),
+            (300, 399),
+        ]
+
+    def test_open_without_range_support(self, mocker):
+        session = mocker.MagicMock()
+        session.head.return_value.headers = {"Content-Length": "100"}
+
+        assert RangeRequestFile.open("https://example.com", session) is None
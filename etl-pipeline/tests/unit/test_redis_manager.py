@@ -26,6 +26,13 @@ class TestRedisManager:
         assert test_instance.client == "test_client"
         mock_redis.assert_called_once_with(host="host", port="port", socket_timeout=5)
 
+    def test_create_client_with_connection_pool(self, test_instance, mocker):
+        mock_redis = mocker.patch("managers.redis.Redis")
+
+        test_instance.create_client(connection_pool="test_pool")
+
+        mock_redis.assert_called_once_with(connection_pool="test_pool")
+
     def test_check_or_set_key_found_recent(self, test_instance, mocker):
         test_instance.client = mocker.MagicMock()
         test_instance.client.get.return_value = (
@@ -158,3 +165,46 @@ class TestRedisManager:
         test_instance.client.incr.assert_called_once_with(
             f"test/{test_instance.present_time.strftime('%Y-%m-%d')}/id", amount=3
         )
+
+    def test_invalidate_work_responses(self, test_instance, mocker):
+        test_instance.client = mocker.MagicMock()
+        mock_pipe = test_instance.client.pipeline.return_value
+
+        test_instance.invalidate_work_responses(["uuid1", "uuid2"])
+
+        mock_pipe.incr.assert_has_calls(
+            [
+                mocker.call("testEnv/api/versions/work/uuid1"),
+                mocker.call("testEnv/api/versions/work/uuid2"),
+            ]
+        )
+        mock_pipe.expire.assert_called_with(
+            "testEnv/api/versions/work/uuid2", 60 * 60 * 24 * 7
+        )
+        mock_pipe.execute.assert_called_once()
+
+    def test_set_automatic_collection_works(self, test_instance, mocker):
+        test_instance.client = mocker.MagicMock()
+        mock_pipe = test_instance.client.pipeline.return_value
+
+        test_instance.set_automatic_collection_works(1, [[3, 4], [5]], 20, 600)
+
+        key = "testEnv/api/automatic-collections/1"
+        test_instance.client.pipeline.assert_called_once_with(transaction=True)
+        mock_pipe.rpush.assert_called_once_with(f"{key}/staging", "3,4", "5")
+        mock_pipe.rename.assert_called_once_with(f"{key}/staging", f"{key}/works")
+        mock_pipe.expire.assert_called_once_with(f"{key}/works", 600)
+        mock_pipe.set.assert_called_once_with(f"{key}/total", 20, ex=600)
+        mock_pipe.execute.assert_called_once()
+
+    def test_set_automatic_collection_works_empty(self, test_instance, mocker):
+        test_instance.client = mocker.MagicMock()
+        mock_pipe = test_instance.client.pipeline.return_value
+
+        test_instance.set_automatic_collection_works(1, [], 0, 600)
+
+        mock_pipe.rpush.assert_not_called()
+        mock_pipe.delete.assert_called_with("testEnv/api/automatic-collections/1/works")
+        mock_pipe.set.assert_called_once_with(
+            "testEnv/api/automatic-collections/1/total", 0, ex=600
+        )
@@ -114,6 +114,35 @@ class TestS3Manager:
         with pytest.raises(S3Error):
             test_instance.put_object("testObj", "testKey", "testBucket")
 
+    def test_upload_fileobj(self, test_instance: S3Manager, mocker):
+        test_instance.upload_fileobj(
+            mocker.sentinel.stream,
+            "testKey.tar.gz.gpg",
+            "testBucket",
+            bucket_permissions=None,
+            storage_class="GLACIER_IR",
+            transfer_config=mocker.sentinel.config,
+        )
+
+        test_instance.client.upload_fileobj.assert_called_once_with(
+            mocker.sentinel.stream,
+            "testBucket",
+            "testKey.tar.gz.gpg",
+            ExtraArgs={
+                "ContentType": "binary/octet-stream",
+                "StorageClass": "GLACIER_IR",
+            },
+            Config=mocker.sentinel.config,
+        )
+
+    def test_upload_fileobj_error(self, test_instance: S3Manager, mocker):
+        test_instance.client.upload_fileobj.side_effect = ClientError({}, "Testing")
+
+        with pytest.raises(S3Error):
+            test_instance.upload_fileobj(
+                mocker.sentinel.stream, "testKey", "testBucket"
+            )
+
     def test_store_epub(self, test_instance: S3Manager, mocker):
         mock_epub_zip_component = mocker.MagicMock()
         mock_epub_zip_component.read.side_effect = ["compBytes1", "compBytes2"]
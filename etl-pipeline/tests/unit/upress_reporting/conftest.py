@@ -0,0 +1,11 @@
+import os
+import sys
+
+# The reporting scripts run from the upress_reporting directory and import their
+# modules from there, e.g. "from helpers.aggregate_logs import ..."
+sys.path.insert(
+    0,
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "..", "..", "upress_reporting")
+    ),
+)
@@ -0,0 +1,199 @@
+import threading
+
+import pandas
+import pytest
+
+from helpers.aggregate_logs import LogEntry, read_logs_in_period
+
+FILE_ID_REGEX = r"REST.GET.OBJECT manifests/(.*?json)\s"
+REFERRER_URL = "https://drb-qa.nypl.org"
+
+
+def build_log_line(
+    file_name: str,
+    ip: str = "192.0.2.1",
+    referrer: str = REFERRER_URL,
+    status: str = "200 -",
+    timestamp: str = "[06/Feb/2024:00:00:38 +0000]",
+) -> str:
+    return (
+        f"owner drb-files-qa {timestamp} {ip} - REQ1 REST.GET.OBJECT "
+        f'manifests/{file_name} "GET /manifests/{file_name} HTTP/1.1" {status} '
+        f'1024 1024 10 9 "{referrer}/read/1" "Mozilla/5.0"'
+    )
+
+
+class StubS3Client:
+    """Serves log objects from a dict of key prefix to {key: lines}, recording the
+    prefixes it lists and the keys it reads."""
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.listed_prefixes = []
+        self.read_keys = []
+        self.before_read = {}
+
+    def get_paginator(self, operation):
+        assert operation == "list_objects_v2"
+
+        return self
+
+    def paginate(self, Bucket, Prefix):
+        self.listed_prefixes.append(Prefix)
+
+        return [{"Contents": [{"Key": key} for key in self.logs.get(Prefix, {})]}]
+
+    def get_object(self, Bucket, Key):
+        self.read_keys.append(Key)
+
+        if Key in self.before_read:
+            self.before_read[Key]()
+
+        prefix = Key.rsplit("/", 1)[0]
+
+        return {"Body": StubStreamingBody(self.logs[prefix][Key])}
+
+
+class StubStreamingBody:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def iter_lines(self):
+        return (line.encode("utf-8") for line in self.lines)
+
+
+def days_ago(days: int) -> pandas.Timestamp:
+    return pandas.Timestamp.today().normalize() - pandas.Timedelta(days=days)
+
+
+def log_prefix(date: pandas.Timestamp) -> str:
+    return f"logs/{date.strftime('%Y/%m/%d')}"
+
+
+class TestReadLogsInPeriod:
+    @pytest.fixture(autouse=True)
+    def log_cache(self, mocker, tmp_path):
+        mocker.patch("helpers.aggregate_logs.LOG_CACHE_PATH", f"{tmp_path}/")
+
+        return tmp_path
+
+    def read_logs(self, date_range, s3_client):
+        return list(
+            read_logs_in_period(
+                date_range=date_range,
+                s3_bucket="drb-files-qa-logs",
+                s3_path="logs/",
+                file_id_regex=FILE_ID_REGEX,
+                referrer_url=REFERRER_URL,
+                s3_client=s3_client,
+            )
+        )
+
+    def test_filters_log_lines(self):
+        day = days_ago(10)
+        prefix = log_prefix(day)
+        s3_client = StubS3Client(
+            {
+                prefix: {
+                    f"{prefix}/log1": [
+                        build_log_line("pub/book1.json"),
+                        build_log_line("pub/book2.json", referrer="https://other.org"),
+                        build_log_line("pub/book3.json", status="403 AccessDenied"),
+                        build_log_line("pub/cover.png"),
+                        build_log_line("pub/book4.json", ip="198.51.100.7"),
+                    ]
+                }
+            }
+        )
+
+        entries = self.read_logs(pandas.date_range(day, day), s3_client)
+
+        assert entries == [
+            LogEntry(
+                file_id="pub/book1.json",
+                ip="192.0.2.1",
+                timestamp="[06/Feb/2024:00:00:38 +0000]",
+            ),
+            LogEntry(
+                file_id="pub/book4.json",
+                ip="198.51.100.7",
+                timestamp="[06/Feb/2024:00:00:38 +0000]",
+            ),
+        ]
+
+    def test_reads_cached_days_without_fetching(self):
+        days = pandas.date_range(days_ago(13), days_ago(10))
+        logs = {
+            log_prefix(day): {
+                f"{log_prefix(day)}/log1": [build_log_line(f"pub/{day.day}.json")]
+            }
+            for day in days
+        }
+
+        first_client = StubS3Client(logs)
+        first_entries = self.read_logs(days[:2], first_client)
+
+        second_client = StubS3Client(logs)
+        second_entries = self.read_logs(days, second_client)
+
+        assert sorted(first_client.listed_prefixes) == [
+            log_prefix(day) for day in days[:2]
+        ]
+        assert sorted(second_client.listed_prefixes) == [
+            log_prefix(day) for day in days[2:]
+        ]
+        assert sorted(second_client.read_keys) == [
+            f"{log_prefix(day)}/log1" for day in days[2:]
+        ]
+        assert second_entries[:2] == first_entries
+        assert [entry.file_id for entry in second_entries] == [
+            f"pub/{day.day}.json" for day in days
+        ]
+
+    def test_never_caches_recent_days(self, log_cache):
+        days = pandas.date_range(days_ago(3), days_ago(0))
+        logs = {
+            log_prefix(day): {f"{log_prefix(day)}/log1": [build_log_line("a.json")]}
+            for day in days
+        }
+
+        self.read_logs(days, StubS3Client(logs))
+
+        s3_client = StubS3Client(logs)
+        entries = self.read_logs(days, s3_client)
+
+        # Only the day outside the log delivery window was cached by the first read
+        assert sorted(s3_client.listed_prefixes) == [
+            log_prefix(day) for day in days[1:]
+        ]
+        assert len(entries) == 4
+        assert [path.parent.name for path in log_cache.rglob("*.log")] == [
+            days[0].strftime("%d")
+        ]
+
+    def test_yields_days_in_date_order(self):
+        days = pandas.date_range(days_ago(12), days_ago(10))
+        logs = {
+            log_prefix(day): {
+                f"{log_prefix(day)}/log{index}": [
+                    build_log_line(f"pub/{day.day}-{index}.json")
+                ]
+                for index in range(2)
+            }
+            for day in days
+        }
+        s3_client = StubS3Client(logs)
+
+        # The first day's logs are only returned once the last day has been read
+        last_day_read = threading.Event()
+        s3_client.before_read[f"{log_prefix(days[0])}/log0"] = lambda: (
+            last_day_read.wait(timeout=5)
+        )
+        s3_client.before_read[f"{log_prefix(days[-1])}/log1"] = last_day_read.set
+
+        entries = self.read_logs(days, s3_client)
+
+        assert last_day_read.is_set()
+        assert [entry.file_id for entry in entries] == [
+            f"pub/{day.day}-{index}.json" for day in days for index in range(2)
+        ]
@@ -0,0 +1,144 @@
+import pandas
+import pytest
+
+from models.data.interaction_event import (
+    InteractionEvent,
+    InteractionType,
+    build_events_frame,
+)
+from models.reports.counter_5_report import Counter5Report
+
+TITLES = {
+    "edition/1": {
+        "title": "Accessed Title",
+        "book_id": "edition/1",
+        "authors": "Author, A.",
+        "isbns": "9780000000001",
+        "oclc_numbers": "1",
+        "publication_year": "1950",
+        "disciplines": "History",
+        "usage_type": "Full Access",
+    },
+    "edition/2": {
+        "title": "Unaccessed Title",
+        "book_id": "edition/2",
+        "authors": "Author, B.",
+        "isbns": "9780000000002",
+        "oclc_numbers": "2",
+        "publication_year": "1960",
+        "disciplines": "Poetry",
+        "usage_type": "Full Access",
+    },
+}
+
+
+def build_event(book_id: str, country: str, timestamp: str) -> InteractionEvent:
+    return InteractionEvent(country=country, timestamp=timestamp, **TITLES[book_id])
+
+
+class MockReport(Counter5Report):
+    def build_report(self, events, reporting_data):
+        return
+
+
+class TestCounter5Report:
+    @pytest.fixture
+    def events(self):
+        return build_events_frame(
+            [
+                (
+                    InteractionType.VIEW,
+                    [
+                        build_event("edition/1", "US", "[06/Feb/2024:00:00:38 +0000]"),
+                        build_event("edition/1", "FR", "[15/Jan/2024:12:30:00 +0000]"),
+                        build_event("edition/1", "US", "[20/Jan/2024:08:00:00 +0000]"),
+                    ],
+                ),
+                (
+                    InteractionType.DOWNLOAD,
+                    [build_event("edition/1", "US", "[21/Jan/2024:09:00:00 +0000]")],
+                ),
+            ]
+        )
+
+    @pytest.fixture
+    def reporting_data(self):
+        return pandas.DataFrame(
+            [{**title, "search_col": book_id} for book_id, title in TITLES.items()]
+        ).set_index("search_col")
+
+    @pytest.fixture
+    def test_instance(self):
+        return MockReport(
+            "UofMichigan Press", pandas.date_range("2024-01-01", "2024-02-29")
+        )
+
+    def test_build_events_frame(self, events):
+        assert len(events) == 4
+        assert events["month"].astype(str).tolist() == [
+            "2024-02",
+            "2024-01",
+            "2024-01",
+            "2024-01",
+        ]
+        assert events["interaction_type"].tolist() == [
+            "View",
+            "View",
+            "View",
+            "Download",
+        ]
+        assert events["title"].dtype == "category"
+
+    def test_build_events_frame_empty(self):
+        events = build_events_frame([(InteractionType.VIEW, [])])
+
+        assert len(events) == 0
+        assert "month" in events.columns
+
+    def test_aggregate_interaction_events(self, test_instance, events, reporting_data):
+        columns, rows = test_instance.aggregate_interaction_events(
+            events, reporting_data
+        )
+
+        assert columns[-3:] == [
+            "Reporting Period Total",
+            "January 2024",
+            "February 2024",
+        ]
+        assert "Country" not in columns
+
+        accessed, zeroed_out = rows
+        assert accessed["Book Title"] == "Accessed Title"
+        assert (
+            accessed["January 2024"],
+            accessed["February 2024"],
+            accessed["Reporting Period Total"],
+        ) == (3, 1, 4)
+        assert zeroed_out["Book Title"] == "Unaccessed Title"
+        assert (
+            zeroed_out["January 2024"],
+            zeroed_out["February 2024"],
+            zeroed_out["Reporting Period Total"],
+        ) == (0, 0, 0)
+
+    def test_aggregate_interaction_events_by_country(
+        self, test_instance, events, reporting_data
+    ):
+        columns, rows = test_instance.aggregate_interaction_events_by_country(
+            events, reporting_data
+        )
+
+        assert columns[0] == "Country"
+
+        counts = {
+            (row["Country"], row["Book Title"]): (
+                row["January 2024"],
+                row["February 2024"],
+            )
+            for row in rows
+        }
+        assert counts == {
+            ("FR", "Accessed Title"): (1, 0),
+            ("US", "Accessed Title"): (2, 1),
+            (None, "Unaccessed Title"): (0, 0),
+        }
@@ -0,0 +1,49 @@
+import pytest
+
+from helpers.country_resolver import IPRangeCountryResolver
+
+
+class TestIPRangeCountryResolver:
+    @pytest.fixture
+    def database_path(self, tmp_path):
+        database_path = tmp_path / "ip-country.csv"
+        database_path.write_text(
+            "ip_from,ip_to,country_code\n"
+            "1.0.0.0,1.0.0.255,AU\n"
+            "16777472,16778239,CN\n"
+            "2.0.0.0,2.0.0.255,-\n"
+            "2001:db8::,2001:db8::ffff,US\n"
+            # An IPv4 range from an IPv6 database, written as a mapped integer
+            f"{0xFFFF << 32 | 0x05000000},{0xFFFF << 32 | 0x050000FF},FR\n"
+        )
+
+        return str(database_path)
+
+    @pytest.fixture
+    def test_instance(self, database_path):
+        return IPRangeCountryResolver(database_path)
+
+    def test_resolve_ipv4_ranges(self, test_instance):
+        assert test_instance.resolve("1.0.0.0") == "AU"
+        assert test_instance.resolve("1.0.0.255") == "AU"
+        assert test_instance.resolve("1.0.1.10") == "CN"
+
+    def test_resolve_ipv6_range(self, test_instance):
+        assert test_instance.resolve("2001:db8::1") == "US"
+
+    def test_resolve_ipv4_mapped_range(self, test_instance):
+        assert test_instance.resolve("5.0.0.1") == "FR"
+        assert test_instance.resolve("::ffff:5.0.0.1") == "FR"
+
+    def test_resolve_unlisted_ip(self, test_instance):
+        assert test_instance.resolve("0.255.255.255") is None
+        assert test_instance.resolve("1.0.4.0") is None
+        assert test_instance.resolve("2.0.0.1") is None
+        assert test_instance.resolve("not an ip") is None
+
+    def test_split_mapped_range_keeps_ipv6_remainder(self):
+        mapped_start = 0xFFFF << 32
+
+        assert IPRangeCountryResolver._split_mapped_range(
+            6, mapped_start - 10, mapped_start + 10
+        ) == [(4, 0, 10), (6, mapped_start - 10, mapped_start - 1)]
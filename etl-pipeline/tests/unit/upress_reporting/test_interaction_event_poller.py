@@ -0,0 +1,84 @@
+import pandas
+import pytest
+
+from models.data.interaction_event import InteractionType
+from models.pollers.interaction_event_poller import InteractionEventPoller
+
+SEARCH_COLS = [
+    "https://drb-files-qa.s3.amazonaws.com/manifests/pub/book1.json",
+    "https://drb-files-qa.s3.amazonaws.com/titles/pub/book2.pdf,"
+    "https://drb-files-qa.s3.amazonaws.com/manifests/pub/book2.json",
+    "https://drb-files-limited-qa.s3.amazonaws.com/manifests/pub/book1.json",
+    "https://drb-files-qa.s3.amazonaws.com/manifests/pub/book3.json",
+]
+
+
+class TestInteractionEventPoller:
+    @pytest.fixture
+    def test_instance(self, mocker):
+        mocker.patch.object(InteractionEventPoller, "get_events")
+        reporting_data = pandas.DataFrame(
+            [{"title": f"Title {position}"} for position in range(len(SEARCH_COLS))],
+            index=pandas.Index(SEARCH_COLS, name="search_col"),
+        )
+
+        return InteractionEventPoller(
+            date_range=pandas.date_range("2024-01-01", "2024-01-31"),
+            reporting_data=reporting_data,
+            file_id_regex=r"REST.GET.OBJECT manifests/(.*?json)\s",
+            bucket_name="drb-files-qa-logs",
+            interaction_type=InteractionType.VIEW,
+            country_resolver=mocker.MagicMock(),
+        )
+
+    def contains_position(self, file_name):
+        # The lookup the index replaced: the first row whose search column contains
+        # the file name
+        return next(
+            (
+                position
+                for position, search_col in enumerate(SEARCH_COLS)
+                if file_name in search_col
+            ),
+            None,
+        )
+
+    def test_find_reporting_position_suffix(self, test_instance):
+        assert "pub/book3.json" in test_instance.file_index
+
+        assert test_instance._find_reporting_position("pub/book3.json") == 3
+
+    def test_find_reporting_position_multiple_urls(self, test_instance):
+        assert test_instance._find_reporting_position("pub/book2.json") == 1
+        assert test_instance._find_reporting_position("titles/pub/book2.pdf") == 1
+
+    def test_find_reporting_position_shared_suffix(self, test_instance):
+        assert test_instance._find_reporting_position("manifests/pub/book1.json") == 0
+        assert test_instance._find_reporting_position("book1.json") == 0
+        assert self.contains_position("book1.json") == 0
+
+    def test_find_reporting_position_substring(self, test_instance):
+        assert "pub/book3" not in test_instance.file_index
+
+        assert test_instance._find_reporting_position("pub/book3") == 3
+        assert test_instance.file_index["pub/book3"] == 3
+
+    def test_find_reporting_position_miss(self, test_instance):
+        assert test_instance._find_reporting_position("pub/missing.json") is None
+        assert test_instance.file_index["pub/missing.json"] is None
+
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            "pub/book1.json",
+            "book2.pdf",
+            "drb-files-limited-qa.s3.amazonaws.com/manifests/pub/book1.json",
+            "pub/book",
+            "ok2.js",
+            "pub/book4.json",
+        ],
+    )
+    def test_find_reporting_position_matches_contains(self, test_instance, file_name):
+        assert test_instance._find_reporting_position(
+            file_name
+        ) == self.contains_position(file_name)
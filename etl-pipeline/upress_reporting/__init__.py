@@ -1,4 +1,4 @@
-from .helpers.aggregate_logs import aggregate_logs_in_period
+from .helpers.aggregate_logs import read_logs_in_period
 from .helpers.format_data import format_to_interaction_event
 
 from .models.data import interaction_event
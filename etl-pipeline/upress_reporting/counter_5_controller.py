@@ -3,10 +3,10 @@ import os
 import pandas
 
 from datetime import datetime
-from helpers import aggregate_logs
+from helpers.country_resolver import create_country_resolver
 from helpers.format_data import format_to_interaction_event
 from managers.db import DBManager
-from models.data.interaction_event import InteractionType
+from models.data.interaction_event import InteractionType, build_events_frame
 from models.pollers.interaction_event_poller import InteractionEventPoller
 from model.postgres.edition import Edition
 from model.postgres.item import Item
@@ -15,7 +15,7 @@ from models.reports.country_level import CountryLevelReport
 from models.reports.downloads import DownloadsReport
 from models.reports.total_usage import TotalUsageReport
 from models.reports.views import ViewsReport
-from sqlalchemy import CTE, func, literal
+from sqlalchemy import CTE, func
 from typing import List
 
 VIEW_FILE_ID_REGEX = r"REST.GET.OBJECT manifests/(.*?json)\s"
@@ -50,6 +50,8 @@ class Counter5Controller:
             DRB_QA_URL if self.environment == "qa" else DRB_PRODUCTION_URL
         )
 
+        self.country_resolver = create_country_resolver()
+
         self.setup_db_manager()
 
     def setup_db_manager(self):
@@ -59,7 +61,6 @@ class Counter5Controller:
     def create_reports(self):
         print("Generating Counter 5 reports...", datetime.now())
 
-        self.pull_aggregated_logs()
         publisher_project_data = self.pull_publisher_project_data()
 
         for publisher in self.publishers:
@@ -80,6 +81,9 @@ class Counter5Controller:
                     file_id_regex=VIEW_FILE_ID_REGEX,
                     bucket_name=self.public_bucket,
                     interaction_type=InteractionType.VIEW,
+                    log_path=self.public_log_path,
+                    referrer_url=self.referrer_url,
+                    country_resolver=self.country_resolver,
                 )
                 download_public_data_poller = InteractionEventPoller(
                     date_range=self.reporting_period,
@@ -87,6 +91,9 @@ class Counter5Controller:
                     file_id_regex=DOWNLOAD_FILE_ID_REGEX,
                     bucket_name=self.public_bucket,
                     interaction_type=InteractionType.DOWNLOAD,
+                    log_path=self.public_log_path,
+                    referrer_url=self.referrer_url,
+                    country_resolver=self.country_resolver,
                 )
                 download_private_data_poller = InteractionEventPoller(
                     date_range=self.reporting_period,
@@ -94,52 +101,38 @@ class Counter5Controller:
                     file_id_regex=DOWNLOAD_FILE_ID_REGEX,
                     bucket_name=self.private_bucket,
                     interaction_type=InteractionType.DOWNLOAD,
+                    log_path=self.private_log_path,
+                    referrer_url=self.referrer_url,
+                    country_resolver=self.country_resolver,
                 )
 
-                merged_downloads_reporting_data = pandas.concat(
+                events = build_events_frame(
                     [
-                        download_public_data_poller.reporting_data,
-                        download_private_data_poller.reporting_data,
-                    ],
-                    ignore_index=True,
+                        (InteractionType.VIEW, view_data_poller.events),
+                        (InteractionType.DOWNLOAD, download_public_data_poller.events),
+                        (InteractionType.DOWNLOAD, download_private_data_poller.events),
+                    ]
                 )
+                view_events = events[
+                    events["interaction_type"] == InteractionType.VIEW.value
+                ]
+                download_events = events[
+                    events["interaction_type"] == InteractionType.DOWNLOAD.value
+                ]
+
                 downloads_report = DownloadsReport(publisher, self.reporting_period)
-                downloads_report.build_report(
-                    download_public_data_poller.events
-                    + download_private_data_poller.events,
-                    merged_downloads_reporting_data,
-                )
+                downloads_report.build_report(download_events, df)
 
                 views_report = ViewsReport(publisher, self.reporting_period)
-                views_report.build_report(
-                    view_data_poller.events, view_data_poller.reporting_data
-                )
-
-                merged_reporting_data = pandas.concat(
-                    [merged_downloads_reporting_data, view_data_poller.reporting_data],
-                    ignore_index=True,
-                )
-                merged_reporting_data = merged_reporting_data.sort_values(
-                    ["accessed"]
-                ).drop_duplicates(subset=["book_id"], keep="last")
+                views_report.build_report(view_events, df)
 
                 country_level_report = CountryLevelReport(
                     publisher, self.reporting_period
                 )
-                country_level_report.build_report(
-                    view_data_poller.events
-                    + download_public_data_poller.events
-                    + download_private_data_poller.events,
-                    merged_reporting_data,
-                )
+                country_level_report.build_report(events, df)
 
                 total_usage_report = TotalUsageReport(publisher, self.reporting_period)
-                total_usage_report.build_report(
-                    view_data_poller.events
-                    + download_public_data_poller.events
-                    + download_private_data_poller.events,
-                    merged_reporting_data,
-                )
+                total_usage_report.build_report(events, df)
 
             except Exception as e:
                 print("Terminating process. Exception encountered: ", e)
@@ -148,31 +141,6 @@ class Counter5Controller:
         self.db_manager.close_connection()
         print("Done building Counter 5 reports! ", datetime.now())
 
-    def pull_aggregated_logs(self):
-        aggregate_logs.aggregate_logs_in_period(
-            date_range=self.reporting_period,
-            s3_bucket=self.public_bucket,
-            s3_path=self.public_log_path,
-            regex=VIEW_FILE_ID_REGEX,
-            referrer_url=self.referrer_url,
-        )
-
-        aggregate_logs.aggregate_logs_in_period(
-            date_range=self.reporting_period,
-            s3_bucket=self.public_bucket,
-            s3_path=self.public_log_path,
-            regex=DOWNLOAD_FILE_ID_REGEX,
-            referrer_url=self.referrer_url,
-        )
-
-        aggregate_logs.aggregate_logs_in_period(
-            date_range=self.reporting_period,
-            s3_bucket=self.private_bucket,
-            s3_path=self.private_log_path,
-            regex=DOWNLOAD_FILE_ID_REGEX,
-            referrer_url=self.referrer_url,
-        )
-
     def pull_publisher_project_data(self) -> CTE:
         publisher_project_records = (
             self.db_manager.session.query(Record)
@@ -207,7 +175,6 @@ class Counter5Controller:
                 publisher_project_records.c.identifiers,
                 publisher_project_records.c.publisher_project_source,
                 publisher_project_records.c.subjects,
-                literal(False).label("accessed"),
             )
             .join(
                 publisher_project_editions,
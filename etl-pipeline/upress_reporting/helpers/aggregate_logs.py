@@ -1,60 +1,54 @@
+import boto3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from hashlib import sha1
 import os
-import re
 import pandas
-import shutil
-
-
-def aggregate_logs_in_day(
-    s3_bucket: str,
-    s3_path: str,
-    folder_name: str,
-    file_id_regex: str,
-    referrer_url: str,
-):
-    log_path = "analytics/upress_reporting/log_files/"
-    download_folder = f"{log_path}{s3_bucket}/{folder_name}"
-    os.system(
-        f"aws s3 cp --recursive s3://{s3_bucket}/{s3_path}{folder_name} {download_folder}"
-    )
-
-    folder_directory = os.fsencode(download_folder)
-    aggregated_log_file = f"{log_path}{s3_bucket}/{folder_name}/aggregated_log"
-
-    for file in os.listdir(folder_directory):
-        if file == aggregated_log_file:
-            continue
+import re
+from typing import Iterator, Optional
 
-        filename = os.fsdecode(file)
+LOG_CACHE_PATH = "analytics/upress_reporting/log_files/"
+MAX_WORKERS = 16
+# S3 server access logs are delivered best effort and can arrive hours late, so only
+# days at least this old are treated as complete and cached
+LOG_DELIVERY_DAYS = 2
 
-        with open(aggregated_log_file, "a") as aggregated_log:
-            with open(f"{download_folder}/{filename}", "r") as log_file:
-                for line in log_file:
-                    match_file_id = re.search(file_id_regex, line)
-                    match_referrer = re.search(referrer_url, line)
+IP_REGEX = r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+TIMESTAMP_REGEX = r"\[.+\]"
 
-                    if (
-                        not match_file_id
-                        or not match_referrer
-                        or "403 AccessDenied" in line
-                    ):
-                        continue
+IP_PATTERN = re.compile(IP_REGEX)
+TIMESTAMP_PATTERN = re.compile(TIMESTAMP_REGEX)
 
-                    aggregated_log.write(line)
 
-            os.remove(f"{download_folder}/{filename}")
+@dataclass(frozen=True)
+class LogEntry:
+    file_id: str
+    ip: Optional[str]
+    timestamp: Optional[str]
 
 
-def aggregate_logs_in_period(
+def read_logs_in_period(
     date_range: pandas.DatetimeIndex,
     s3_bucket: str,
     s3_path: str,
-    regex: str,
+    file_id_regex: str,
     referrer_url: str,
-):
-    shutil.rmtree(
-        f"analytics/upress_reporting/log_files/{s3_bucket}", ignore_errors=True
-    )
+    max_workers: int = MAX_WORKERS,
+    s3_client=None,
+) -> Iterator[LogEntry]:
+    """Streams the S3 access log entries for the period that request a file matching
+    `file_id_regex` from `referrer_url`, in date order. The days' logs are listed and
+    fetched concurrently, and each complete day's matching lines are cached on disk
+    so later reports over an overlapping period only fetch the days they are missing.
+    """
+    file_id_pattern = re.compile(file_id_regex)
     today = pandas.Timestamp.today()
+    cache_cutoff = today.normalize() - pandas.Timedelta(days=LOG_DELIVERY_DAYS)
+    cache_key = sha1(
+        f"{s3_path}|{file_id_regex}|{referrer_url}".encode("utf-8")
+    ).hexdigest()
+
+    days = []
 
     for date in date_range:
         if date > today:
@@ -62,4 +56,114 @@ def aggregate_logs_in_period(
             break
 
         folder_name = date.strftime("%Y/%m/%d")
-        aggregate_logs_in_day(s3_bucket, s3_path, folder_name, regex, referrer_url)
+        cache_file = f"{LOG_CACHE_PATH}{s3_bucket}/{folder_name}/{cache_key}.log"
+
+        # Logs for recent days may still be being delivered, so they are never cached
+        cacheable = date.normalize() < cache_cutoff
+
+        days.append((folder_name, cache_file, cacheable))
+
+    s3_client = s3_client or boto3.client("s3")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings = {
+            folder_name: executor.submit(
+                _list_log_keys, s3_client, s3_bucket, f"{s3_path}{folder_name}"
+            )
+            for folder_name, cache_file, cacheable in days
+            if not (cacheable and os.path.isfile(cache_file))
+        }
+
+        fetches = {
+            folder_name: [
+                executor.submit(
+                    _read_log_object,
+                    s3_client,
+                    s3_bucket,
+                    key,
+                    file_id_pattern,
+                    referrer_url,
+                )
+                for key in listing.result()
+            ]
+            for folder_name, listing in listings.items()
+        }
+
+        for folder_name, cache_file, cacheable in days:
+            if folder_name not in fetches:
+                yield from _read_cached_lines(cache_file, file_id_pattern)
+                continue
+
+            lines = [
+                line for fetch in fetches.pop(folder_name) for line in fetch.result()
+            ]
+
+            if cacheable:
+                _write_cached_lines(cache_file, lines)
+
+            for line in lines:
+                yield _parse_log_line(line, file_id_pattern)
+
+
+def _list_log_keys(s3_client, s3_bucket: str, prefix: str) -> list[str]:
+    paginator = s3_client.get_paginator("list_objects_v2")
+
+    return [
+        log_object["Key"]
+        for page in paginator.paginate(Bucket=s3_bucket, Prefix=prefix)
+        for log_object in page.get("Contents", [])
+    ]
+
+
+def _read_log_object(
+    s3_client,
+    s3_bucket: str,
+    key: str,
+    file_id_pattern: re.Pattern,
+    referrer_url: str,
+) -> list[str]:
+    log_object = s3_client.get_object(Bucket=s3_bucket, Key=key)
+
+    matching_lines = []
+
+    for raw_line in log_object["Body"].iter_lines():
+        line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+        if (
+            referrer_url in line
+            and "403 AccessDenied" not in line
+            and file_id_pattern.search(line)
+        ):
+            matching_lines.append(line)
+
+    return matching_lines
+
+
+def _read_cached_lines(
+    cache_file: str, file_id_pattern: re.Pattern
+) -> Iterator[LogEntry]:
+    with open(cache_file, "r") as cached_log:
+        for line in cached_log:
+            yield _parse_log_line(line.rstrip("\n"), file_id_pattern)
+
+
+def _write_cached_lines(cache_file: str, lines: list[str]):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    partial_file = f"{cache_file}.partial"
+
+    with open(partial_file, "w") as cached_log:
+        for line in lines:
+            cached_log.write(f"{line}\n")
+
+    os.replace(partial_file, cache_file)
+
+
+def _parse_log_line(line: str, file_id_pattern: re.Pattern) -> LogEntry:
+    match_ip = IP_PATTERN.search(line)
+    match_time = TIMESTAMP_PATTERN.search(line)
+
+    return LogEntry(
+        file_id=file_id_pattern.search(line).group(1),
+        ip=match_ip.group() if match_ip else None,
+        timestamp=match_time[0] if match_time else None,
+    )
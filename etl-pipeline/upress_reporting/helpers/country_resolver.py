@@ -0,0 +1,141 @@
+from bisect import bisect_right
+import csv
+from functools import lru_cache
+import geocoder
+import ipaddress
+import os
+from typing import Optional, Protocol
+
+CACHE_SIZE = 65536
+IPV4_MAX = 2**32 - 1
+# IPv6 databases store IPv4 ranges inside the IPv4-mapped block ::ffff:0:0/96
+IPV4_MAPPED_START = 0xFFFF << 32
+IPV4_MAPPED_END = IPV4_MAPPED_START + IPV4_MAX
+
+
+class CountryResolver(Protocol):
+    def resolve(self, ip: str) -> Optional[str]: ...
+
+
+class IPRangeCountryResolver:
+    """Resolves IPs to country codes from a local IP range database, so reports run
+    without a network lookup per log line. The file is a CSV whose first three
+    columns are the range's first IP, last IP and country code, with the IPs
+    written either as addresses or as integers, as in the DB-IP and IP2Location
+    lite databases. Ranges are held in sorted arrays per IP version and searched
+    with bisect, and resolved IPs are kept in an LRU cache.
+    """
+
+    def __init__(self, database_path: str, cache_size: int = CACHE_SIZE):
+        self.ranges = {4: ([], [], []), 6: ([], [], [])}
+
+        with open(database_path, "r", newline="") as database_file:
+            self._load_ranges(csv.reader(database_file))
+
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _load_ranges(self, rows):
+        parsed_ranges = {4: [], 6: []}
+
+        for row in rows:
+            if len(row) < 3:
+                continue
+
+            try:
+                version, start = self._parse_address(row[0])
+                _, end = self._parse_address(row[1])
+            except ValueError:
+                # Header rows and malformed ranges are skipped
+                continue
+
+            country = row[2].strip().upper()
+            country = country if country not in ("", "-", "ZZ") else None
+
+            for range_version, range_start, range_end in self._split_mapped_range(
+                version, start, end
+            ):
+                parsed_ranges[range_version].append((range_start, range_end, country))
+
+        for version, version_ranges in parsed_ranges.items():
+            version_ranges.sort()
+            starts, ends, countries = self.ranges[version]
+
+            for start, end, country in version_ranges:
+                starts.append(start)
+                ends.append(end)
+                countries.append(country)
+
+    def _resolve(self, ip: str) -> Optional[str]:
+        try:
+            address = ipaddress.ip_address(ip.strip())
+        except ValueError:
+            return None
+
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+
+        starts, ends, countries = self.ranges[address.version]
+        address_int = int(address)
+        range_idx = bisect_right(starts, address_int) - 1
+
+        if range_idx < 0 or address_int > ends[range_idx]:
+            return None
+
+        return countries[range_idx]
+
+    @staticmethod
+    def _parse_address(value: str) -> tuple[int, int]:
+        value = value.strip()
+
+        if value.isdigit():
+            address_int = int(value)
+            return (4 if address_int <= IPV4_MAX else 6), address_int
+
+        address = ipaddress.ip_address(value)
+        return address.version, int(address)
+
+    @staticmethod
+    def _split_mapped_range(
+        version: int, start: int, end: int
+    ) -> list[tuple[int, int, int]]:
+        """Moves the part of an IPv6 range inside the IPv4-mapped block into the IPv4
+        ranges, so IPv4 lookups find the IPv4 ranges of an IPv6 database."""
+        if version != 6 or end < IPV4_MAPPED_START or start > IPV4_MAPPED_END:
+            return [(version, start, end)]
+
+        split_ranges = [
+            (
+                4,
+                max(start, IPV4_MAPPED_START) - IPV4_MAPPED_START,
+                min(end, IPV4_MAPPED_END) - IPV4_MAPPED_START,
+            )
+        ]
+
+        if start < IPV4_MAPPED_START:
+            split_ranges.append((6, start, IPV4_MAPPED_START - 1))
+
+        if end > IPV4_MAPPED_END:
+            split_ranges.append((6, IPV4_MAPPED_END + 1, end))
+
+        return split_ranges
+
+
+class GeocoderCountryResolver:
+    """Resolves IPs with a network lookup per uncached IP. Used when no local IP
+    range database is configured."""
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _resolve(self, ip: str) -> Optional[str]:
+        return geocoder.ip(ip).country
+
+
+def create_country_resolver() -> CountryResolver:
+    database_path = os.environ.get("IP_COUNTRY_DATABASE", None)
+
+    if database_path:
+        return IPRangeCountryResolver(database_path)
+
+    print("No IP_COUNTRY_DATABASE configured, resolving countries over the network")
+    return GeocoderCountryResolver()
@@ -31,7 +31,6 @@ def format_to_interaction_event(data, referrer_url):
         "authors": "; ".join(authors),
         "disciplines": ", ".join(disciplines),
         "search_col": search_col,
-        "accessed": data.accessed,
     }
 
 
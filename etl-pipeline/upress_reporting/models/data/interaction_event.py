@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional
+import pandas
+from typing import Iterable, Optional
 
 
 class InteractionType(Enum):
@@ -26,3 +27,38 @@ class InteractionEvent:
     disciplines: Optional[str]
     usage_type: str
     timestamp: Optional[str]
+
+
+EVENT_FIELDS = [
+    field.name for field in fields(InteractionEvent) if field.name != "timestamp"
+]
+
+
+def build_events_frame(
+    events_by_type: Iterable[tuple[InteractionType, list[InteractionEvent]]],
+) -> pandas.DataFrame:
+    """Collects interaction events into one frame with a row per event. The title
+    data repeats for every event of a title, so those columns are categorical, and
+    each event's timestamp is reduced to the month it falls in."""
+    columns = {field: [] for field in EVENT_FIELDS + ["interaction_type", "timestamp"]}
+
+    for interaction_type, events in events_by_type:
+        for event in events:
+            for field in EVENT_FIELDS:
+                columns[field].append(getattr(event, field))
+
+            columns["interaction_type"].append(interaction_type.value)
+            columns["timestamp"].append(event.timestamp)
+
+    timestamps = pandas.Series(columns.pop("timestamp"), dtype="object")
+    events_frame = pandas.DataFrame(columns)
+
+    # S3 log timestamps look like [06/Feb/2024:00:00:38 +0000]
+    event_dates = timestamps.str.strip("[]").str.split(":").str[0]
+    events_frame["month"] = pandas.to_datetime(
+        event_dates, format="%d/%b/%Y"
+    ).dt.to_period("M")
+
+    return events_frame.astype(
+        {field: "category" for field in EVENT_FIELDS + ["interaction_type"]}
+    )
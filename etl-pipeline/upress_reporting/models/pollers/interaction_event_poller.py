@@ -1,14 +1,13 @@
-import geocoder
+from __future__ import annotations
+
 import os
 import pandas
 import re
 
+from helpers.aggregate_logs import IP_REGEX, LogEntry, read_logs_in_period
+from helpers.country_resolver import CountryResolver, create_country_resolver
 from models.data.interaction_event import InteractionEvent, InteractionType
 
-IP_REGEX = r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
-REQUEST_REGEX = r"REST.GET.OBJECT "
-TIMESTAMP_REGEX = r"\[.+\]"
-
 
 class InteractionEventPoller:
     def __init__(
@@ -18,14 +17,24 @@ class InteractionEventPoller:
         file_id_regex,
         bucket_name,
         interaction_type,
+        log_path="",
+        referrer_url=None,
+        country_resolver: CountryResolver | None = None,
     ):
         self.date_range = date_range
         self.reporting_data = reporting_data
         self.file_id_regex = file_id_regex
         self.bucket_name = bucket_name
         self.interaction_type = interaction_type
+        self.log_path = log_path
+
+        self.referrer_url = referrer_url or os.environ.get("REFERRER_URL", None)
+        self.country_resolver = country_resolver or create_country_resolver()
+
+        self.reporting_records = self.reporting_data.to_dict(orient="records")
+        self.search_cols = [str(search_col) for search_col in self.reporting_data.index]
+        self.file_index = self._build_file_index()
 
-        self.referrer_url = os.environ.get("REFERRER_URL", None)
         self.get_events(self.bucket_name)
 
     def get_events(self, bucket_name):
@@ -33,72 +42,38 @@ class InteractionEventPoller:
 
     def _pull_interaction_events_from_logs(self, bucket_name) -> list[InteractionEvent]:
         events = []
-        today = pandas.Timestamp.today()
-
-        for date in self.date_range:
-            if date > today:
-                print("No logs exist past today's date: ", today.strftime("%b %d, %Y"))
-                break
 
-            formatted_date = date.strftime("%Y/%m/%d")
-            file_name = f"analytics/upress_reporting/log_files/{bucket_name}/{
-                formatted_date
-            }/aggregated_log"
+        for log_entry in read_logs_in_period(
+            date_range=self.date_range,
+            s3_bucket=bucket_name,
+            s3_path=self.log_path,
+            file_id_regex=self.file_id_regex,
+            referrer_url=str(self.referrer_url),
+        ):
+            interaction_event = self._match_log_info_with_drb_data(log_entry)
 
-            if not os.path.isfile(file_name):
-                print(
-                    f"There are no logs for {
-                        formatted_date
-                    }. Attempting to access logs beyond this date..."
-                )
-                continue
-
-            events_per_day = self._parse_aggregated_log_file(file_name)
-            events.extend(events_per_day)
+            if interaction_event:
+                events.append(interaction_event)
 
         return events
 
-    def _parse_aggregated_log_file(self, file_name):
-        interactions_in_batch = []
-
-        with open(file_name, "r") as aggregated_log_file:
-            for line in aggregated_log_file:
-                interaction_event = self._match_log_info_with_drb_data(line)
-
-                if interaction_event:
-                    interactions_in_batch.append(interaction_event)
-
-        return interactions_in_batch
-
-    def _match_log_info_with_drb_data(self, log_object) -> InteractionEvent | None:
-        match_request = re.search(REQUEST_REGEX, log_object)
-        match_referrer = re.search(str(self.referrer_url), log_object)
-
-        if not match_request or not match_referrer or "403 AccessDenied" in log_object:
-            return None
-
-        match_file_id = re.search(self.file_id_regex, log_object)
-        match_time = re.search(TIMESTAMP_REGEX, log_object)
-        match_ip = re.search(IP_REGEX, log_object)
-
+    def _match_log_info_with_drb_data(
+        self, log_entry: LogEntry
+    ) -> InteractionEvent | None:
         if self.interaction_type == InteractionType.VIEW:
-            file_name = match_file_id.group(1).split("/", 1)[1]
+            file_name = log_entry.file_id.split("/", 1)[1]
         else:
-            file_name = match_file_id.group(1).strip().split('"')[0]
+            file_name = log_entry.file_id.strip().split('"')[0]
 
-        drb_data_match = self.reporting_data.loc[
-            self.reporting_data.index.str.contains(file_name)
-        ]
+        match_position = self._find_reporting_position(file_name)
 
-        if drb_data_match.empty:
+        if match_position is None:
             return None
 
-        match_data = drb_data_match.iloc[0].to_dict()
-        match_idx = drb_data_match.index[0]
-        self.reporting_data.at[match_idx, "accessed"] = True
+        match_data = self.reporting_records[match_position]
 
         return InteractionEvent(
-            country=self._map_ip_to_country(match_ip.group()),
+            country=self._map_ip_to_country(log_entry.ip),
             title=match_data["title"],
             book_id=match_data["book_id"],
             authors=match_data["authors"],
@@ -107,13 +82,41 @@ class InteractionEventPoller:
             publication_year=match_data["publication_year"],
             disciplines=match_data["disciplines"],
             usage_type=match_data["usage_type"],
-            timestamp=match_time[0],
+            timestamp=log_entry.timestamp,
         )
 
+    def _build_file_index(self) -> dict[str, int]:
+        """Maps every path suffix of the reporting data's file URLs to the position of
+        the first row containing it, so a log's file name resolves with one lookup."""
+        file_index = {}
+
+        for position, search_col in enumerate(self.search_cols):
+            for url in search_col.split(","):
+                url_parts = url.split("/")
+
+                for start in range(len(url_parts)):
+                    file_index.setdefault("/".join(url_parts[start:]), position)
+
+        return file_index
+
+    def _find_reporting_position(self, file_name) -> int | None:
+        if file_name not in self.file_index:
+            # File names that are not a path suffix fall back to a substring scan,
+            # which is memoized so each distinct file name is scanned at most once
+            self.file_index[file_name] = next(
+                (
+                    position
+                    for position, search_col in enumerate(self.search_cols)
+                    if file_name in search_col
+                ),
+                None,
+            )
+
+        return self.file_index[file_name]
+
     def _map_ip_to_country(self, ip) -> str | None:
-        if re.match(IP_REGEX, ip):
-            geocoded_ip = geocoder.ip(ip)
-            return geocoded_ip.country
+        if ip and re.match(IP_REGEX, ip):
+            return self.country_resolver.resolve(ip)
         return None
 
     def _redact_s3_path(self, path):